@@ -0,0 +1,111 @@
+"""
+Realistic api response pages for the benchmarks.
+"""
+
+import random
+
+COUNTRIES = ["US", "GB", "DE", "FR", "BR", "JP", "ID", "MX", "CA", "AU"]
+SOURCES = ["For You", "Follow", "Hashtag", "Sound", "Personal Profile", "Search"]
+
+
+def business_video(i: int, rnd: random.Random) -> dict:
+    return {
+        "item_id": str(7109065174526479622 + i),
+        "create_time": str(1655128100 + i * 60),
+        "thumbnail_url": f"https://p16-sign-va.tiktokcdn.com/obj/thumb-{i}.jpeg?x-expires=1656828000",
+        "share_url": f"https://www.tiktok.com/@user/video/{7109065174526479622 + i}",
+        "embed_url": f"https://www.tiktok.com/embed/{7109065174526479622 + i}",
+        "caption": f"Video caption number {i} #fyp #tiktok",
+        "video_views": rnd.randint(100, 1_000_000),
+        "video_duration": round(rnd.uniform(5, 180), 2),
+        "likes": rnd.randint(0, 100_000),
+        "comments": rnd.randint(0, 10_000),
+        "shares": rnd.randint(0, 10_000),
+        "reach": rnd.randint(100, 1_000_000),
+        "full_video_watched_rate": round(rnd.random(), 4),
+        "total_time_watched": round(rnd.uniform(100, 100_000), 2),
+        "average_time_watched": round(rnd.uniform(1, 60), 2),
+        "impression_sources": [
+            {"impression_source": s, "percentage": round(rnd.random(), 4)}
+            for s in SOURCES
+        ],
+        "audience_countries": [
+            {"country": c, "percentage": round(rnd.random(), 4)} for c in COUNTRIES
+        ],
+    }
+
+
+def business_videos_page(count: int = 20, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    return {
+        "code": 0,
+        "message": "OK",
+        "request_id": "2022070107152301000200300500600300009C51712",
+        "data": {
+            "videos": [business_video(i, rnd) for i in range(count)],
+            "cursor": 1655118106000,
+            "has_more": True,
+        },
+    }
+
+
+def business_comment(i: int, rnd: random.Random) -> dict:
+    return {
+        "comment_id": str(7115323427445417734 + i),
+        "video_id": "7109065174526479622",
+        "unique_identifier": f"user_{i}",
+        "create_time": 1656658618 - i * 30,
+        "text": f"Comment text number {i}, nice video!",
+        "likes": rnd.randint(0, 1000),
+        "replies": rnd.randint(0, 10),
+        "owner": False,
+        "liked": rnd.random() > 0.5,
+        "pinned": False,
+        "status": "PUBLIC",
+        "username": f"user_{i}",
+        "profile_image": f"https://p16-sign-sg.tiktokcdn.com/obj/avatar-{i}.jpeg",
+        "parent_comment_id": "7109065174526479622",
+    }
+
+
+def business_comments_page(count: int = 30, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    return {
+        "code": 0,
+        "message": "OK",
+        "request_id": "202207010727260102450710560650F5E3",
+        "data": {
+            "comments": [business_comment(i, rnd) for i in range(count)],
+            "cursor": count,
+            "has_more": True,
+        },
+    }
+
+
+def kit_videos_page(count: int = 20, seed: int = 0) -> dict:
+    rnd = random.Random(seed)
+    return {
+        "data": {
+            "videos": [
+                {
+                    "id": str(6963640889373723909 + i),
+                    "create_time": 1621332306 - i * 60,
+                    "cover_image_url": f"https://p16-sign.tiktokcdn-us.com/cover-{i}.image",
+                    "share_url": f"https://www.tiktok.com/@user/video/{6963640889373723909 + i}",
+                    "video_description": f"Description {i}",
+                    "duration": rnd.randint(5, 180),
+                    "height": 1024,
+                    "width": 576,
+                    "title": f"Title {i}",
+                    "like_count": rnd.randint(0, 10000),
+                    "comment_count": rnd.randint(0, 1000),
+                    "share_count": rnd.randint(0, 1000),
+                    "view_count": rnd.randint(0, 1000000),
+                }
+                for i in range(count)
+            ],
+            "cursor": 1621332306000,
+            "has_more": True,
+        },
+        "error": {"code": 0, "message": "", "log_id": "20220701071524010004003"},
+    }
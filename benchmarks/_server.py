@@ -0,0 +1,98 @@
+"""
+Local http server for the benchmarks.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are two writes, Nagle would hold the body for the delayed ACK.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        # drain the body in chunks, the upload benchmarks send large bodies.
+        while length > 0:
+            length -= len(self.rfile.read(min(length, 1 << 20)))
+        path = self.path.split("?", 1)[0]
+        body = self.server.get_body(path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.requests += 1
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    Http/1.1 keep-alive server which answers every path with json, and counts
+    the accepted connections. Each new connection is what would be a TCP + TLS
+    handshake against the real api.
+
+    :param routes: Map of path suffix to json payload.
+    :param default: Payload for paths not in routes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, routes: Optional[Dict[str, dict]] = None, default=None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.routes = {k: json.dumps(v).encode() for k, v in (routes or {}).items()}
+        self.default = json.dumps(
+            default if default is not None else {"code": 0, "message": "OK", "data": {}}
+        ).encode()
+        self._thread: Optional[threading.Thread] = None
+
+    def get_body(self, path: str) -> bytes:
+        for suffix, body in self.routes.items():
+            if path.endswith(suffix):
+                return body
+        return self.default
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self) -> "LocalServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def timed(func: Callable[[], None]) -> float:
+    """
+    Run func and return the seconds used.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
@@ -0,0 +1,68 @@
+"""
+Benchmark for the columnar video metrics against the models.
+
+Turn many pages of videos into metric columns, by the models and a loop over them,
+or by ``VideoColumns`` from the raw page data, and count the time and the peak memory.
+
+Run: python benchmarks/bench_columns.py
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytiktok.models as mds  # noqa: E402
+from pytiktok.columns import DEFAULT_VIDEO_COLUMNS, VideoColumns  # noqa: E402
+
+from _pages import business_videos_page  # noqa: E402
+
+PAGES = 500
+
+
+def by_models(pages):
+    columns = {name: [] for name in DEFAULT_VIDEO_COLUMNS}
+    for page in pages:
+        for video in mds.BusinessVideosResponse.new_from_json_dict(page).data.videos:
+            for name, values in columns.items():
+                values.append(getattr(video, name))
+    return columns
+
+
+def by_columns(pages):
+    columns = VideoColumns()
+    for page in pages:
+        columns.add_page(page)
+    return columns
+
+
+def measure(func, pages):
+    func(pages[:1])
+    gc.collect()
+    start = time.perf_counter()
+    func(pages)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = func(pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main():
+    pages = [business_videos_page(seed=i) for i in range(PAGES)]
+    print(f"{PAGES * 20} videos in {PAGES} pages, columns: {DEFAULT_VIDEO_COLUMNS}")
+    print(f"{'method':<16}{'seconds':>10}{'peak MiB':>10}")
+    for name, func in (("models", by_models), ("VideoColumns", by_columns)):
+        elapsed, peak = measure(func, pages)
+        print(f"{name:<16}{elapsed:>10.3f}{peak / 2 ** 20:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
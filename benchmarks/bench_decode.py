@@ -0,0 +1,67 @@
+"""
+Benchmark for the generated model decoders against dataclasses-json from_dict.
+
+Run: python benchmarks/bench_decode.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytiktok.models as mds  # noqa: E402
+from pytiktok.models.decoder import get_decoder  # noqa: E402
+
+from _pages import (  # noqa: E402
+    business_comments_page,
+    business_videos_page,
+    kit_videos_page,
+)
+
+CASES = [
+    ("BusinessVideosResponse x20", mds.BusinessVideosResponse, business_videos_page()),
+    (
+        "BusinessCommentsResponse x30",
+        mds.BusinessCommentsResponse,
+        business_comments_page(),
+    ),
+    ("KitVideosResponse x20", mds.KitVideosResponse, kit_videos_page()),
+]
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'page':<32}{'from_dict ms':>14}{'fast ms':>10}{'speedup':>9}")
+    for name, model, page in CASES:
+        decoder = get_decoder(model)
+        assert decoder(page) == model.from_dict(page)
+        slow = bench(lambda: model.from_dict(page), 50)
+        fast = bench(lambda: decoder(page), 500)
+        print(f"{name:<32}{slow * 1000:>14.3f}{fast * 1000:>10.3f}{slow / fast:>8.1f}x")
+
+    # Most consumers only read some fields of each video.
+    page = business_videos_page()
+
+    def read(lazy):
+        resp = mds.BusinessVideosResponse.new_from_json_dict(page, lazy=lazy)
+        return resp, [(v.item_id, v.video_views) for v in resp.data.videos]
+
+    print()
+    print(f"{'read item_id, video_views x20':<32}{'ms':>10}{'KiB kept':>10}")
+    for name, lazy in [("eager", False), ("lazy", True)]:
+        read(lazy)
+        cost = bench(lambda: read(lazy), 500)
+        tracemalloc.start()
+        result = read(lazy)  # noqa: F841
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{name:<32}{cost * 1000:>10.3f}{size / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark for the json codecs, decoding realistic response pages and encoding request bodies.
+
+Install orjson and ujson to compare them: pip install orjson ujson
+
+Run: python benchmarks/bench_json.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pytiktok.codec import CODECS  # noqa: E402
+
+from _pages import (  # noqa: E402
+    business_comments_page,
+    business_videos_page,
+    kit_videos_page,
+)
+
+PAGES = [
+    ("business videos x20", business_videos_page()),
+    ("business comments x30", business_comments_page()),
+    ("kit videos x20", kit_videos_page()),
+]
+BODY = {
+    "business_id": "-000kLbc2iQlY_6a0Vd9gJcbZLiaN4fAL7ZI",
+    "video_id": "7109065174526479622",
+    "comment_ids": [str(7115323427445417734 + i) for i in range(30)],
+    "fields": ["item_id", "create_time", "caption", "video_views", "likes"],
+}
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    names = sorted(CODECS, key=lambda name: name != "json")
+    header = "".join(f"{name + ' us':>12}" for name in names)
+    print(f"{'loads':<24}{header}")
+    for title, page in PAGES:
+        content = json.dumps(page).encode("utf-8")
+        cost = [bench(lambda: CODECS[name].loads(content), 1000) for name in names]
+        print(f"{title:<24}" + "".join(f"{c * 1e6:>12.1f}" for c in cost))
+
+    print(f"{'dumps':<24}{header}")
+    cost = [bench(lambda: CODECS[name].dumps(BODY), 10000) for name in names]
+    print(f"{'comment body':<24}" + "".join(f"{c * 1e6:>12.2f}" for c in cost))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark for the memory of the models against their compact versions.
+
+Decode many pages, and keep the records as a moderation sweep does,
+then count the bytes allocated for each record, including its nested models.
+
+Run: python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytiktok.models as mds  # noqa: E402
+
+from _pages import (  # noqa: E402
+    business_comments_page,
+    business_videos_page,
+    kit_videos_page,
+)
+
+PAGES = 200
+
+CASES = [
+    (
+        "BusinessVideo",
+        mds.BusinessVideosData,
+        "videos",
+        lambda i: business_videos_page(seed=i),
+    ),
+    (
+        "BusinessComment",
+        mds.BusinessCommentsData,
+        "comments",
+        lambda i: business_comments_page(seed=i),
+    ),
+    ("KitVideo", mds.KitVideosData, "videos", lambda i: kit_videos_page(seed=i)),
+]
+
+
+def measure(model, key, pages, compact):
+    """
+    :return: bytes per record
+    """
+    # generate the decoders and compact classes before measuring.
+    model.new_from_json_dict(pages[0]["data"], compact=compact)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = []
+    for page in pages:
+        records.extend(
+            getattr(model.new_from_json_dict(page["data"], compact=compact), key)
+        )
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(records)
+
+
+def main():
+    print(f"{'record':<20}{'records':>9}{'model B':>10}{'compact B':>11}{'saved':>8}")
+    for name, model, key, make_page in CASES:
+        pages = [make_page(i) for i in range(PAGES)]
+        count = sum(len(page["data"][key]) for page in pages)
+        normal = measure(model, key, pages, compact=False)
+        compact = measure(model, key, pages, compact=True)
+        saved = 1 - compact / normal
+        print(f"{name:<20}{count:>9}{normal:>10.0f}{compact:>11.0f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark for sharing the connection pool between api instances.
+
+Many tenants each with its own access token call the api from a thread pool.
+Compare new connections (TCP + TLS handshakes against the real api) between:
+
+- one default session per api instance.
+- one shared session with a pool big enough for the threads.
+
+Run: python benchmarks/bench_session_pool.py
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pytiktok import BusinessAccountApi  # noqa: E402
+from pytiktok.session import build_session  # noqa: E402
+
+from _server import LocalServer, timed  # noqa: E402
+
+TENANTS = 200
+CALLS_PER_TENANT = 5
+THREADS = 32
+
+
+def run(server, make_api):
+    apis = [make_api(f"token-{i}") for i in range(TENANTS)]
+
+    def work(api):
+        for _ in range(CALLS_PER_TENANT):
+            api.get_account_data(business_id="business_id")
+
+    server.reset()
+    with ThreadPoolExecutor(THREADS) as executor:
+        elapsed = timed(lambda: list(executor.map(work, apis)))
+    return server.connections, server.requests, elapsed
+
+
+def main():
+    with LocalServer() as server:
+        base_url = f"{server.url}/open_api"
+        shared_small = build_session()
+        shared = build_session(pool_maxsize=THREADS)
+        cases = [
+            (
+                "session per instance",
+                lambda token: BusinessAccountApi(access_token=token, base_url=base_url),
+            ),
+            (
+                "shared session, pool_maxsize=10",
+                lambda token: BusinessAccountApi(
+                    access_token=token, base_url=base_url, session=shared_small
+                ),
+            ),
+            (
+                f"shared session, pool_maxsize={THREADS}",
+                lambda token: BusinessAccountApi(
+                    access_token=token, base_url=base_url, session=shared
+                ),
+            ),
+        ]
+        print(f"{TENANTS} tenants x {CALLS_PER_TENANT} calls, {THREADS} threads")
+        print(f"{'case':<36}{'requests':>10}{'handshakes':>12}{'seconds':>10}")
+        for name, make_api in cases:
+            connections, requests, elapsed = run(server, make_api)
+            print(f"{name:<36}{requests:>10}{connections:>12}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
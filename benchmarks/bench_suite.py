@@ -0,0 +1,252 @@
+"""
+Benchmark suite for the main api methods against a local stand-in for TikTok.
+
+For each method, measure:
+
+- requests/sec and p50/p99 latency for the sequential calls.
+- requests/sec for the concurrent calls from a thread pool.
+- time to decode the json data into the model.
+- bytes allocated at peak for a call.
+
+The results are saved as json, and can be compared with the results of an earlier release:
+
+Run: python benchmarks/bench_suite.py [--quick] [--out results.json] [--compare old.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytiktok  # noqa: E402
+import pytiktok.models as mds  # noqa: E402
+from pytiktok import BusinessAccountApi, KitApi  # noqa: E402
+from pytiktok.session import build_session  # noqa: E402
+
+from _pages import (  # noqa: E402
+    business_comments_page,
+    business_videos_page,
+    kit_videos_page,
+)
+from _server import LocalServer  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+THREADS = 8
+# lower is better for all the metrics except requests/sec.
+HIGHER_IS_BETTER = {"rps", "concurrent_rps"}
+
+
+def routes() -> dict:
+    # the business paths first, as the server matches the path suffix in order.
+    return {
+        "/business/video/list/": business_videos_page(count=20),
+        "/business/comment/list/": business_comments_page(count=30),
+        "/business/video/publish/": {
+            "code": 0,
+            "message": "OK",
+            "data": {"share_id": "v_pub_url~v2.123"},
+        },
+        "/business/publish/status/": {
+            "code": 0,
+            "message": "OK",
+            "data": {"status": "PUBLISH_COMPLETE", "post_ids": ["7106753891953347842"]},
+        },
+        "/video/query/": kit_videos_page(count=20),
+        "/video/list/": kit_videos_page(count=20),
+    }
+
+
+def cases(business: BusinessAccountApi, kit: KitApi, pages: dict) -> list:
+    """
+    :return: List of (name, call, model, payload) for the methods.
+    """
+
+    def publish():
+        resp = business.create_video("bid", "https://example.com/v.mp4", post_info={})
+        return business.get_publish_status("bid", resp.data.share_id)
+
+    return [
+        (
+            "get_account_videos",
+            lambda: business.get_account_videos(business_id="bid"),
+            mds.BusinessVideosResponse,
+            pages["/business/video/list/"],
+        ),
+        (
+            "get_video_comments",
+            lambda: business.get_video_comments(business_id="bid", video_id="vid"),
+            mds.BusinessCommentsResponse,
+            pages["/business/comment/list/"],
+        ),
+        (
+            "query_videos",
+            lambda: kit.query_videos(
+                open_id="open_id", filters={"video_ids": ["6963640889373723909"]}
+            ),
+            mds.KitVideosResponse,
+            pages["/video/query/"],
+        ),
+        (
+            "get_user_videos",
+            lambda: kit.get_user_videos(open_id="open_id"),
+            mds.KitVideosResponse,
+            pages["/video/list/"],
+        ),
+        (
+            "publish (create + status)",
+            publish,
+            mds.BusinessPublishStatusResponse,
+            pages["/business/publish/status/"],
+        ),
+    ]
+
+
+def percentile(values: list, pct: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def measure(call, model, payload, calls: int) -> dict:
+    for _ in range(min(20, calls)):
+        call()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        t = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: call(), range(calls)))
+        concurrent_elapsed = time.perf_counter() - start
+
+    # best of some rounds, the decode is short and noisy.
+    decodes = max(calls, 500)
+    rounds = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(decodes):
+            model.new_from_json_dict(payload)
+        rounds.append((time.perf_counter() - start) / decodes)
+    decode = min(rounds)
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(min(calls, 50)):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        call()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    return {
+        "rps": calls / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "concurrent_rps": calls / concurrent_elapsed,
+        "decode_us": decode * 1e6,
+        "alloc_kib": statistics.mean(peaks) / 1024,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: dict, old: dict, threshold: float) -> None:
+    print(
+        f"\ncompare with {old['version']} ({old.get('commit')}), regression > {threshold:.0%}:"
+    )
+    for name, metrics in results["cases"].items():
+        old_metrics = old["cases"].get(name)
+        if old_metrics is None:
+            continue
+        for key, value in metrics.items():
+            base = old_metrics.get(key)
+            if not base:
+                continue
+            change = value / base - 1
+            worse = -change if key in HIGHER_IS_BETTER else change
+            flag = "  REGRESSION" if worse > threshold else ""
+            print(
+                f"  {name:<28}{key:<16}{base:>10.2f} -> {value:>10.2f} {change:>+7.1%}{flag}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="fewer calls")
+    parser.add_argument("--out", help="path for the results json")
+    parser.add_argument("--compare", help="results json of an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+    calls = 100 if args.quick else 1000
+
+    pages = routes()
+    results = {
+        "version": pytiktok.__version__,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "calls": calls,
+        "cases": {},
+    }
+    with LocalServer(routes=pages) as server:
+        session = build_session(pool_maxsize=THREADS)
+        business = BusinessAccountApi(
+            access_token="token", base_url=f"{server.url}/open_api", session=session
+        )
+        kit = KitApi(access_token="token", base_url=server.url, session=session)
+
+        print(
+            f"{'method':<28}{'req/s':>8}{'p50 ms':>8}{'p99 ms':>8}"
+            f"{'conc req/s':>12}{'decode us':>11}{'alloc KiB':>11}"
+        )
+        for name, call, model, payload in cases(business, kit, pages):
+            m = measure(call, model, payload, calls)
+            results["cases"][name] = m
+            print(
+                f"{name:<28}{m['rps']:>8.0f}{m['p50_ms']:>8.2f}{m['p99_ms']:>8.2f}"
+                f"{m['concurrent_rps']:>12.0f}{m['decode_us']:>11.1f}{m['alloc_kib']:>11.1f}"
+            )
+
+    out = args.out
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        out = os.path.join(RESULTS_DIR, f"suite-{results['version']}-{stamp}.json")
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nsaved: {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f), args.threshold)
+
+
+if __name__ == "__main__":
+    main()
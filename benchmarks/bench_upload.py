@@ -0,0 +1,91 @@
+"""
+Benchmark for the peak memory of share_video, for the multipart upload by requests
+against the streaming upload.
+
+Each upload runs in a new process, so its peak RSS is not hidden by the earlier ones.
+
+Run: python benchmarks/bench_upload.py [size in MB, default 500]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pytiktok import KitApi  # noqa: E402
+
+from _server import LocalServer  # noqa: E402
+
+MODES = {
+    "files": {},
+    "stream": {"stream": True},
+    "stream no mmap": {"stream": True, "use_mmap": False},
+}
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def upload(url: str, path: str, mode: str) -> None:
+    """
+    Upload in the child process, and print the peak RSS before and after.
+    """
+    kwargs = dict(MODES[mode])
+    api = KitApi(access_token="token", base_url=url)
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        if not kwargs.pop("use_mmap", True):
+            # a file object without fileno, so it is read by read().
+            f = _NoFileno(f)
+        api.share_video(open_id="open_id", video=f, return_json=True, **kwargs)
+    print(before, peak_rss_mb(), time.perf_counter() - start)
+
+
+class _NoFileno:
+    def __init__(self, file):
+        self._file = file
+        self.name = file.name
+
+    def __getattr__(self, name):
+        if name == "fileno":
+            raise AttributeError(name)
+        return getattr(self._file, name)
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
+        chunk = os.urandom(1 << 20)
+        for _ in range(size_mb):
+            f.write(chunk)
+        f.flush()
+
+        print(f"video: {size_mb} MB")
+        print(f"{'mode':<16}{'base MB':>9}{'peak MB':>9}{'growth MB':>11}{'secs':>7}")
+        with LocalServer(routes={"/share/video/upload/": {"data": {}}}) as server:
+            for mode in MODES:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", server.url, f.name, mode],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                before, peak, secs = map(float, out.split())
+                print(
+                    f"{mode:<16}{before:>9.0f}{peak:>9.0f}{peak - before:>11.0f}{secs:>7.2f}"
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        upload(*sys.argv[2:5])
+    else:
+        main()
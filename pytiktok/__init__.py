@@ -2,4 +2,6 @@ __version__ = "0.1.11"
 
 from pytiktok.business_account_api import BusinessAccountApi
 from pytiktok.kit_api import KitApi
+from pytiktok.async_business_account_api import AsyncBusinessAccountApi
+from pytiktok.async_kit_api import AsyncKitApi
 from pytiktok.error import PyTiktokError
@@ -0,0 +1,871 @@
+"""
+Asyncio api impl for business account.
+"""
+
+from typing import Optional, List, Union, AsyncIterator
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+import pytiktok.models as mds
+from pytiktok.coalesce import AsyncRequestCoalescer, make_request_key
+from pytiktok.codec import JsonCodec, get_codec
+from pytiktok.business_account_api import BusinessAccountApi
+from pytiktok.error import PyTiktokError
+from pytiktok.hooks import RequestHooks
+from pytiktok.pagination import aiter_cursor_items
+
+
+def _build_async_client(
+    timeout: Optional[int] = None,
+    proxies: Optional[dict] = None,
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+) -> "httpx.AsyncClient":
+    """
+    Build a pooled async http client.
+    :param timeout: Timeout for each request, None means no timeout.
+    :param proxies: Proxies in requests style, like {"https": "http://proxy:8080"}.
+    :param max_connections: Max connections in the pool.
+    :param max_keepalive_connections: Max idle keep-alive connections in the pool.
+    :return: Async client
+    """
+    if httpx is None:
+        raise ImportError(
+            "Async api need httpx, install it by: pip install python-tiktok[async]"
+        )
+    mounts = None
+    if proxies:
+        mounts = {
+            # httpx before 0.26 only takes a Proxy instance, not the url.
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=httpx.Proxy(proxy))
+            for scheme, proxy in proxies.items()
+        }
+    return httpx.AsyncClient(
+        timeout=timeout,
+        mounts=mounts,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
+
+
+class AsyncBusinessAccountApi:
+    """
+    Asyncio version of :class:`BusinessAccountApi`.
+
+    All api methods are coroutines which share one pooled ``httpx.AsyncClient``,
+    so many concurrent calls can run on one event loop.
+
+    >>> async with AsyncBusinessAccountApi(access_token="token") as api:
+    ...     videos = await api.get_account_videos(business_id="business_id")
+    """
+
+    BASE_URL = BusinessAccountApi.BASE_URL
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+        base_url: Optional[str] = None,
+        api_version: Optional[str] = "v1.3",
+        oauth_redirect_uri: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        json_codec: Union[str, JsonCodec, None] = None,
+        coalescer: Optional[AsyncRequestCoalescer] = None,
+        hooks: Optional[RequestHooks] = None,
+    ) -> None:
+        self.app_id = app_id
+        self.app_secret = app_secret
+        self.access_token = access_token
+        self.timeout = timeout
+        self.proxies = proxies
+        self.api_version = api_version
+        if client is None:
+            client = _build_async_client(
+                timeout=timeout,
+                proxies=proxies,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        self.client = client
+
+        # json codec for responses and request bodies, None means the default codec.
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+
+        # share one request for the identical GET requests in flight, opt-in.
+        self.coalescer = coalescer
+
+        # lifecycle hooks for the requests, for the metrics or tracing.
+        self.hooks = hooks
+
+        # base url prefix
+        self.base_url = base_url or self.BASE_URL
+
+        # oauth redirect uri
+        # Must be the same as the TikTok account holder redirect URL set in the app.
+        self.oauth_redirect_uri = oauth_redirect_uri
+
+    async def __aenter__(self) -> "AsyncBusinessAccountApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the connections in the pool.
+        """
+        await self.client.aclose()
+
+    _format_fields = BusinessAccountApi._format_fields
+
+    async def generate_access_token(
+        self, code: str, redirect_uri: Optional[str] = None, return_json: bool = False
+    ) -> Union[mds.BusinessAccessToken, dict]:
+        """
+        Generate access token by the auth code. See :meth:`BusinessAccountApi.generate_access_token`.
+        """
+        redirect_uri = redirect_uri or self.oauth_redirect_uri
+
+        if not self.app_id or not self.app_secret or not redirect_uri:
+            raise PyTiktokError(f"Need app id, app secret and redirect_uri.")
+
+        resp = await self._request(
+            verb="POST",
+            path="tt_user/oauth2/token/",
+            json={
+                "client_id": self.app_id,
+                "client_secret": self.app_secret,
+                "grant_type": "authorization_code",
+                "auth_code": code,
+                "redirect_uri": redirect_uri,
+            },
+            enforce_auth=False,
+        )
+
+        data = self.parse_response(response=resp, codec=self.json_codec)
+        data = data["data"]
+        self.access_token = data["access_token"]
+        return data if return_json else mds.BusinessAccessToken.new_from_json_dict(data)
+
+    async def refresh_access_token(
+        self, refresh_token: str, return_json: bool = False
+    ) -> Union[mds.BusinessAccessToken, dict]:
+        """
+        Renew an access token by refresh_token. See :meth:`BusinessAccountApi.refresh_access_token`.
+        """
+        if not self.app_id or not self.app_secret:
+            raise PyTiktokError(f"Need app id and app secret.")
+        resp = await self._request(
+            verb="POST",
+            path="tt_user/oauth2/refresh_token/",
+            json={
+                "client_id": self.app_id,
+                "client_secret": self.app_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            },
+            enforce_auth=False,
+        )
+
+        data = self.parse_response(response=resp, codec=self.json_codec)
+        data = data["data"]
+        self.access_token = data["access_token"]
+        return data if return_json else mds.BusinessAccessToken.new_from_json_dict(data)
+
+    async def revoke_access_token(
+        self, access_token: str, return_json: bool = False
+    ) -> dict:
+        """
+        Revoke an access token. See :meth:`BusinessAccountApi.revoke_access_token`.
+        """
+        if not self.app_id or not self.app_secret:
+            raise PyTiktokError(f"Need app id and app secret.")
+        resp = await self._request(
+            verb="POST",
+            path="tt_user/oauth2/revoke/",
+            json={
+                "client_id": self.app_id,
+                "client_secret": self.app_secret,
+                "access_token": access_token,
+            },
+            enforce_auth=False,
+        )
+
+        data = self.parse_response(response=resp, codec=self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessAccessTokenRevokeResponse.new_from_json_dict(data)
+        )
+
+    async def get_token_info(
+        self, access_token: str, app_id: Optional[str] = None, return_json: bool = False
+    ) -> Union[mds.BusinessAccessTokenInfo, dict]:
+        """
+        Get the permission scopes of an access token. See :meth:`BusinessAccountApi.get_token_info`.
+        """
+        app_id = app_id or self.app_id
+        if not app_id:
+            raise PyTiktokError(f"Need app id.")
+
+        resp = await self._request(
+            verb="POST",
+            path="tt_user/token_info/get/",
+            json={
+                "app_id": app_id,
+                "access_token": access_token,
+            },
+            enforce_auth=False,
+        )
+
+        data = self.parse_response(response=resp, codec=self.json_codec)
+        data = data["data"]
+        return (
+            data
+            if return_json
+            else mds.BusinessAccessTokenInfo.new_from_json_dict(data)
+        )
+
+    async def _request(
+        self,
+        path: str,
+        verb: str = "GET",
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        enforce_auth: bool = True,
+    ) -> "httpx.Response":
+        """
+        Request for TikTok api url
+        :param path: The api location for TikTok
+        :param verb: HTTP Method, like GET,POST,PUT.
+        :param params: The url params to send in the body of the request.
+        :param data: The form data to send in the body of the request.
+        :param json: The json data to send in the body of the request.
+        :param enforce_auth: Does the request require authentication.
+        :return: A response object
+        """
+        access_token = None
+        if enforce_auth:
+            if not self.access_token:
+                raise PyTiktokError("The request must be authenticated.")
+            access_token = self.access_token
+
+        api_path = path
+        if not path.startswith("http"):
+            path = f"{self.base_url}/{self.api_version}/{path}"
+
+        # same as the sync api, the given json and params are not changed.
+        headers, params, content = self._prepare_request(
+            access_token, None, params, json
+        )
+
+        async def fetch() -> "httpx.Response":
+            event = None
+            if self.hooks is not None:
+                event = self.hooks.start(verb, api_path, path, content)
+            try:
+                resp = await self.client.request(
+                    url=path,
+                    method=verb,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    content=content,
+                )
+            except Exception as e:
+                if event is not None:
+                    self.hooks.error(event, e)
+                raise
+            if event is not None:
+                self.hooks.response(event, resp, codec=self.json_codec)
+            return resp
+
+        if self.coalescer is not None:
+            key = make_request_key(
+                verb, path, params, self.access_token if enforce_auth else None
+            )
+            if key is not None:
+                # identical requests in flight share one response.
+                return await self.coalescer.run(key, fetch)
+        return await fetch()
+
+    _authorize = BusinessAccountApi._authorize
+    _prepare_request = BusinessAccountApi._prepare_request
+    parse_response = staticmethod(BusinessAccountApi.parse_response)
+
+    async def get_account_data(
+        self,
+        business_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        fields: Optional[list] = None,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessAccountResponse, dict]:
+        """
+        Get business account data. See :meth:`BusinessAccountApi.get_account_data`.
+        """
+        params = {"business_id": business_id}
+        if start_date is not None:
+            params["start_date"] = start_date
+        if end_date is not None:
+            params["end_date"] = end_date
+        if fields is not None:
+            params["fields"] = self._format_fields(fields)
+
+        resp = await self._request(path="business/get/", params=params)
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessAccountResponse.new_from_json_dict(data)
+        )
+
+    async def get_account_videos(
+        self,
+        business_id: str,
+        fields: Optional[list] = None,
+        filters: Optional[dict] = None,
+        cursor: Optional[int] = None,
+        max_count: Optional[int] = None,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessVideosResponse, dict]:
+        """
+        Get business account's videos. See :meth:`BusinessAccountApi.get_account_videos`.
+        """
+        params = {"business_id": business_id}
+        if fields is not None:
+            params["fields"] = self._format_fields(fields)
+        if filters is not None:
+            params["filters"] = self._format_fields(filters)
+        if cursor is not None:
+            params["cursor"] = cursor
+        if max_count is not None:
+            params["max_count"] = max_count
+        resp = await self._request(
+            path="business/video/list/",
+            params=params,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessVideosResponse.new_from_json_dict(data)
+        )
+
+    def iter_account_videos(
+        self,
+        business_id: str,
+        fields: Optional[list] = None,
+        filters: Optional[dict] = None,
+        max_count: int = 20,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[mds.BusinessVideo]:
+        """
+        Iterate over all videos of a business account. See :meth:`BusinessAccountApi.iter_account_videos`.
+        """
+        return aiter_cursor_items(
+            fetch_page=lambda cursor: self.get_account_videos(
+                business_id=business_id,
+                fields=fields,
+                filters=filters,
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            items_key="videos",
+            model=mds.BusinessVideo,
+            limit=limit,
+        )
+
+    async def get_account_post_privacy(
+        self,
+        business_id: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessAccountPrivacySettingResponse, dict]:
+        """
+        Get the post privacy settings. See :meth:`BusinessAccountApi.get_account_post_privacy`.
+        """
+        params = {"business_id": business_id}
+        resp = await self._request(path="business/video/settings/", params=params)
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessAccountPrivacySettingResponse.new_from_json_dict(data)
+        )
+
+    async def create_video(
+        self,
+        business_id: str,
+        video_url: str,
+        post_info: dict,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessVideoPublishResponse, dict]:
+        """
+        Publish a public video. See :meth:`BusinessAccountApi.create_video`.
+        """
+        data = {
+            "business_id": business_id,
+            "video_url": video_url,
+            "post_info": post_info,
+        }
+
+        resp = await self._request(
+            verb="POST", path="business/video/publish/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessVideoPublishResponse.new_from_json_dict(data)
+        )
+
+    async def create_photo(
+        self,
+        business_id: str,
+        photo_images: List[str],
+        post_info: dict,
+        photo_cover_index: int = 0,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessPhotoPublishResponse, dict]:
+        """
+        Publish a photo post. See :meth:`BusinessAccountApi.create_photo`.
+        """
+        data = {
+            "business_id": business_id,
+            "photo_images": photo_images,
+            "photo_cover_index": photo_cover_index,
+            "post_info": post_info,
+        }
+        resp = await self._request(
+            verb="POST", path="business/photo/publish/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessPhotoPublishResponse.new_from_json_dict(data)
+        )
+
+    async def get_publish_status(
+        self,
+        business_id: str,
+        publish_id: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessPublishStatusResponse, dict]:
+        """
+        Get the publishing status of a post. See :meth:`BusinessAccountApi.get_publish_status`.
+        """
+        params = {"business_id": business_id, "publish_id": publish_id}
+        resp = await self._request(path="business/publish/status/", params=params)
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessPublishStatusResponse.new_from_json_dict(data)
+        )
+
+    async def get_video_comments(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_ids: Optional[List[str]] = None,
+        include_replies: Optional[bool] = None,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[int] = None,
+        max_count: Optional[int] = None,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessCommentsResponse, dict]:
+        """
+        Get comments for a video. See :meth:`BusinessAccountApi.get_video_comments`.
+        """
+        params = {"business_id": business_id, "video_id": video_id}
+        if comment_ids is not None:
+            params["comment_ids"] = self._format_fields(comment_ids)
+        if include_replies is not None:
+            params["include_replies"] = include_replies
+        if status is not None:
+            params["status"] = status
+        if sort_field is not None:
+            params["sort_field"] = sort_field
+        if sort_order is not None:
+            params["sort_order"] = sort_order
+        if cursor is not None:
+            params["cursor"] = cursor
+        if max_count is not None:
+            params["max_count"] = max_count
+
+        resp = await self._request(
+            verb="GET", path="business/comment/list/", params=params
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessCommentsResponse.new_from_json_dict(data)
+        )
+
+    def iter_video_comments(
+        self,
+        business_id: str,
+        video_id: str,
+        include_replies: Optional[bool] = None,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        max_count: int = 30,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[mds.BusinessComment]:
+        """
+        Iterate over all comments of a video. See :meth:`BusinessAccountApi.iter_video_comments`.
+        """
+        return aiter_cursor_items(
+            fetch_page=lambda cursor: self.get_video_comments(
+                business_id=business_id,
+                video_id=video_id,
+                include_replies=include_replies,
+                status=status,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            items_key="comments",
+            model=mds.BusinessComment,
+            limit=limit,
+        )
+
+    async def get_comment_replies(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[int] = None,
+        max_count: Optional[int] = None,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessCommentsResponse, dict]:
+        """
+        Get replies for a comment. See :meth:`BusinessAccountApi.get_comment_replies`.
+        """
+        params = {
+            "business_id": business_id,
+            "video_id": video_id,
+            "comment_id": comment_id,
+        }
+        if status is not None:
+            params["status"] = status
+        if sort_field is not None:
+            params["sort_field"] = sort_field
+        if sort_order is not None:
+            params["sort_order"] = sort_order
+        if cursor is not None:
+            params["cursor"] = cursor
+        if max_count is not None:
+            params["max_count"] = max_count
+
+        resp = await self._request(
+            verb="GET", path="business/comment/reply/list/", params=params
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessCommentsResponse.new_from_json_dict(data)
+        )
+
+    def iter_comment_replies(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        max_count: int = 30,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[mds.BusinessComment]:
+        """
+        Iterate over all replies of a comment. See :meth:`BusinessAccountApi.iter_comment_replies`.
+        """
+        return aiter_cursor_items(
+            fetch_page=lambda cursor: self.get_comment_replies(
+                business_id=business_id,
+                video_id=video_id,
+                comment_id=comment_id,
+                status=status,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            items_key="comments",
+            model=mds.BusinessComment,
+            limit=limit,
+        )
+
+    async def create_comment(
+        self, business_id: str, video_id: str, text: str, return_json: bool = False
+    ) -> Union[mds.BusinessCommentResponse, dict]:
+        """
+        Create a comment on a video. See :meth:`BusinessAccountApi.create_comment`.
+        """
+        data = {"business_id": business_id, "video_id": video_id, "text": text}
+
+        resp = await self._request(
+            verb="POST", path="business/comment/create/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessCommentResponse.new_from_json_dict(data)
+        )
+
+    async def create_reply(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        text: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessCommentResponse, dict]:
+        """
+        Create a reply to a comment. See :meth:`BusinessAccountApi.create_reply`.
+        """
+        data = {
+            "business_id": business_id,
+            "video_id": video_id,
+            "comment_id": comment_id,
+            "text": text,
+        }
+
+        resp = await self._request(
+            verb="POST", path="business/comment/reply/create/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessCommentResponse.new_from_json_dict(data)
+        )
+
+    async def like_comment(
+        self,
+        business_id: str,
+        comment_id: str,
+        action: str = "LIKE",
+        return_json: bool = False,
+    ) -> Union[mds.BusinessBaseResponse, dict]:
+        """
+        Like/unlike a comment. See :meth:`BusinessAccountApi.like_comment`.
+        """
+        data = {"business_id": business_id, "comment_id": comment_id, "action": action}
+        resp = await self._request(
+            verb="POST", path="business/comment/like/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
+        )
+
+    async def pin_comment(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        action: str = "PIN",
+        return_json: bool = False,
+    ) -> Union[mds.BusinessBaseResponse, dict]:
+        """
+        Pin/unpin a comment. See :meth:`BusinessAccountApi.pin_comment`.
+        """
+        data = {
+            "business_id": business_id,
+            "video_id": video_id,
+            "comment_id": comment_id,
+            "action": action,
+        }
+        resp = await self._request(verb="POST", path="business/comment/pin/", json=data)
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
+        )
+
+    async def hide_comment(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        action: str = "HIDE",
+        return_json: bool = False,
+    ) -> Union[mds.BusinessBaseResponse, dict]:
+        """
+        Hide/unhide a comment. See :meth:`BusinessAccountApi.hide_comment`.
+        """
+        data = {
+            "business_id": business_id,
+            "video_id": video_id,
+            "comment_id": comment_id,
+            "action": action,
+        }
+        resp = await self._request(
+            verb="POST", path="business/comment/hide/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
+        )
+
+    async def delete_comment(
+        self, business_id: str, comment_id: str, return_json: bool = False
+    ) -> Union[mds.BusinessBaseResponse, dict]:
+        """
+        Delete an owned comment. See :meth:`BusinessAccountApi.delete_comment`.
+        """
+        data = {"business_id": business_id, "comment_id": comment_id}
+        resp = await self._request(
+            verb="POST", path="business/comment/delete/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
+        )
+
+    async def get_hashtag_suggestions(
+        self,
+        business_id: str,
+        keyword: str,
+        language: str = "en",
+        return_json: bool = False,
+    ) -> Union[dict, mds.BusinessHashtagSuggestionResponse]:
+        """
+        Get recommended hashtags for a keyword. See :meth:`BusinessAccountApi.get_hashtag_suggestions`.
+        """
+        data = {
+            "business_id": business_id,
+            "keyword": keyword,
+            "language": language,
+        }
+        resp = await self._request(
+            verb="GET", path="business/hashtag/suggestion/", params=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessHashtagSuggestionResponse.new_from_json_dict(data)
+        )
+
+    async def add_url_property(
+        self,
+        app_id: str,
+        property_type: int,
+        url: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessUrlPropertyInfoResponse, dict]:
+        """
+        Add a URL property. See :meth:`BusinessAccountApi.add_url_property`.
+        """
+        data = {
+            "app_id": app_id,
+            "url_property_meta": {
+                "property_type": property_type,
+                "url": url,
+            },
+        }
+        resp = await self._request(
+            verb="POST", path="business/property/add/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessUrlPropertyInfoResponse.new_from_json_dict(data)
+        )
+
+    async def check_url_property_verification(
+        self,
+        app_id: str,
+        property_type: int,
+        url: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessUrlPropertyInfoResponse, dict]:
+        """
+        Check a URL property verification. See :meth:`BusinessAccountApi.check_url_property_verification`.
+        """
+        data = {
+            "app_id": app_id,
+            "url_property_meta": {
+                "property_type": property_type,
+                "url": url,
+            },
+        }
+        resp = await self._request(
+            verb="POST", path="business/property/verify/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessUrlPropertyInfoResponse.new_from_json_dict(data)
+        )
+
+    async def delete_url_property(
+        self,
+        app_id: str,
+        property_type: int,
+        url: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessBaseResponse, dict]:
+        """
+        Delete a URL property. See :meth:`BusinessAccountApi.delete_url_property`.
+        """
+        data = {
+            "app_id": app_id,
+            "url_property_meta": {
+                "property_type": property_type,
+                "url": url,
+            },
+        }
+        resp = await self._request(
+            verb="POST", path="business/property/delete/", json=data
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
+        )
+
+    async def get_url_property_list(
+        self,
+        app_id: str,
+        return_json: bool = False,
+    ) -> Union[mds.BusinessUrlPropertyInfoListResponse, dict]:
+        """
+        Get the list of URL properties. See :meth:`BusinessAccountApi.get_url_property_list`.
+        """
+        params = {"app_id": app_id}
+        resp = await self._request(
+            verb="GET", path="business/property/list/", params=params
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data
+            if return_json
+            else mds.BusinessUrlPropertyInfoListResponse.new_from_json_dict(data)
+        )
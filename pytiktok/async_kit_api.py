@@ -0,0 +1,455 @@
+"""
+Asyncio api impl for tiktok developer
+"""
+
+import asyncio
+from typing import Callable, Optional, List, Union, IO, AsyncIterator, Iterable
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+import pytiktok.models as mds
+from pytiktok.bulk import (
+    VIDEO_QUERY_MAX_IDS,
+    BulkVideosResult,
+    chunk_ids,
+    finish_videos_result,
+    merge_video_chunk,
+)
+from pytiktok.codec import JsonCodec, get_codec
+from pytiktok.async_business_account_api import _build_async_client
+from pytiktok.error import PyTiktokError
+from pytiktok.hooks import RequestHooks, kit_response_info
+from pytiktok.kit_api import KitApi
+from pytiktok.pagination import aiter_cursor_items
+from pytiktok.upload import DEFAULT_CHUNK_SIZE, MultipartFileStream
+
+
+class AsyncKitApi:
+    """
+    Asyncio version of :class:`KitApi`.
+
+    All api methods are coroutines which share one pooled ``httpx.AsyncClient``,
+    so many concurrent calls can run on one event loop.
+    """
+
+    BASE_URL = KitApi.BASE_URL
+    AUTHORIZE_URL = KitApi.AUTHORIZE_URL
+    DEFAULT_SCOPE = KitApi.DEFAULT_SCOPE
+    DEFAULT_REDIRECT_URI = KitApi.DEFAULT_REDIRECT_URI
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: Optional[int] = None,
+        proxies: Optional[dict] = None,
+        redirect_uri: Optional[str] = None,
+        scope: Optional[str] = None,
+        base_url: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        json_codec: Union[str, JsonCodec, None] = None,
+        hooks: Optional[RequestHooks] = None,
+    ) -> None:
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.access_token = access_token
+        self.timeout = timeout
+        self.proxies = proxies
+        self.redirect_uri = redirect_uri or self.DEFAULT_REDIRECT_URI
+        self.scope = scope or self.DEFAULT_SCOPE
+        self.base_url = base_url or self.BASE_URL
+        if client is None:
+            client = _build_async_client(
+                timeout=timeout,
+                proxies=proxies,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        self.client = client
+
+        # json codec for responses and request bodies, None means the default codec.
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+
+        # lifecycle hooks for the requests, for the metrics or tracing.
+        self.hooks = hooks
+
+    async def __aenter__(self) -> "AsyncKitApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the connections in the pool.
+        """
+        await self.client.aclose()
+
+    # authorize url not need any request.
+    generate_state = staticmethod(KitApi.generate_state)
+    get_authorize_url = KitApi.get_authorize_url
+
+    async def generate_access_token(
+        self, code: str, return_json: bool = False
+    ) -> Union[mds.KitAccessTokenResponse, dict]:
+        """
+        Fetch Access Token using Authorization Code. See :meth:`KitApi.generate_access_token`.
+        """
+        if not self.client_id or not self.client_secret:
+            raise PyTiktokError("Need app client id and client secret")
+
+        resp = await self._request(
+            # To keep code not be encoding, set it in url.
+            path=f"oauth/access_token/?code={code}",
+            params={
+                "client_key": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "authorization_code",
+            },
+            enforce_auth=False,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        self.access_token = data.get("data", {}).get("access_token")
+        return (
+            data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
+        )
+
+    async def refresh_access_token(
+        self, refresh_token: str, return_json: bool = False
+    ) -> Union[mds.KitAccessTokenResponse, dict]:
+        """
+        Refresh Access Token using Refresh Token. See :meth:`KitApi.refresh_access_token`.
+        """
+        if not self.client_id:
+            raise PyTiktokError("Need app client id")
+        resp = await self._request(
+            path="oauth/refresh_token/",
+            params={
+                "client_key": self.client_id,
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            },
+            enforce_auth=False,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        self.access_token = data.get("data", {}).get("access_token")
+        return (
+            data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
+        )
+
+    async def revoke_access_token(
+        self, open_id: str, access_token: str, return_json: bool = False
+    ) -> Union[mds.KitAccessTokenResponse, dict]:
+        """
+        Revoke access token. See :meth:`KitApi.revoke_access_token`.
+        """
+        resp = await self._request(
+            path="oauth/revoke/",
+            params={
+                "open_id": open_id,
+                "access_token": access_token,
+            },
+            enforce_auth=False,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
+        )
+
+    async def get_qrcode(
+        self,
+        scope: Optional[str] = None,
+        redirect_uri: Optional[str] = None,
+        return_json: bool = False,
+    ) -> Union[mds.KitQrCodeResponse, dict]:
+        """
+        Get qr code for user to authorize. See :meth:`KitApi.get_qrcode`.
+        """
+        if not self.client_id:
+            raise PyTiktokError(f"Need app client id")
+
+        if scope is None:
+            scope = self.scope
+        if redirect_uri is None:
+            redirect_uri = self.redirect_uri
+
+        state = self.generate_state()
+        params = {
+            "client_key": self.client_id,
+            "scope": scope,
+            "next": redirect_uri,
+            "state": state,
+        }
+        resp = await self._request(
+            path="v0/oauth/get_qrcode", params=params, enforce_auth=False
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return data if return_json else mds.KitQrCodeResponse.new_from_json_dict(data)
+
+    async def check_qrcode(
+        self,
+        token: str,
+        scope: Optional[str] = None,
+        redirect_uri: Optional[str] = None,
+        return_json: bool = False,
+    ) -> Union[mds.KitQrCodeResponse, dict]:
+        """
+        Check QR code status. See :meth:`KitApi.check_qrcode`.
+        """
+        if not self.client_id:
+            raise PyTiktokError(f"Need app client id")
+
+        if scope is None:
+            scope = self.scope
+        if redirect_uri is None:
+            redirect_uri = self.redirect_uri
+        params = {
+            "client_key": self.client_id,
+            "scope": scope,
+            "next": redirect_uri,
+            "token": token,
+        }
+        resp = await self._request(
+            path="v0/oauth/check_qrcode", params=params, enforce_auth=False
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return data if return_json else mds.KitQrCodeResponse.new_from_json_dict(data)
+
+    async def _request(
+        self,
+        path: str,
+        verb: str = "POST",
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        files: Optional[dict] = None,
+        json: Optional[dict] = None,
+        enforce_auth: bool = True,
+        content: Optional[Union[bytes, AsyncIterator[bytes]]] = None,
+        headers: Optional[dict] = None,
+    ) -> "httpx.Response":
+        """
+        Request for TikTok api url
+        :param path: The api location for TikTok
+        :param verb: HTTP Method, like GET,POST,PUT.
+        :param params: The url params to send in the body of the request.
+        :param data: The form data to send in the body of the request.
+        :param files: The form files to send in the body of the request.
+        :param json: The json data to send in the body of the request.
+        :param enforce_auth: Does the request require authentication.
+        :param content: The raw or streaming body of the request.
+        :param headers: Extra headers for the request.
+        :return: A response object
+        """
+        access_token = None
+        if enforce_auth:
+            if not self.access_token:
+                raise PyTiktokError("The request must be authenticated.")
+            access_token = self.access_token
+
+        api_path = path
+        if not path.startswith("http"):
+            path = f"{self.base_url}/{path}"
+
+        # same as the sync api, the given json and params are not changed.
+        headers, params, content = self._prepare_request(
+            access_token, headers, params, json, body=content
+        )
+
+        event = None
+        if self.hooks is not None:
+            event = self.hooks.start(verb, api_path, path, content)
+        try:
+            resp = await self.client.request(
+                url=path,
+                method=verb,
+                headers=headers,
+                params=params,
+                data=data,
+                files=files,
+                content=content,
+            )
+        except Exception as e:
+            if event is not None:
+                self.hooks.error(event, e)
+            raise
+        if event is not None:
+            self.hooks.response(
+                event, resp, codec=self.json_codec, get_info=kit_response_info
+            )
+
+        return resp
+
+    _authorize = KitApi._authorize
+    _prepare_request = KitApi._prepare_request
+    parse_response = staticmethod(KitApi.parse_response)
+
+    async def get_user_info(
+        self,
+        open_id: str,
+        fields: Optional[List[str]] = None,
+        return_json: bool = False,
+    ) -> Union[mds.KitUserResponse, dict]:
+        """
+        Get some basic information of a given TikTok user. See :meth:`KitApi.get_user_info`.
+        """
+        if fields is None:
+            fields = ["open_id", "union_id", "display_name", "avatar_url"]
+        resp = await self._request(
+            path="user/info/",
+            json={
+                "open_id": open_id,
+                "fields": fields,
+            },
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return data if return_json else mds.KitUserResponse.new_from_json_dict(data)
+
+    async def get_user_videos(
+        self,
+        open_id: str,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[int] = None,
+        max_count: Optional[int] = None,
+        return_json: bool = False,
+    ) -> Union[mds.KitVideosResponse, dict]:
+        """
+        Get a paginated list of given user's public videos. See :meth:`KitApi.get_user_videos`.
+        """
+        if fields is None:
+            fields = ["id", "create_time", "duration", "share_url"]
+        data = {"open_id": open_id, "fields": fields}
+        if cursor is not None:
+            data["cursor"] = cursor
+        if max_count is not None:
+            data["max_count"] = max_count
+        resp = await self._request(
+            path="video/list/",
+            json=data,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return data if return_json else mds.KitVideosResponse.new_from_json_dict(data)
+
+    def iter_user_videos(
+        self,
+        open_id: str,
+        fields: Optional[List[str]] = None,
+        max_count: int = 20,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[mds.KitVideo]:
+        """
+        Iterate over given user's public videos. See :meth:`KitApi.iter_user_videos`.
+        """
+        return aiter_cursor_items(
+            fetch_page=lambda cursor: self.get_user_videos(
+                open_id=open_id,
+                fields=fields,
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            items_key="videos",
+            model=mds.KitVideo,
+            limit=limit,
+        )
+
+    async def query_videos(
+        self,
+        open_id: str,
+        filters: dict,
+        fields: Optional[List[str]] = None,
+        return_json: bool = False,
+    ) -> Union[mds.KitVideosResponse, dict]:
+        """
+        Query video data by video ids. See :meth:`KitApi.query_videos`.
+        """
+        if fields is None:
+            fields = ["id", "create_time", "duration", "share_url"]
+        data = {"open_id": open_id, "fields": fields, "filters": filters}
+        resp = await self._request(
+            path="video/query/",
+            json=data,
+        )
+        data = self.parse_response(resp, self.json_codec)
+        return data if return_json else mds.KitVideosResponse.new_from_json_dict(data)
+
+    async def query_videos_bulk(
+        self,
+        open_id: str,
+        video_ids: Iterable[str],
+        fields: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+    ) -> BulkVideosResult:
+        """
+        Query video data for any number of video ids. See :meth:`KitApi.query_videos_bulk`.
+
+        :param max_concurrency: Max number of concurrent calls.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        if fields is None:
+            fields = ["id", "create_time", "duration", "share_url"]
+        elif "id" not in fields:
+            fields = ["id", *fields]
+        chunks = chunk_ids(video_ids, VIDEO_QUERY_MAX_IDS)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(chunk):
+            async with semaphore:
+                try:
+                    data = await self.query_videos(
+                        open_id=open_id,
+                        filters={"video_ids": chunk},
+                        fields=fields,
+                        return_json=True,
+                    )
+                except Exception as e:
+                    return chunk, None, e
+                return chunk, data, None
+
+        result = BulkVideosResult()
+        for chunk, data, error in await asyncio.gather(*(call(c) for c in chunks)):
+            merge_video_chunk(result, chunk, data=data, error=error)
+        finish_videos_result(result, chunks)
+        return result
+
+    async def share_video(
+        self,
+        open_id: str,
+        video: IO,
+        return_json: bool = False,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Union[mds.KitShareVideoResponse, dict]:
+        """
+        Share video into TikTok. See :meth:`KitApi.share_video`.
+        """
+        if not stream and progress is None:
+            resp = await self._request(
+                path="share/video/upload/",
+                params={"open_id": open_id},
+                files={"video": video},
+            )
+        else:
+            with MultipartFileStream(
+                "video", video, chunk_size=chunk_size, progress=progress
+            ) as body:
+                resp = await self._request(
+                    path="share/video/upload/",
+                    params={"open_id": open_id},
+                    content=body.__aiter__(),
+                    headers={
+                        "Content-Type": body.content_type,
+                        "Content-Length": str(len(body)),
+                    },
+                )
+        data = self.parse_response(resp, self.json_codec)
+        return (
+            data if return_json else mds.KitShareVideoResponse.new_from_json_dict(data)
+        )
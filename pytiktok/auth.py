@@ -0,0 +1,171 @@
+"""
+Access token provider, which refreshes the token automatically.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from pytiktok.error import PyTiktokError
+
+# Error codes in response body which mean the access token is invalid or expired.
+BUSINESS_AUTH_ERROR_CODES = frozenset(
+    {
+        40102,  # Access token expired.
+        40104,  # Access token is empty.
+        40105,  # Access token is invalid or revoked.
+    }
+)
+# The kit api (v1, open-api.tiktok.com) has numeric codes in ``error.code``.
+KIT_AUTH_ERROR_CODES = frozenset(
+    {
+        2190002,  # Access token is invalid.
+        2190008,  # Access token expired.
+    }
+)
+
+
+class TokenProvider:
+    """
+    Thread safe access token provider for the api instances.
+
+    The token is refreshed by the refresh token ahead of its expiry, with a random jitter,
+    so the workers sharing many tokens not refresh them at the same time.
+    Only one thread refreshes the token, the others wait for it and use the new token.
+
+    >>> provider = TokenProvider(access_token="token", refresh_token="refresh", expires_in=86400)
+    >>> api = BusinessAccountApi(app_id="id", app_secret="secret", token_provider=provider)
+
+    :param access_token: The current access token.
+    :param refresh_token: Refresh token to get a new access token.
+    :param expires_in: Seconds the current access token will expire in. None means unknown,
+        then the token is refreshed only when TikTok rejects it.
+    :param refresh: Function to get the new token data by the refresh token, which has keys
+        ``access_token``, ``refresh_token`` and ``expires_in``.
+        If not set, the api instance using this provider will set it with its ``refresh_access_token``.
+    :param refresh_ahead: Seconds to refresh the token before it expires.
+    :param jitter: Max random seconds to refresh earlier.
+    :param on_refresh: Function called with the new token data after refreshed, to save the tokens.
+    :param timer: Function to get the current seconds.
+    """
+
+    # Seconds to wait before refreshing again, if refreshing failed while the token is still valid.
+    RETRY_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        expires_in: Optional[float] = None,
+        refresh: Optional[Callable[[str], Dict[str, Any]]] = None,
+        refresh_ahead: float = 300.0,
+        jitter: float = 60.0,
+        on_refresh: Optional[Callable[[Dict[str, Any]], None]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh = refresh
+        self.refresh_ahead = refresh_ahead
+        self.jitter = jitter
+        self.on_refresh = on_refresh
+        self.timer = timer
+        self.refresh_count = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._set_token(access_token, refresh_token, expires_in)
+
+    def _set_token(
+        self,
+        access_token: Optional[str],
+        refresh_token: Optional[str],
+        expires_in: Optional[float],
+    ) -> None:
+        now = self.timer()
+        self._access_token = access_token
+        self._refresh_token = refresh_token
+        self._expires_at = None if expires_in is None else now + expires_in
+        self._refresh_at = None
+        if expires_in is not None:
+            ahead = min(self.refresh_ahead, expires_in / 2)
+            self._refresh_at = self._expires_at - ahead - random.uniform(0, self.jitter)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self._access_token
+
+    @property
+    def refresh_token(self) -> Optional[str]:
+        return self._refresh_token
+
+    def _is_valid(self, now: float) -> bool:
+        return self._access_token is not None and (
+            self._expires_at is None or now < self._expires_at
+        )
+
+    def get_token(self) -> str:
+        """
+        Get the access token, refresh it if it will expire soon.
+        :return: Access token.
+        """
+        with self._lock:
+            token = self._access_token
+            if token is not None and (
+                self._refresh_at is None or self.timer() < self._refresh_at
+            ):
+                return token
+        return self._refresh(stale_token=token)
+
+    def invalidate(self, token: str) -> str:
+        """
+        Mark the token as rejected by TikTok, and get a new token.
+        If the token has been refreshed by another thread, return the new one at once.
+        :param token: The token rejected.
+        :return: New access token.
+        """
+        return self._refresh(stale_token=token, force=True)
+
+    def _refresh(self, stale_token: Optional[str], force: bool = False) -> str:
+        # only one thread refreshes, the others wait here and use its result.
+        with self._refresh_lock:
+            with self._lock:
+                now = self.timer()
+                token = self._access_token
+                if token != stale_token and self._is_valid(now):
+                    return token
+                if (
+                    not force
+                    and self._refresh_at is not None
+                    and now < self._refresh_at
+                ):
+                    return token
+                refresh_token = self._refresh_token
+
+            if self.refresh is None or not refresh_token:
+                if token is not None and not force and self._is_valid(now):
+                    return token
+                raise PyTiktokError(
+                    "The access token has expired, and can not refresh."
+                )
+            try:
+                data = self.refresh(refresh_token)
+                if not data or not data.get("access_token"):
+                    raise PyTiktokError(f"Refresh access token failed: {data}")
+            except Exception:
+                with self._lock:
+                    if not force and self._is_valid(self.timer()):
+                        # try again later, use the current token before it expires.
+                        self._refresh_at = self.timer() + self.RETRY_INTERVAL
+                        return self._access_token
+                raise
+
+            with self._lock:
+                self._set_token(
+                    data["access_token"],
+                    data.get("refresh_token") or refresh_token,
+                    data.get("expires_in"),
+                )
+                self.refresh_count += 1
+                token = self._access_token
+        if self.on_refresh is not None:
+            self.on_refresh(data)
+        return token
@@ -0,0 +1,252 @@
+"""
+Request pipeline shared by the api instances.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Collection, Optional, Tuple
+
+import requests
+
+from pytiktok.codec import get_codec, load_response
+from pytiktok.error import PyTiktokError
+from pytiktok.hooks import body_size
+from pytiktok.retry import send_with_retry
+from pytiktok.transport import HttpxTransport, RequestsTransport, Transport
+
+
+class BaseApi(ABC):
+    """
+    Base of :class:`BusinessAccountApi` and :class:`KitApi`, which sends the requests by the transport,
+    with the retry, rate limit, hooks and access token refresh. The subclasses set how the access token
+    is sent and how the errors are read from the response.
+    """
+
+    # TikTok error codes to retry by default.
+    RETRY_CODES: Collection[Any] = ()
+    # TikTok error codes in RETRY_CODES for rate limit, which are retried for any method.
+    RATE_LIMIT_CODES: Collection[Any] = ()
+    # TikTok error codes for the rejected access token.
+    AUTH_ERROR_CODES: Collection[Any] = ()
+
+    def _init_transport(
+        self,
+        transport: Optional[Transport],
+        session: Optional[requests.Session],
+        proxies: Optional[dict],
+        http2: bool = False,
+        **pool_kwargs,
+    ) -> None:
+        # transport and session can be shared by many api instances, to reuse the connections.
+        if transport is None and http2:
+            # the concurrent requests share a few multiplexed connections.
+            transport = HttpxTransport(http2=True, proxies=proxies)
+        elif transport is None:
+            transport = RequestsTransport(
+                session=session, proxies=proxies, **pool_kwargs
+            )
+        self.transport = transport
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """
+        Requests session of the transport, shared by the apis using the transport.
+        None if the transport does not send by a requests session, like the httpx transport for HTTP/2,
+        use ``transport`` for it.
+        """
+        return getattr(self.transport, "session", None)
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        if not isinstance(self.transport, RequestsTransport):
+            raise PyTiktokError(
+                "The transport of the api does not use a requests session."
+            )
+        self.transport.session = session
+
+    @property
+    def proxies(self) -> Optional[dict]:
+        """
+        Proxies of the transport, shared by the apis using the transport.
+        """
+        return getattr(self.transport, "proxies", None)
+
+    @proxies.setter
+    def proxies(self, proxies: Optional[dict]) -> None:
+        if not isinstance(self.transport, RequestsTransport):
+            raise PyTiktokError(
+                "The proxies of the transport can not be changed, set them when build the transport."
+            )
+        self.transport.proxies = proxies
+
+    @staticmethod
+    @abstractmethod
+    def _get_error_code(data: dict) -> Any:
+        """
+        Get the TikTok error code from the json data.
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _get_response_info(data: dict) -> Tuple[Any, Optional[str]]:
+        """
+        Get the error code and request id from the json data, for the hooks.
+        """
+
+    @abstractmethod
+    def _authorize(
+        self,
+        access_token: str,
+        headers: dict,
+        params: Optional[dict],
+        json: Optional[dict],
+    ) -> Tuple[dict, Optional[dict], Optional[dict]]:
+        """
+        Add the access token to the request.
+        :return: Headers, params and json for the request, the given ones are not changed.
+        """
+
+    def _prepare_request(
+        self,
+        access_token: Optional[str],
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        body: Any = None,
+    ) -> Tuple[Optional[dict], Optional[dict], Any]:
+        """
+        Add the access token to the request, and encode the json data by the codec.
+        Also used by the async apis, which have the same ``_authorize`` and ``json_codec``.
+        :param access_token: Access token for the request, None if not authenticated.
+        :param headers: Extra headers for the request.
+        :param params: The url params for the request.
+        :param json: The json data to send in the body of the request.
+        :param body: The body of the request if no json data.
+        :return: Headers, params and body for the request, the given ones are not changed.
+        """
+        req_headers = dict(headers or {})
+        if access_token is not None:
+            req_headers, params, json = self._authorize(
+                access_token, req_headers, params, json
+            )
+        if json is not None:
+            # encode the body by the codec, instead of the stdlib json in the http client.
+            body = get_codec(self.json_codec).dumps(json)
+            req_headers["Content-Type"] = "application/json"
+        return req_headers or None, params, body
+
+    def _send(
+        self,
+        verb: str,
+        url: str,
+        api_path: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        access_token: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+    ):
+        """
+        Send a request by the transport.
+        :param verb: HTTP Method, like GET,POST,PUT.
+        :param url: Full url for the request.
+        :param api_path: Api path for the request, for the hooks.
+        :param params: The url params to send in the body of the request.
+        :param data: The form data or a streaming body to send in the body of the request.
+        :param files: The form files to send in the body of the request.
+        :param json: The json data to send in the body of the request.
+        :param headers: Extra headers for the request.
+        :param access_token: Access token for the request, None if not authenticated.
+        :param idempotent: Whether the request is safe to send again, like a POST to read data.
+            If not set, check the method by the retry policy.
+        :return: Response
+        """
+        # a streaming body can be read again from the start.
+        rewind = getattr(data, "rewind", None)
+        can_resend = files is None and (rewind is not None or not hasattr(data, "read"))
+
+        def prepare(token: Optional[str]) -> Tuple[Optional[dict], Optional[dict], Any]:
+            return self._prepare_request(token, headers, params, json, body=data)
+
+        def send(prepared: Tuple[Optional[dict], Optional[dict], Any]):
+            req_headers, req_params, body = prepared
+
+            def request():
+                if rewind is not None:
+                    rewind()
+                return self.transport.request(
+                    method=verb,
+                    url=url,
+                    params=req_params,
+                    data=body,
+                    files=files,
+                    headers=req_headers,
+                    timeout=self.timeout,
+                )
+
+            return send_with_retry(
+                send=request,
+                method=verb,
+                # file streams have been consumed, can not send again.
+                retry_policy=self.retry_policy if can_resend else None,
+                rate_limiter=self.rate_limiter,
+                get_error_code=self._get_error_code,
+                default_codes=self.RETRY_CODES,
+                codec=self.json_codec,
+                default_rate_limit_codes=self.RATE_LIMIT_CODES,
+                idempotent=idempotent,
+            )
+
+        prepared = prepare(access_token)
+        event = None
+        if self.hooks is not None:
+            event = self.hooks.start(verb, api_path, url, prepared[2])
+        try:
+            resp = send(prepared)
+            if access_token is not None and can_resend and self._is_auth_error(resp):
+                # the token is rejected, retry once with a new token.
+                resp.close()
+                prepared = prepare(self._refresh_rejected_token(access_token))
+                if event is not None:
+                    event.bytes_out = body_size(prepared[2])
+                resp = send(prepared)
+        except Exception as e:
+            if event is not None:
+                self.hooks.error(event, e)
+            raise
+        if event is not None:
+            self.hooks.response(
+                event, resp, codec=self.json_codec, get_info=self._get_response_info
+            )
+        return resp
+
+    def _get_access_token(self) -> str:
+        """
+        Get the access token for a request, from the token provider if it is set.
+        """
+        if self.token_provider is not None:
+            self.access_token = self.token_provider.get_token()
+        if not self.access_token:
+            raise PyTiktokError("The request must be authenticated.")
+        return self.access_token
+
+    def _is_auth_error(self, response) -> bool:
+        """
+        Check whether the response means the access token is rejected, only if the token provider is set.
+        """
+        if self.token_provider is None:
+            return False
+        if response.status_code == 401:
+            return True
+        try:
+            data = load_response(response, self.json_codec)
+        except ValueError:
+            return False
+        if not isinstance(data, dict):
+            return False
+        return self._get_error_code(data) in self.AUTH_ERROR_CODES
+
+    def _refresh_rejected_token(self, access_token: str) -> str:
+        self.access_token = self.token_provider.invalidate(access_token)
+        return self.access_token
@@ -0,0 +1,107 @@
+"""
+Helpers for running many api calls concurrently.
+"""
+
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set
+
+
+@dataclass
+class BatchResult:
+    """
+    Result for one item in a batch.
+
+    :param item: The input item.
+    :param result: The return value of the call, None if the call failed.
+    :param error: The exception raised by the call, None if the call succeeded.
+    """
+
+    item: Any
+    result: Any = field(default=None)
+    error: Optional[Exception] = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """
+    Report for a batch, with the result for each item.
+
+    :param results: Results for the items, in input order.
+    """
+
+    results: List[BatchResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[BatchResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[BatchResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+
+def _call(func: Callable[[Any], Any], item: Any) -> BatchResult:
+    try:
+        return BatchResult(item=item, result=func(item))
+    except Exception as e:
+        return BatchResult(item=item, error=e)
+
+
+def run_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    executor: Optional[Executor] = None,
+) -> Iterator[BatchResult]:
+    """
+    Call func for each item on a thread pool, and yield results as they complete.
+
+    At most ``max_workers`` calls are in flight, and items are taken from the iterable only
+    when a worker is free, so a large iterable is never loaded into memory at once.
+    An error for one item is saved into its result, and will not abort the batch.
+
+    :param func: Function to call with each item.
+    :param items: Items for the calls.
+    :param max_workers: Max number of concurrent calls.
+    :param executor: Executor to run the calls. If not set, will use a new thread pool.
+    :return: Results iterator, in the order of completion.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    items = iter(items)
+    pending: Set[Future] = set()
+    try:
+        while True:
+            for item in items:
+                pending.add(executor.submit(_call, func, item))
+                if len(pending) >= max_workers:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
@@ -0,0 +1,73 @@
+"""
+Helpers for the bulk api calls, which split many ids into the chunks the api accepts.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import pytiktok.models as mds
+
+# Max video ids for one query_videos call.
+VIDEO_QUERY_MAX_IDS = 20
+
+
+@dataclass
+class BulkVideosResult:
+    """
+    Result for a bulk video query.
+
+    :param videos: Mapping from video id to the video found.
+    :param missing: Ids not returned by TikTok, like the deleted or private videos, in input order.
+    :param errors: Mapping from video id to the exception for its failed chunk.
+    """
+
+    videos: Dict[str, mds.KitVideo] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+def chunk_ids(ids: Iterable[str], size: int) -> List[List[str]]:
+    """
+    Remove the duplicate ids, and split them into chunks.
+    :param ids: Ids, may have duplicates.
+    :param size: Max ids for a chunk.
+    :return: Chunks of ids, in input order.
+    """
+    if size < 1:
+        raise ValueError("size must be greater than 0")
+    ids = list(dict.fromkeys(ids))
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+def merge_video_chunk(
+    result: BulkVideosResult,
+    chunk: List[str],
+    data: Optional[dict] = None,
+    error: Optional[Exception] = None,
+) -> None:
+    """
+    Merge the response for a chunk into the result.
+    :param result: Result to update.
+    :param chunk: Video ids for the chunk.
+    :param data: Json data for the query_videos response.
+    :param error: Exception for the chunk if failed.
+    """
+    if error is not None:
+        for video_id in chunk:
+            result.errors[video_id] = error
+        return
+    for video in (data.get("data") or {}).get("videos") or []:
+        if video.get("id") is not None:
+            result.videos[str(video["id"])] = mds.KitVideo.new_from_json_dict(video)
+
+
+def finish_videos_result(result: BulkVideosResult, chunks: List[List[str]]) -> None:
+    """
+    Fill the missing ids for the result, in input order.
+    """
+    result.missing = [
+        video_id
+        for chunk in chunks
+        for video_id in chunk
+        if video_id not in result.videos and video_id not in result.errors
+    ]
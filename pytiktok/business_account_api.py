@@ -2,18 +2,51 @@
 Core API impl.
 """
 
-import json
-from typing import Optional, List, Union
+import copy
+from concurrent.futures import Executor
+from typing import Callable, Optional, List, Union, Iterator, Iterable, Tuple
 
 import requests
 from requests import Response
 
 import pytiktok.models as mds
+from pytiktok.auth import BUSINESS_AUTH_ERROR_CODES, TokenProvider
+from pytiktok.base_api import BaseApi
+from pytiktok.batch import BatchReport, BatchResult, run_batch
+from pytiktok.cache import ResponseCache
+from pytiktok.coalesce import RequestCoalescer, make_request_key
+from pytiktok.codec import JsonCodec, get_codec, load_response
 from pytiktok.error import PyTiktokError
-
-
-class BusinessAccountApi:
+from pytiktok.hooks import RequestHooks, business_response_info
+from pytiktok.columns import VideoColumns
+from pytiktok.pagination import iter_cursor_items, iter_cursor_pages
+from pytiktok.publish import PublishHandle, PublishPoller, get_publish_poller
+from pytiktok.retry import (
+    BUSINESS_RATE_LIMIT_CODES,
+    BUSINESS_RETRY_CODES,
+    RetryPolicy,
+    TokenBucket,
+)
+from pytiktok.session import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from pytiktok.store import PageStore
+from pytiktok.sync import CommentSyncResult, CommentWatermark, sync_comments
+from pytiktok.transport import Transport
+
+# Comment moderation operations, and the api method for it, whether it needs the video id,
+# whether it takes an action.
+COMMENT_OPERATIONS = {
+    "hide": ("hide_comment", True, True),
+    "delete": ("delete_comment", False, False),
+    "like": ("like_comment", False, True),
+    "pin": ("pin_comment", True, True),
+}
+
+
+class BusinessAccountApi(BaseApi):
     BASE_URL = "https://business-api.tiktok.com/open_api"
+    RETRY_CODES = BUSINESS_RETRY_CODES
+    RATE_LIMIT_CODES = BUSINESS_RATE_LIMIT_CODES
+    AUTH_ERROR_CODES = BUSINESS_AUTH_ERROR_CODES
 
     def __init__(
         self,
@@ -25,15 +58,67 @@ class BusinessAccountApi:
         base_url: Optional[str] = None,
         api_version: Optional[str] = "v1.3",
         oauth_redirect_uri: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[int] = 60,
+        json_codec: Union[str, JsonCodec, None] = None,
+        cache: Optional[ResponseCache] = None,
+        store: Optional[PageStore] = None,
+        token_provider: Optional[TokenProvider] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        hooks: Optional[RequestHooks] = None,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
     ) -> None:
         self.app_id = app_id
         self.app_secret = app_secret
         self.access_token = access_token
-        self.session = requests.Session()
+        self._init_transport(
+            transport,
+            session,
+            proxies,
+            http2=http2,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+        )
         self.timeout = timeout
-        self.proxies = proxies
         self.api_version = api_version
 
+        # retry failed requests by the policy, and limit the request rate in client side.
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+
+        # json codec for responses and request bodies, None means the default codec.
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+
+        # cache for the responses of the paths called again and again, opt-in.
+        self.cache = cache
+        # persistent store for the pages of the iter methods, opt-in.
+        self.store = store
+
+        # share one request for the identical GET requests in flight, opt-in.
+        self.coalescer = coalescer
+
+        # lifecycle hooks for the requests, for the metrics or tracing.
+        self.hooks = hooks
+
+        # refresh the access token automatically, opt-in.
+        self.token_provider = token_provider
+        if token_provider is not None:
+            if token_provider.refresh is None:
+                token_provider.refresh = (
+                    lambda refresh_token: self.refresh_access_token(
+                        refresh_token, return_json=True
+                    )
+                )
+            self.access_token = token_provider.access_token or access_token
+
         # base url prefix
         self.base_url = base_url or self.BASE_URL
 
@@ -41,11 +126,10 @@ class BusinessAccountApi:
         # Must be the same as the TikTok account holder redirect URL set in the app.
         self.oauth_redirect_uri = oauth_redirect_uri
 
-    @staticmethod
-    def _format_fields(fields):
+    def _format_fields(self, fields):
         if isinstance(fields, str):
             return fields
-        return json.dumps(fields)
+        return get_codec(self.json_codec).dumps_str(fields)
 
     def generate_access_token(
         self, code: str, redirect_uri: Optional[str] = None, return_json: bool = False
@@ -76,7 +160,7 @@ class BusinessAccountApi:
             enforce_auth=False,
         )
 
-        data = self.parse_response(response=resp)
+        data = self.parse_response(response=resp, codec=self.json_codec)
         data = data["data"]
         self.access_token = data["access_token"]
         return data if return_json else mds.BusinessAccessToken.new_from_json_dict(data)
@@ -104,7 +188,7 @@ class BusinessAccountApi:
             enforce_auth=False,
         )
 
-        data = self.parse_response(response=resp)
+        data = self.parse_response(response=resp, codec=self.json_codec)
         data = data["data"]
         self.access_token = data["access_token"]
         return data if return_json else mds.BusinessAccessToken.new_from_json_dict(data)
@@ -123,7 +207,7 @@ class BusinessAccountApi:
             enforce_auth=False,
         )
 
-        data = self.parse_response(response=resp)
+        data = self.parse_response(response=resp, codec=self.json_codec)
         return (
             data
             if return_json
@@ -154,7 +238,7 @@ class BusinessAccountApi:
             enforce_auth=False,
         )
 
-        data = self.parse_response(response=resp)
+        data = self.parse_response(response=resp, codec=self.json_codec)
         data = data["data"]
         return (
             data
@@ -181,33 +265,68 @@ class BusinessAccountApi:
         :param enforce_auth: Does the request require authentication.
         :return: A json object
         """
-        headers = None
-        if enforce_auth:
-            if not self.access_token:
-                raise PyTiktokError("The request must be authenticated.")
-            headers = {"Access-Token": self.access_token}
+        access_token = self._get_access_token() if enforce_auth else None
+
+        cache_key, api_path = None, path
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                verb,
+                path,
+                params=params,
+                json_body=json,
+                access_token=access_token,
+                base_url=f"{self.base_url}/{self.api_version}",
+            )
+            if cache_key is not None:
+                resp = self.cache.get(cache_key)
+                if resp is not None:
+                    return resp
 
         if not path.startswith("http"):
             path = f"{self.base_url}/{self.api_version}/{path}"
 
-        resp = self.session.request(
-            url=path,
-            method=verb,
-            headers=headers,
-            params=params,
-            data=data,
-            json=json,
-            timeout=self.timeout,
-            proxies=self.proxies,
-        )
+        def fetch() -> Response:
+            resp = self._send(
+                verb,
+                path,
+                api_path,
+                params=params,
+                data=data,
+                json=json,
+                access_token=access_token,
+            )
+            if cache_key is not None:
+                self.cache.set(cache_key, api_path, resp, codec=self.json_codec)
+            elif self.cache is not None:
+                self.cache.invalidate_for_write(api_path)
+            return resp
+
+        if self.coalescer is not None:
+            key = make_request_key(verb, path, params, access_token)
+            if key is not None:
+                # identical requests in flight share one response.
+                return self.coalescer.run(key, fetch)
+        return fetch()
+
+    @staticmethod
+    def _get_error_code(data: dict):
+        return data.get("code")
 
-        return resp
+    _get_response_info = staticmethod(business_response_info)
+
+    def _authorize(self, access_token, headers, params, json):
+        return {**headers, "Access-Token": access_token}, params, json
 
     @staticmethod
-    def parse_response(response: Response) -> dict:
+    def parse_response(response: Response, codec: Optional[JsonCodec] = None) -> dict:
+        """
+        Decode the response and raise the TikTok error in it.
+        :param response: Response for the request.
+        :param codec: Json codec to decode the response. If not set, use the default codec.
+        :return: The json data.
+        """
         try:
-            data = response.json()
-            response.close()
+            data = load_response(response, codec)
         except ValueError:
             raise PyTiktokError(f"Unknown error: {response.content}")
 
@@ -217,6 +336,49 @@ class BusinessAccountApi:
 
         return data
 
+    def with_access_token(self, access_token: str) -> "BusinessAccountApi":
+        """
+        Get a copy of this api which use the given access token.
+        The copy shares the http session with this api.
+        :param access_token: Access token for the copy.
+        :return: Api instance
+        """
+        api = copy.copy(self)
+        api.access_token = access_token
+        # the token provider is for the origin token.
+        api.token_provider = None
+        return api
+
+    def fan_out(
+        self,
+        method: str,
+        calls: Iterable[Tuple[str, str, Optional[dict]]],
+        max_workers: int = 8,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Call an api method for many accounts concurrently on a thread pool.
+
+        >>> for r in api.fan_out("get_account_data", [("token", "business_id", {"fields": ["username"]})]):
+        ...     print(r.item, r.result if r.ok else r.error)
+
+        :param method: Name of the api method, like get_account_data, get_account_post_privacy.
+        :param calls: Iterable of (access_token, business_id, kwargs) for each call.
+        :param max_workers: Max number of concurrent calls.
+        :param executor: Executor to run the calls. If not set, will use a new thread pool.
+        :return: Results iterator, in the order of completion.
+            The result item is the input tuple, error for a call is kept in its result.
+        """
+        if not callable(getattr(self, method, None)) or method.startswith("_"):
+            raise PyTiktokError(f"Unknown api method: {method}")
+
+        def call(item):
+            access_token, business_id, kwargs = item
+            api = self.with_access_token(access_token)
+            return getattr(api, method)(business_id=business_id, **(kwargs or {}))
+
+        return run_batch(call, calls, max_workers=max_workers, executor=executor)
+
     def get_account_data(
         self,
         business_id: str,
@@ -245,7 +407,7 @@ class BusinessAccountApi:
             params["fields"] = self._format_fields(fields)
 
         resp = self._request(path="business/get/", params=params)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -286,11 +448,110 @@ class BusinessAccountApi:
             path="business/video/list/",
             params=params,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessVideosResponse.new_from_json_dict(data)
         )
 
+    def _fetch_page(
+        self,
+        kind: str,
+        business_id: str,
+        fetch: Callable[[], dict],
+        video_id: Optional[str] = None,
+        query: Optional[dict] = None,
+        cursor: Optional[int] = None,
+    ) -> dict:
+        """
+        Get a page for the iter methods, from the store first if it is set.
+        """
+        if self.store is None:
+            return fetch()
+        return self.store.fetch_page(
+            kind, business_id, fetch, video_id=video_id, query=query, cursor=cursor
+        )
+
+    def iter_account_videos(
+        self,
+        business_id: str,
+        fields: Optional[list] = None,
+        filters: Optional[dict] = None,
+        max_count: int = 20,
+        limit: Optional[int] = None,
+    ) -> Iterator[mds.BusinessVideo]:
+        """
+        Iterate over all videos of a business account, the pages are requested when needed.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param fields: Requested fields. If not set, returns the default fields only. Default value: ["item_id"]
+        :param filters: Filters to apply to the result set.
+        :param max_count: The maximum number of videos that will be returned for each page. [1..20]
+        :param limit: The maximum number of videos to iterate. If not set, iterate all videos.
+        :return: Video iterator.
+        """
+        query = {"fields": fields, "filters": filters, "max_count": max_count}
+        return iter_cursor_items(
+            fetch_page=lambda cursor: self._fetch_page(
+                "videos",
+                business_id,
+                lambda: self.get_account_videos(
+                    business_id=business_id,
+                    cursor=cursor,
+                    return_json=True,
+                    **query,
+                ),
+                query=query,
+                cursor=cursor,
+            ),
+            items_key="videos",
+            model=mds.BusinessVideo,
+            limit=limit,
+        )
+
+    def get_video_columns(
+        self,
+        business_id: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[dict] = None,
+        max_count: int = 20,
+        limit: Optional[int] = None,
+    ) -> VideoColumns:
+        """
+        Get the metrics of all videos of a business account as columns, for NumPy, Arrow or DataFrames.
+        The pages are added to the columns as they come, no model is created for the videos.
+
+        >>> columns = api.get_video_columns(business_id, columns=["item_id", "video_views", "likes"])
+        >>> df = columns.to_arrow().to_pandas()
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param columns: Video fields to get, default is ``DEFAULT_VIDEO_COLUMNS`` in ``pytiktok.columns``.
+        :param filters: Filters to apply to the result set.
+        :param max_count: The maximum number of videos that will be returned for each page. [1..20]
+        :param limit: The maximum number of videos to get. If not set, get all videos.
+        :return: Video columns.
+        """
+        result = VideoColumns(columns)
+        query = {"fields": result.names, "filters": filters, "max_count": max_count}
+        pages = iter_cursor_pages(
+            fetch_page=lambda cursor: self._fetch_page(
+                "videos",
+                business_id,
+                lambda: self.get_account_videos(
+                    business_id=business_id,
+                    cursor=cursor,
+                    return_json=True,
+                    **query,
+                ),
+                query=query,
+                cursor=cursor,
+            ),
+            items_key="videos",
+            limit=limit,
+        )
+        for videos in pages:
+            result.add_videos(videos)
+        return result
+
     def get_account_post_privacy(
         self,
         business_id: str,
@@ -304,7 +565,7 @@ class BusinessAccountApi:
         """
         params = {"business_id": business_id}
         resp = self._request(path="business/video/settings/", params=params)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -336,7 +597,7 @@ class BusinessAccountApi:
         }
 
         resp = self._request(verb="POST", path="business/video/publish/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -371,7 +632,7 @@ class BusinessAccountApi:
             "post_info": post_info,
         }
         resp = self._request(verb="POST", path="business/photo/publish/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -393,13 +654,65 @@ class BusinessAccountApi:
         """
         params = {"business_id": business_id, "publish_id": publish_id}
         resp = self._request(path="business/publish/status/", params=params)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
             else mds.BusinessPublishStatusResponse.new_from_json_dict(data)
         )
 
+    def publish_video(
+        self,
+        business_id: str,
+        video_url: str,
+        post_info: dict,
+        poller: Optional[PublishPoller] = None,
+    ) -> PublishHandle:
+        """
+        Publish a public video to an owned account, and wait for the publishing in background.
+
+        >>> handle = api.publish_video(business_id, video_url, post_info={"caption": "caption"})
+        >>> handle.result(timeout=600).post_ids
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param video_url: A publicly accessible HTTP(s) URL for the video content to be published.
+        :param post_info: Information about the video post.
+        :param poller: Poller for the publishing status. If not set, use the process wide poller.
+        :return: Handle for the post, a future resolves to the final publish status.
+        """
+        resp = self.create_video(
+            business_id=business_id, video_url=video_url, post_info=post_info
+        )
+        poller = poller or get_publish_poller()
+        return poller.submit(self, business_id, resp.data.share_id)
+
+    def publish_photo(
+        self,
+        business_id: str,
+        photo_images: List[str],
+        post_info: dict,
+        photo_cover_index: int = 0,
+        poller: Optional[PublishPoller] = None,
+    ) -> PublishHandle:
+        """
+        Publish a photo post to an owned account, and wait for the publishing in background.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param photo_images: A list of up to 35 publicly accessible HTTP(s) URLs for the photo content to be published.
+        :param post_info: Information about the photo post.
+        :param photo_cover_index: The index of the photo to be used as the cover for the post.
+        :param poller: Poller for the publishing status. If not set, use the process wide poller.
+        :return: Handle for the post, a future resolves to the final publish status.
+        """
+        resp = self.create_photo(
+            business_id=business_id,
+            photo_images=photo_images,
+            post_info=post_info,
+            photo_cover_index=photo_cover_index,
+        )
+        poller = poller or get_publish_poller()
+        return poller.submit(self, business_id, resp.data.share_id)
+
     def get_video_comments(
         self,
         business_id: str,
@@ -447,13 +760,114 @@ class BusinessAccountApi:
             params["max_count"] = max_count
 
         resp = self._request(verb="GET", path="business/comment/list/", params=params)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
             else mds.BusinessCommentsResponse.new_from_json_dict(data)
         )
 
+    def iter_video_comments(
+        self,
+        business_id: str,
+        video_id: str,
+        include_replies: Optional[bool] = None,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        max_count: int = 30,
+        limit: Optional[int] = None,
+    ) -> Iterator[mds.BusinessComment]:
+        """
+        Iterate over all comments of a video, the pages are requested when needed.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param video_id: Unique identifier for owned TikTok video to list comments on.
+        :param include_replies: Whether to include replies to the top-level comments in the results.
+        :param status: Enumerated status of comment visibility. ["PUBLIC", "ALL"]
+        :param sort_field: Specific field to sort comments by. ["create_time", "likes", "replies"]
+        :param sort_order: Specific field to sort comments by. ["asc", "desc"]
+        :param max_count: The maximum number of comments that will be returned for each page of data. [0...30]
+        :param limit: The maximum number of comments to iterate. If not set, iterate all comments.
+        :return: Comment iterator.
+        """
+        query = {
+            "include_replies": include_replies,
+            "status": status,
+            "sort_field": sort_field,
+            "sort_order": sort_order,
+            "max_count": max_count,
+        }
+        return iter_cursor_items(
+            fetch_page=lambda cursor: self._fetch_page(
+                "comments",
+                business_id,
+                lambda: self.get_video_comments(
+                    business_id=business_id,
+                    video_id=video_id,
+                    cursor=cursor,
+                    return_json=True,
+                    **query,
+                ),
+                video_id=video_id,
+                query=query,
+                cursor=cursor,
+            ),
+            items_key="comments",
+            model=mds.BusinessComment,
+            limit=limit,
+        )
+
+    def sync_video_comments(
+        self,
+        business_id: str,
+        video_id: str,
+        watermark: Optional[CommentWatermark] = None,
+        include_replies: Optional[bool] = None,
+        status: Optional[str] = None,
+        max_count: int = 30,
+        save: bool = True,
+    ) -> CommentSyncResult:
+        """
+        Get the comments of a video created after the last sync.
+
+        Comments are requested by create time in descending order, and the paging stops at
+        the first comment older than the watermark, so only the pages with new comments are requested.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param video_id: Unique identifier for owned TikTok video to list comments on.
+        :param watermark: Watermark from the last sync result.
+            If not set, use the watermark saved in the store. If no watermark, get all comments.
+        :param include_replies: Whether to include replies to the top-level comments in the results.
+        :param status: Enumerated status of comment visibility. ["PUBLIC", "ALL"]
+        :param max_count: The maximum number of comments that will be returned for each page of data. [0...30]
+        :param save: Save the new watermark into the store, if the store is set.
+            Set False to save it by yourself after the comments are processed.
+        :return: The new comments and the new watermark.
+        """
+        if watermark is None and self.store is not None:
+            saved = self.store.get_watermark(business_id, video_id)
+            if saved is not None:
+                watermark = CommentWatermark.from_dict(saved)
+
+        result = sync_comments(
+            fetch_page=lambda cursor: self.get_video_comments(
+                business_id=business_id,
+                video_id=video_id,
+                include_replies=include_replies,
+                status=status,
+                sort_field="create_time",
+                sort_order="desc",
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            watermark=watermark,
+        )
+        if save and self.store is not None and result.watermark is not None:
+            self.store.set_watermark(business_id, video_id, result.watermark.to_dict())
+        return result
+
     def get_comment_replies(
         self,
         business_id: str,
@@ -500,13 +914,64 @@ class BusinessAccountApi:
         resp = self._request(
             verb="GET", path="business/comment/reply/list/", params=params
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
             else mds.BusinessCommentsResponse.new_from_json_dict(data)
         )
 
+    def iter_comment_replies(
+        self,
+        business_id: str,
+        video_id: str,
+        comment_id: str,
+        status: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        max_count: int = 30,
+        limit: Optional[int] = None,
+    ) -> Iterator[mds.BusinessComment]:
+        """
+        Iterate over all replies of a comment, the pages are requested when needed.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param video_id: Unique identifier for owned TikTok video to list comments on.
+        :param comment_id: Unique identifier for comment on an owned TikTok video to list replies on.
+        :param status: Enumerated status of comment visibility. ["PUBLIC", "ALL"]
+        :param sort_field: Specific field to sort comments by. ["create_time", "likes", "replies"]
+        :param sort_order: Specific field to sort comments by. ["asc", "desc", "smart"]
+        :param max_count: The maximum number of comments that will be returned for each page of data. [0...30]
+        :param limit: The maximum number of replies to iterate. If not set, iterate all replies.
+        :return: Reply iterator.
+        """
+        query = {
+            "comment_id": comment_id,
+            "status": status,
+            "sort_field": sort_field,
+            "sort_order": sort_order,
+            "max_count": max_count,
+        }
+        return iter_cursor_items(
+            fetch_page=lambda cursor: self._fetch_page(
+                "replies",
+                business_id,
+                lambda: self.get_comment_replies(
+                    business_id=business_id,
+                    video_id=video_id,
+                    cursor=cursor,
+                    return_json=True,
+                    **query,
+                ),
+                video_id=video_id,
+                query=query,
+                cursor=cursor,
+            ),
+            items_key="comments",
+            model=mds.BusinessComment,
+            limit=limit,
+        )
+
     def create_comment(
         self, business_id: str, video_id: str, text: str, return_json: bool = False
     ) -> Union[mds.BusinessCommentResponse, dict]:
@@ -520,7 +985,7 @@ class BusinessAccountApi:
         data = {"business_id": business_id, "video_id": video_id, "text": text}
 
         resp = self._request(verb="POST", path="business/comment/create/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -553,7 +1018,7 @@ class BusinessAccountApi:
         resp = self._request(
             verb="POST", path="business/comment/reply/create/", json=data
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -578,7 +1043,7 @@ class BusinessAccountApi:
         """
         data = {"business_id": business_id, "comment_id": comment_id, "action": action}
         resp = self._request(verb="POST", path="business/comment/like/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
         )
@@ -608,7 +1073,7 @@ class BusinessAccountApi:
             "action": action,
         }
         resp = self._request(verb="POST", path="business/comment/pin/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
         )
@@ -638,7 +1103,7 @@ class BusinessAccountApi:
             "action": action,
         }
         resp = self._request(verb="POST", path="business/comment/hide/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
         )
@@ -656,11 +1121,116 @@ class BusinessAccountApi:
         """
         data = {"business_id": business_id, "comment_id": comment_id}
         resp = self._request(verb="POST", path="business/comment/delete/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
         )
 
+    def moderate_comments(
+        self,
+        business_id: str,
+        operation: str,
+        comments: Iterable[Tuple[str, str]],
+        action: Optional[str] = None,
+        max_workers: int = 8,
+        rate_limiter: Optional[TokenBucket] = None,
+        executor: Optional[Executor] = None,
+    ) -> BatchReport:
+        """
+        Apply a moderation operation to many comments concurrently.
+
+        An error for one comment is kept in its result, and will not stop the others.
+
+        >>> report = api.moderate_comments("business_id", "hide", [("video_id", "comment_id")])
+        >>> [r.item for r in report.failed]
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param operation: Operation for the comments, one of hide, delete, like, pin.
+        :param comments: Iterable of (video_id, comment_id) for the comments.
+        :param action: Action for the operation, like UNHIDE. If not set, use the default action of the operation.
+            The delete operation does not take an action.
+        :param max_workers: Max number of concurrent calls.
+        :param rate_limiter: Limiter for the calls in this batch, in addition to the limiter of the api.
+        :param executor: Executor to run the calls. If not set, will use a new thread pool.
+        :return: Report with the result for each comment, in input order.
+            The result item is the (video_id, comment_id) tuple.
+        """
+        if operation not in COMMENT_OPERATIONS:
+            raise PyTiktokError(f"Unknown comment operation: {operation}")
+        method_name, with_video_id, with_action = COMMENT_OPERATIONS[operation]
+        if action is not None and not with_action:
+            raise PyTiktokError(
+                f"Comment operation {operation} does not take an action."
+            )
+        method = getattr(self, method_name)
+
+        def call(item):
+            index, (video_id, comment_id) = item
+            kwargs = {} if action is None else {"action": action}
+            if with_video_id:
+                kwargs["video_id"] = video_id
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            return method(business_id=business_id, comment_id=comment_id, **kwargs)
+
+        comments = list(comments)
+        results = [None] * len(comments)
+        for r in run_batch(
+            call, enumerate(comments), max_workers=max_workers, executor=executor
+        ):
+            index, item = r.item
+            r.item = item
+            results[index] = r
+        return BatchReport(results=results)
+
+    def hide_comments(
+        self, business_id: str, comments: Iterable[Tuple[str, str]], **kwargs
+    ) -> BatchReport:
+        """
+        Hide many comments concurrently. See :meth:`moderate_comments` for the other params.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param comments: Iterable of (video_id, comment_id) for the comments.
+        :return: Report with the result for each comment.
+        """
+        return self.moderate_comments(business_id, "hide", comments, **kwargs)
+
+    def delete_comments(
+        self, business_id: str, comments: Iterable[Tuple[str, str]], **kwargs
+    ) -> BatchReport:
+        """
+        Delete many owned comments concurrently. See :meth:`moderate_comments` for the other params.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param comments: Iterable of (video_id, comment_id) for the comments.
+        :return: Report with the result for each comment.
+        """
+        return self.moderate_comments(business_id, "delete", comments, **kwargs)
+
+    def like_comments(
+        self, business_id: str, comments: Iterable[Tuple[str, str]], **kwargs
+    ) -> BatchReport:
+        """
+        Like many comments concurrently. See :meth:`moderate_comments` for the other params.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param comments: Iterable of (video_id, comment_id) for the comments.
+        :return: Report with the result for each comment.
+        """
+        return self.moderate_comments(business_id, "like", comments, **kwargs)
+
+    def pin_comments(
+        self, business_id: str, comments: Iterable[Tuple[str, str]], **kwargs
+    ) -> BatchReport:
+        """
+        Pin many comments concurrently. See :meth:`moderate_comments` for the other params.
+
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param comments: Iterable of (video_id, comment_id) for the comments.
+        :return: Report with the result for each comment.
+        """
+        return self.moderate_comments(business_id, "pin", comments, **kwargs)
+
     def get_hashtag_suggestions(
         self,
         business_id: str,
@@ -684,7 +1254,7 @@ class BusinessAccountApi:
         resp = self._request(
             verb="GET", path="business/hashtag/suggestion/", params=data
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -719,7 +1289,7 @@ class BusinessAccountApi:
             },
         }
         resp = self._request(verb="POST", path="business/property/add/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -754,7 +1324,7 @@ class BusinessAccountApi:
             },
         }
         resp = self._request(verb="POST", path="business/property/verify/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
@@ -789,7 +1359,7 @@ class BusinessAccountApi:
             },
         }
         resp = self._request(verb="POST", path="business/property/delete/", json=data)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.BusinessBaseResponse.new_from_json_dict(data)
         )
@@ -807,7 +1377,7 @@ class BusinessAccountApi:
         """
         params = {"app_id": app_id}
         resp = self._request(verb="GET", path="business/property/list/", params=params)
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data
             if return_json
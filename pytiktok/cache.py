@@ -0,0 +1,219 @@
+"""
+Response cache for the api requests which are called again and again with the same arguments.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from requests import Response
+
+from pytiktok.codec import JsonCodec, _RESPONSE_ATTR, load_response
+
+# Seconds to keep the responses for the business account api paths.
+BUSINESS_CACHE_TTLS = {
+    "business/get/": 300,  # get_account_data
+    "business/video/settings/": 600,  # get_account_post_privacy
+    "business/property/list/": 300,  # get_url_property_list
+    "tt_user/token_info/get/": 60,  # get_token_info
+}
+# Paths of the write requests, and the cached paths they change.
+BUSINESS_CACHE_INVALIDATIONS = {
+    "business/property/add/": ("business/property/list/",),
+    "business/property/verify/": ("business/property/list/",),
+    "business/property/delete/": ("business/property/list/",),
+    "tt_user/oauth2/revoke/": ("tt_user/token_info/get/",),
+}
+
+
+@dataclass
+class CacheInfo:
+    """
+    Statistics for the cache.
+
+    :param hits: Number of requests served by the cache.
+    :param misses: Number of cacheable requests sent to TikTok.
+    :param evictions: Number of responses removed for the size limit.
+    :param size: Number of responses in the cache.
+    :param maxsize: Max number of responses in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ResponseCache:
+    """
+    Thread safe TTL and LRU cache for the api responses.
+
+    Only successful responses are cached, keyed on method, path, params, json body and access token.
+    The access token is hashed into the key, not kept in the cache.
+
+    >>> api = BusinessAccountApi(access_token="token", cache=ResponseCache(maxsize=512))
+    >>> api.cache.info()
+
+    :param maxsize: Max number of responses, the least recently used one is removed when full.
+    :param ttls: Seconds to keep the responses for each api path, only these paths are cached.
+        Default is ``BUSINESS_CACHE_TTLS``.
+    :param invalidations: Paths of the write requests, and the cached paths they change.
+        Default is ``BUSINESS_CACHE_INVALIDATIONS``.
+    :param timer: Function to get the current seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttls: Optional[Dict[str, float]] = None,
+        invalidations: Optional[Dict[str, Iterable[str]]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self.ttls = dict(BUSINESS_CACHE_TTLS if ttls is None else ttls)
+        self.invalidations = dict(
+            BUSINESS_CACHE_INVALIDATIONS if invalidations is None else invalidations
+        )
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (path, expires, response)
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None,
+        access_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Get the cache key for a request.
+        :param method: HTTP method for the request.
+        :param path: Api path for the request, like business/get/.
+        :param params: Url params for the request.
+        :param json_body: Json body for the request.
+        :param access_token: Access token for the request.
+        :param base_url: Base url with the api version, for the cache shared by api instances.
+        :return: Key, None if the path is not cached.
+        """
+        if path not in self.ttls:
+            return None
+        raw = json.dumps(
+            [method.upper(), base_url, path, params, json_body, access_token],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Response]:
+        """
+        Get the cached response, and count the hit or miss.
+        :param key: Cache key.
+        :return: A copy of the cached response, None if not cached or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] <= self.timer():
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            resp = entry[2]
+        # each caller gets its own response, and decodes its own data.
+        resp = copy.copy(resp)
+        resp.__dict__.pop(_RESPONSE_ATTR, None)
+        return resp
+
+    def set(
+        self,
+        key: str,
+        path: str,
+        response: Response,
+        codec: Optional[JsonCodec] = None,
+    ) -> bool:
+        """
+        Cache the response if it is successful.
+        :param key: Cache key.
+        :param path: Api path for the request.
+        :param response: Response for the request.
+        :param codec: Json codec to check the response.
+        :return: Whether the response is cached.
+        """
+        if response.status_code != 200:
+            return False
+        try:
+            data = load_response(response, codec)
+        except ValueError:
+            return False
+        if not isinstance(data, dict) or data.get("code", 0) != 0:
+            return False
+
+        expires = self.timer() + self.ttls[path]
+        with self._lock:
+            self._data[key] = (path, expires, response)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def invalidate(self, *paths: str) -> int:
+        """
+        Remove the cached responses for the paths, remove all if no path given.
+        :return: Number of responses removed.
+        """
+        with self._lock:
+            if not paths:
+                count = len(self._data)
+                self._data.clear()
+                return count
+            keys = [key for key, entry in self._data.items() if entry[0] in paths]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def invalidate_for_write(self, path: str) -> int:
+        """
+        Remove the cached responses changed by a write request.
+        :param path: Api path for the write request.
+        :return: Number of responses removed.
+        """
+        paths = self.invalidations.get(path)
+        return self.invalidate(*paths) if paths else 0
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses, and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics for the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
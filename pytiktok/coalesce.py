@@ -0,0 +1,163 @@
+"""
+Coalesce the identical concurrent GET requests, so they share one request in flight.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def make_request_key(
+    method: str,
+    url: str,
+    params: Optional[dict] = None,
+    access_token: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Get the key for a request, the requests with same key get the same response.
+    :param method: HTTP method for the request.
+    :param url: Full url for the request.
+    :param params: Url params for the request.
+    :param access_token: Access token for the request.
+    :return: Key, None if the request can not be coalesced, like the not GET requests.
+    """
+    if method.upper() != "GET":
+        return None
+    raw = json.dumps([url, params, access_token], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Thread safe single-flight for the requests.
+
+    The first caller for a key sends the request, the others for the same key in the meantime
+    wait for it, and get a copy of its response, which shares the decoded json data.
+    So the callers must not modify the json data they got.
+
+    >>> coalescer = RequestCoalescer()
+    >>> api = BusinessAccountApi(access_token="token", coalescer=coalescer)
+
+    The coalescer can be shared by many api instances, the access token is a part of the key.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def run(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Call func for the key, or wait for the call in flight for the same key.
+        :param key: Key for the request.
+        :param func: Function to send the request.
+        :return: Response of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.requests += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.copy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class AsyncRequestCoalescer:
+    """
+    Single-flight for the requests of the asyncio api, in one event loop.
+    See :class:`RequestCoalescer`.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    @staticmethod
+    def _is_cancelling() -> bool:
+        task = asyncio.current_task()
+        # the cancel requests of the task can be told only from Python 3.11.
+        cancelling = getattr(task, "cancelling", None)
+        return cancelling is not None and cancelling() > 0
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func for the key, or wait for the call in flight for the same key.
+        If the call in flight is cancelled, the waiters are not cancelled, one of them sends the request again.
+        :param key: Key for the request.
+        :param func: Coroutine function to send the request.
+        :return: Response of the call.
+        """
+        waiting = False
+        while key in self._calls:
+            future = self._calls[key]
+            if not waiting:
+                self.coalesced += 1
+                waiting = True
+            try:
+                # shield the shared call from the cancel of a waiter.
+                return copy.copy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled() or self._is_cancelling():
+                    raise
+                # the leader is cancelled, but not this waiter, send the request again,
+                # or wait for the waiter which sends it.
+        if waiting:
+            self.coalesced -= 1
+
+        self.requests += 1
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # the exception is raised here, not need to be retrieved by waiters.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
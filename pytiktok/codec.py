@@ -0,0 +1,154 @@
+"""
+Pluggable json codec for decoding responses and encoding request bodies.
+
+The stdlib json is the default. Set ``auto`` to use the fastest one installed,
+in the order of orjson, ujson and stdlib json.
+
+>>> set_default_codec("auto")
+>>> api = BusinessAccountApi(access_token="token", json_codec="orjson")
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+from pytiktok.error import PyTiktokError
+
+# attribute to cache the decoded json on the response object.
+_RESPONSE_ATTR = "_pytiktok_json"
+_DECODE_TIME_ATTR = "_pytiktok_decode_time"
+_MISSING = object()
+
+
+class JsonDict(dict):
+    """
+    Dict for the decoded json of a response, which can be weak referenced,
+    so the models in ``weakref`` raw json mode can keep it.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class JsonCodec:
+    """
+    Json codec with the functions to decode and encode.
+
+    :param name: Name for the codec.
+    :param loads: Function to decode ``bytes`` or ``str`` to python object, raises ``ValueError`` for invalid data.
+    :param dumps: Function to encode python object to ``bytes`` in utf-8.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], bytes],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def dumps_str(self, obj: Any) -> str:
+        """
+        Encode python object to ``str``, like the value for url params.
+        """
+        return self.dumps(obj).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"JsonCodec(name={self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # same separators as requests, and keep non-ascii as is.
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+CODECS: Dict[str, JsonCodec] = {"json": JsonCodec("json", json.loads, _stdlib_dumps)}
+if orjson is not None:
+    CODECS["orjson"] = JsonCodec("orjson", orjson.loads, orjson.dumps)
+if ujson is not None:
+    CODECS["ujson"] = JsonCodec(
+        "ujson",
+        ujson.loads,
+        lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"),
+    )
+
+_default_codec = CODECS["json"]
+
+
+def detect_codec() -> JsonCodec:
+    """
+    Get the fastest codec installed.
+    """
+    for name in ("orjson", "ujson", "json"):
+        if name in CODECS:
+            return CODECS[name]
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Get the codec by name.
+    :param codec: Name of the codec, one of json, orjson, ujson, auto, or a codec instance.
+        If not set, return the default codec.
+    :return: Codec
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        return detect_codec()
+    if codec not in CODECS:
+        raise PyTiktokError(
+            f"Json codec {codec} is not available, install it by `pip install {codec}`."
+        )
+    return CODECS[codec]
+
+
+def set_default_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Set the codec used by the api instances which not set their own codec.
+    :param codec: Name of the codec, one of json, orjson, ujson, auto, or a codec instance.
+    :return: The default codec.
+    """
+    global _default_codec
+    _default_codec = get_codec(codec)
+    return _default_codec
+
+
+def load_response(response, codec: Optional[JsonCodec] = None) -> Any:
+    """
+    Decode the json body of the response. The result is cached on the response,
+    so the retry check and ``parse_response`` decode it only once.
+    :param response: Response of requests or httpx.
+    :param codec: Codec to decode, If not set, use the default codec.
+    :return: The json data, the top dict is a :class:`JsonDict`.
+    """
+    data = getattr(response, _RESPONSE_ATTR, _MISSING)
+    if data is _MISSING:
+        content = response.content
+        started = time.perf_counter()
+        data = (codec or _default_codec).loads(content)
+        if type(data) is dict:
+            # only the top dict, the nested data is shared.
+            data = JsonDict(data)
+        setattr(response, _DECODE_TIME_ATTR, time.perf_counter() - started)
+        setattr(response, _RESPONSE_ATTR, data)
+    return data
+
+
+def get_decode_time(response) -> Optional[float]:
+    """
+    Get the seconds used to decode the json body of the response, None if not decoded.
+    """
+    return getattr(response, _DECODE_TIME_ATTR, None)
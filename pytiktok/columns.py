@@ -0,0 +1,217 @@
+"""
+Columnar accumulator for the video metrics, built from the raw page data without the models.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+# Fields of the business account videos, and the type of their columns.
+VIDEO_COLUMN_TYPES = {
+    "item_id": "str",
+    "create_time": "str",
+    "caption": "str",
+    "video_views": "int",
+    "video_duration": "float",
+    "likes": "int",
+    "comments": "int",
+    "shares": "int",
+    "reach": "int",
+    "full_video_watched_rate": "float",
+    "total_time_watched": "float",
+    "average_time_watched": "float",
+}
+DEFAULT_VIDEO_COLUMNS = [
+    "item_id",
+    "video_views",
+    "likes",
+    "comments",
+    "shares",
+    "reach",
+    "full_video_watched_rate",
+    "average_time_watched",
+]
+
+# array typecodes for the numeric columns.
+_TYPECODES = {"int": "q", "float": "d"}
+# value for the missing numbers, the mask of the column tells it is missing.
+_MISSING = {"int": 0, "float": float("nan")}
+
+
+class _Column:
+    __slots__ = ("name", "kind", "values", "valid")
+
+    def __init__(self, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.values: Union[array, list] = (
+            array(_TYPECODES[kind]) if kind in _TYPECODES else []
+        )
+        # bytes of 1 for the present values, created when the first missing value comes.
+        self.valid: Optional[bytearray] = None
+
+    def extend(self, values: list) -> None:
+        if self.kind == "str":
+            # ids and times are kept as they are, None for the missing.
+            self.values.extend(values)
+            return
+        size = len(self.values)
+        if None in values:
+            if self.valid is None:
+                self.valid = bytearray(b"\x01") * size
+            self.valid.extend(0 if v is None else 1 for v in values)
+            missing = _MISSING[self.kind]
+            values = [missing if v is None else v for v in values]
+        elif self.valid is not None:
+            self.valid.extend(b"\x01" * len(values))
+        try:
+            self.values.extend(values)
+        except TypeError:
+            # numbers in other types, like 10.0 for an int column or a string.
+            del self.values[size:]
+            cast = int if self.kind == "int" else float
+            self.values.extend(
+                cast(float(v)) if cast is int else cast(v) for v in values
+            )
+
+
+class VideoColumns:
+    """
+    Accumulate the metrics of the videos to typed columns, page by page,
+    without creating a model for each video.
+
+    The numbers are kept in ``array`` of int64 or float64, so the memory is 8 bytes for each value,
+    and they are given to NumPy or Arrow without converting each value.
+
+    >>> columns = VideoColumns()
+    >>> for page in pages:
+    ...     columns.add_page(page)
+    >>> columns.to_numpy()["video_views"].sum()
+    >>> columns.to_arrow().to_pandas()
+
+    :param columns: Video fields to keep, default is ``DEFAULT_VIDEO_COLUMNS``.
+        The fields are in ``VIDEO_COLUMN_TYPES``.
+    """
+
+    def __init__(self, columns: Optional[Iterable[str]] = None) -> None:
+        names = list(DEFAULT_VIDEO_COLUMNS if columns is None else columns)
+        unknown = [name for name in names if name not in VIDEO_COLUMN_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown video columns: {unknown}")
+        self._columns = [_Column(name, VIDEO_COLUMN_TYPES[name]) for name in names]
+        self.rows = 0
+
+    @property
+    def names(self) -> List[str]:
+        return [column.name for column in self._columns]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def add_page(self, page: Union[dict, list]) -> int:
+        """
+        Add the videos of a page.
+        :param page: Json data of a page, like the return of ``get_account_videos(return_json=True)``,
+            its ``data`` dict, or the list of videos.
+        :return: Number of videos added.
+        """
+        if isinstance(page, dict):
+            page = (page.get("data") or page).get("videos") or []
+        return self.add_videos(page)
+
+    def add_videos(self, videos: List[dict]) -> int:
+        """
+        Add the videos in json data.
+        :param videos: List of the video dicts.
+        :return: Number of videos added.
+        """
+        if not isinstance(videos, list):
+            videos = list(videos)
+        for column in self._columns:
+            name = column.name
+            column.extend([video.get(name) for video in videos])
+        self.rows += len(videos)
+        return len(videos)
+
+    def to_dict(self) -> Dict[str, list]:
+        """
+        Get the columns as lists, with None for the missing values.
+        """
+        result = {}
+        for column in self._columns:
+            values = list(column.values)
+            if column.valid is not None:
+                values = [v if ok else None for v, ok in zip(values, column.valid)]
+            result[column.name] = values
+        return result
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """
+        Get the columns as NumPy arrays.
+
+        The int columns are int64 and the float columns are float64, the str columns are object arrays.
+        The missing floats are NaN. An int column with missing values is a masked array.
+
+        :return: Mapping from the field to its array.
+        """
+        if numpy is None:
+            raise ImportError(
+                "NumPy is not installed, install it by `pip install numpy`."
+            )
+        result = {}
+        for column in self._columns:
+            if column.kind == "str":
+                values = numpy.empty(len(column.values), dtype=object)
+                values[:] = column.values
+            else:
+                # copy from the buffer of the array, not value by value.
+                values = numpy.frombuffer(
+                    column.values, dtype=column.values.typecode
+                ).copy()
+                if column.kind == "int" and column.valid is not None:
+                    mask = numpy.frombuffer(column.valid, dtype=numpy.uint8) == 0
+                    values = numpy.ma.MaskedArray(values, mask=mask)
+            result[column.name] = values
+        return result
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Get the columns as an Arrow table, the missing values are null.
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "PyArrow is not installed, install it by `pip install pyarrow`."
+            )
+        arrays = []
+        for column in self._columns:
+            if column.kind == "str":
+                arrays.append(pyarrow.array(column.values, type=pyarrow.string()))
+                continue
+            kind = pyarrow.int64() if column.kind == "int" else pyarrow.float64()
+            size = len(column.values)
+            bitmap = None
+            if column.valid is not None:
+                # pack the valid bytes to the validity bitmap of arrow.
+                valid = pyarrow.Array.from_buffers(
+                    pyarrow.uint8(),
+                    size,
+                    [None, pyarrow.py_buffer(bytes(column.valid))],
+                )
+                bitmap = pyarrow.compute.not_equal(valid, 0).buffers()[1]
+            # copy the buffer of the array, not value by value, the array can grow after.
+            arrays.append(
+                pyarrow.Array.from_buffers(
+                    kind, size, [bitmap, pyarrow.py_buffer(column.values.tobytes())]
+                )
+            )
+        return pyarrow.Table.from_arrays(arrays, names=self.names)
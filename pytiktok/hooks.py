@@ -0,0 +1,161 @@
+"""
+Lifecycle hooks for the requests, to attach the metrics or tracing.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from pytiktok.codec import JsonCodec, get_decode_time, load_response
+
+Hook = Callable[["RequestEvent"], None]
+
+
+@dataclass
+class RequestEvent:
+    """
+    Event for a request, passed to the hooks.
+
+    The same event is passed to the hooks for a request, the fields are filled as the request goes.
+
+    :param method: HTTP method for the request.
+    :param path: Api path for the request, like business/get/.
+    :param url: Full url for the request.
+    :param bytes_out: Bytes of the request body.
+    :param status: HTTP status code of the response.
+    :param code: Error code in the response body, 0 or None means success.
+    :param request_id: Request id or log id in the response body, for TikTok support.
+    :param bytes_in: Bytes of the response body.
+    :param network_time: Seconds to get the response, including the retries.
+    :param decode_time: Seconds to decode the json data of the response.
+    :param error: The exception if the request failed.
+    :param extra: Dict for the hooks to keep their data, like a span or a start time.
+    """
+
+    method: str
+    path: str
+    url: str
+    bytes_out: int = 0
+    status: Optional[int] = None
+    code: Any = None
+    request_id: Optional[str] = None
+    bytes_in: int = 0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    error: Optional[BaseException] = None
+    extra: dict = field(default_factory=dict, repr=False)
+    _started: float = field(default=0.0, repr=False)
+
+
+def business_response_info(data: dict) -> Tuple[Any, Optional[str]]:
+    """
+    Get the error code and request id from the json data for business account api.
+    """
+    return data.get("code"), data.get("request_id")
+
+
+def kit_response_info(data: dict) -> Tuple[Any, Optional[str]]:
+    """
+    Get the error code and log id from the json data for kit api.
+    """
+    error = data.get("error") or {}
+    log_id = error.get("log_id") or (data.get("extra") or {}).get("logid")
+    return error.get("code"), log_id
+
+
+def _as_list(hooks: Union[Hook, List[Hook], None]) -> List[Hook]:
+    if hooks is None:
+        return []
+    if callable(hooks):
+        return [hooks]
+    return list(hooks)
+
+
+def body_size(body: Any) -> int:
+    """
+    Get the bytes of a request body, 0 if unknown, like the form data.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body) if hasattr(body, "read") else 0
+    except TypeError:
+        return 0
+
+
+class RequestHooks:
+    """
+    Hooks for the request lifecycle of the api instances.
+
+    >>> def log(event):
+    ...     print(event.path, event.status, event.code, event.network_time, event.decode_time)
+    >>> api = BusinessAccountApi(access_token="token", hooks=RequestHooks(after_response=log))
+
+    :param before_request: Functions called with the event before sending the request.
+    :param after_response: Functions called with the event after the response got and decoded.
+    :param on_error: Functions called with the event if the request raised an exception, like a timeout.
+    :param timer: Function to get the current seconds.
+    """
+
+    def __init__(
+        self,
+        before_request: Union[Hook, List[Hook], None] = None,
+        after_response: Union[Hook, List[Hook], None] = None,
+        on_error: Union[Hook, List[Hook], None] = None,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.before_request = _as_list(before_request)
+        self.after_response = _as_list(after_response)
+        self.on_error = _as_list(on_error)
+        self.timer = timer
+
+    def start(self, method: str, path: str, url: str, body: Any = None) -> RequestEvent:
+        """
+        Create the event for a request, and call the before request hooks.
+        """
+        event = RequestEvent(
+            method=method.upper(), path=path, url=url, bytes_out=body_size(body)
+        )
+        for hook in self.before_request:
+            hook(event)
+        event._started = self.timer()
+        return event
+
+    def response(
+        self,
+        event: RequestEvent,
+        response: Any,
+        codec: Optional[JsonCodec] = None,
+        get_info: Callable[[dict], Tuple[Any, Optional[str]]] = business_response_info,
+    ) -> None:
+        """
+        Fill the event by the response, decode the json data, and call the after response hooks.
+        The decoded data is kept on the response, so it is not decoded again by ``parse_response``.
+        """
+        event.network_time = self.timer() - event._started
+        event.status = response.status_code
+        event.bytes_in = len(response.content)
+        decoded = get_decode_time(response)
+        if decoded is not None:
+            # decoded for the retry check, not a part of the network time.
+            event.network_time = max(event.network_time - decoded, 0.0)
+        try:
+            data = load_response(response, codec)
+        except ValueError:
+            data = None
+        event.decode_time = get_decode_time(response) or 0.0
+        if isinstance(data, dict):
+            event.code, event.request_id = get_info(data)
+        for hook in self.after_response:
+            hook(event)
+
+    def error(self, event: RequestEvent, error: BaseException) -> None:
+        """
+        Fill the event by the exception, and call the on error hooks.
+        """
+        event.network_time = self.timer() - event._started
+        event.error = error
+        for hook in self.on_error:
+            hook(event)
@@ -4,20 +4,46 @@ Api impl for tiktok developer
 
 import random
 import string
-from typing import Optional, List, Tuple, Union, IO
+from concurrent.futures import Executor
+from typing import Callable, Optional, List, Tuple, Union, IO, Iterable, Iterator
 
 import requests
 from requests import Request, Response
 
 import pytiktok.models as mds
+from pytiktok.auth import KIT_AUTH_ERROR_CODES, TokenProvider
+from pytiktok.base_api import BaseApi
+from pytiktok.batch import run_batch
+from pytiktok.bulk import (
+    VIDEO_QUERY_MAX_IDS,
+    BulkVideosResult,
+    chunk_ids,
+    finish_videos_result,
+    merge_video_chunk,
+)
+from pytiktok.codec import JsonCodec, get_codec, load_response
 from pytiktok.error import PyTiktokError
-
-
-class KitApi:
+from pytiktok.hooks import RequestHooks, kit_response_info
+from pytiktok.pagination import iter_cursor_items
+from pytiktok.retry import (
+    KIT_RATE_LIMIT_CODES,
+    KIT_RETRY_CODES,
+    RetryPolicy,
+    TokenBucket,
+)
+from pytiktok.session import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from pytiktok.transport import Transport
+from pytiktok.upload import DEFAULT_CHUNK_SIZE, MultipartFileStream
+
+
+class KitApi(BaseApi):
     BASE_URL = "https://open-api.tiktok.com"
     AUTHORIZE_URL = "https://www.tiktok.com/auth/authorize/"
     DEFAULT_SCOPE = "user.info.basic,video.list"
     DEFAULT_REDIRECT_URI = "https://localhost/"
+    RETRY_CODES = KIT_RETRY_CODES
+    RATE_LIMIT_CODES = KIT_RATE_LIMIT_CODES
+    AUTH_ERROR_CODES = KIT_AUTH_ERROR_CODES
 
     def __init__(
         self,
@@ -29,17 +55,59 @@ class KitApi:
         redirect_uri: Optional[str] = None,
         scope: Optional[str] = None,
         base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[int] = 60,
+        json_codec: Union[str, JsonCodec, None] = None,
+        token_provider: Optional[TokenProvider] = None,
+        hooks: Optional[RequestHooks] = None,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = access_token
-        self.session = requests.Session()
+        self._init_transport(
+            transport,
+            session,
+            proxies,
+            http2=http2,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+        )
         self.timeout = timeout
-        self.proxies = proxies
         self.redirect_uri = redirect_uri or self.DEFAULT_REDIRECT_URI
         self.scope = scope or self.DEFAULT_SCOPE
         self.base_url = base_url or self.BASE_URL
 
+        # retry failed requests by the policy, and limit the request rate in client side.
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+
+        # json codec for responses and request bodies, None means the default codec.
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+
+        # lifecycle hooks for the requests, for the metrics or tracing.
+        self.hooks = hooks
+
+        # refresh the access token automatically, opt-in.
+        self.token_provider = token_provider
+        if token_provider is not None:
+            if token_provider.refresh is None:
+                token_provider.refresh = lambda refresh_token: (
+                    self.refresh_access_token(refresh_token, return_json=True).get(
+                        "data"
+                    )
+                    or {}
+                )
+            self.access_token = token_provider.access_token or access_token
+
     @staticmethod
     def generate_state():
         """
@@ -100,7 +168,7 @@ class KitApi:
             },
             enforce_auth=False,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         self.access_token = data.get("data", {}).get("access_token")
         return (
             data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
@@ -127,7 +195,7 @@ class KitApi:
             },
             enforce_auth=False,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         self.access_token = data.get("data", {}).get("access_token")
         return (
             data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
@@ -152,7 +220,7 @@ class KitApi:
             },
             enforce_auth=False,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.KitAccessTokenResponse.new_from_json_dict(data)
         )
@@ -188,7 +256,7 @@ class KitApi:
         resp = self._request(
             path="v0/oauth/get_qrcode", params=params, enforce_auth=False
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return data if return_json else mds.KitQrCodeResponse.new_from_json_dict(data)
 
     def check_qrcode(
@@ -223,7 +291,7 @@ class KitApi:
         resp = self._request(
             path="v0/oauth/check_qrcode", params=params, enforce_auth=False
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return data if return_json else mds.KitQrCodeResponse.new_from_json_dict(data)
 
     def _request(
@@ -235,48 +303,66 @@ class KitApi:
         files: Optional[dict] = None,
         json: Optional[dict] = None,
         enforce_auth: bool = True,
+        headers: Optional[dict] = None,
+        idempotent: Optional[bool] = None,
     ) -> Response:
         """
         Request for TikTok api url
         :param path: The api location for TikTok
         :param verb: HTTP Method, like GET,POST,PUT.
         :param params: The url params to send in the body of the request.
-        :param data: The form data to send in the body of the request.
+        :param data: The form data or a streaming body to send in the body of the request.
         :param files: The form files to send in the body of the request.
         :param json: The json data to send in the body of the request.
         :param enforce_auth: Does the request require authentication.
+        :param headers: Extra headers for the request.
+        :param idempotent: Whether the request only reads data, so it is safe to retry for the server errors.
+            If not set, check the method by the retry policy.
         :return: A json object
         """
-        headers = None
-        if enforce_auth:
-            if not self.access_token:
-                raise PyTiktokError("The request must be authenticated.")
-            if json is not None:
-                json["access_token"] = self.access_token
-            elif params is not None:
-                params["access_token"] = self.access_token
+        access_token = self._get_access_token() if enforce_auth else None
 
+        api_path = path
         if not path.startswith("http"):
             path = f"{self.base_url}/{path}"
 
-        resp = self.session.request(
-            url=path,
-            method=verb,
-            headers=headers,
+        return self._send(
+            verb,
+            path,
+            api_path,
             params=params,
             data=data,
             files=files,
             json=json,
-            timeout=self.timeout,
-            proxies=self.proxies,
+            headers=headers,
+            access_token=access_token,
+            idempotent=idempotent,
         )
 
-        return resp
+    @staticmethod
+    def _get_error_code(data: dict):
+        return (data.get("error") or {}).get("code")
+
+    _get_response_info = staticmethod(kit_response_info)
+
+    def _authorize(self, access_token, headers, params, json):
+        # kit api takes the access token in the json body, or the url params.
+        if json is not None:
+            json = {**json, "access_token": access_token}
+        elif params is not None:
+            params = {**params, "access_token": access_token}
+        return headers, params, json
 
     @staticmethod
-    def parse_response(response: Response) -> dict:
+    def parse_response(response: Response, codec: Optional[JsonCodec] = None) -> dict:
+        """
+        Decode the response and raise the TikTok error in it.
+        :param response: Response for the request.
+        :param codec: Json codec to decode the response. If not set, use the default codec.
+        :return: The json data.
+        """
         try:
-            data = response.json()
+            data = load_response(response, codec)
         except ValueError:
             raise PyTiktokError(f"Unknown error: {response.text}")
         if "error" in data and data["error"].get("code") != 0:
@@ -305,8 +391,9 @@ class KitApi:
                 "open_id": open_id,
                 "fields": fields,
             },
+            idempotent=True,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return data if return_json else mds.KitUserResponse.new_from_json_dict(data)
 
     def get_user_videos(
@@ -339,10 +426,40 @@ class KitApi:
         resp = self._request(
             path="video/list/",
             json=data,
+            idempotent=True,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return data if return_json else mds.KitVideosResponse.new_from_json_dict(data)
 
+    def iter_user_videos(
+        self,
+        open_id: str,
+        fields: Optional[List[str]] = None,
+        max_count: int = 20,
+        limit: Optional[int] = None,
+    ) -> Iterator[mds.KitVideo]:
+        """
+        Iterate over given user's public TikTok video posts, the pages are requested when needed.
+
+        :param open_id: The TikTok user's unique identifier.
+        :param fields: The set of optional video metadata.
+        :param max_count: The maximum number of videos that will be returned from each page. Maximum is 20.
+        :param limit: The maximum number of videos to iterate. If not set, iterate all videos.
+        :return: Video iterator.
+        """
+        return iter_cursor_items(
+            fetch_page=lambda cursor: self.get_user_videos(
+                open_id=open_id,
+                fields=fields,
+                cursor=cursor,
+                max_count=max_count,
+                return_json=True,
+            ),
+            items_key="videos",
+            model=mds.KitVideo,
+            limit=limit,
+        )
+
     def query_videos(
         self,
         open_id: str,
@@ -366,15 +483,62 @@ class KitApi:
         resp = self._request(
             path="video/query/",
             json=data,
+            idempotent=True,
         )
-        data = self.parse_response(resp)
+        data = self.parse_response(resp, self.json_codec)
         return data if return_json else mds.KitVideosResponse.new_from_json_dict(data)
 
+    def query_videos_bulk(
+        self,
+        open_id: str,
+        video_ids: Iterable[str],
+        fields: Optional[List[str]] = None,
+        max_workers: int = 4,
+        executor: Optional[Executor] = None,
+    ) -> BulkVideosResult:
+        """
+        Query video data for any number of video ids.
+
+        The ids are de-duplicated and split into chunks of 20, the chunks are sent concurrently on a thread pool.
+
+        >>> result = api.query_videos_bulk(open_id="open_id", video_ids=video_ids, fields=["id", "view_count"])
+        >>> result.videos["6963640889373723909"].view_count
+
+        :param open_id: The TikTok user's unique identifier.
+        :param video_ids: Video ids to query.
+        :param fields: The set of optional video metadata. ``id`` is always requested.
+        :param max_workers: Max number of concurrent calls.
+        :param executor: Executor to run the calls. If not set, will use a new thread pool.
+        :return: Videos by id, the missing ids, and the errors for the failed chunks.
+        """
+        if fields is None:
+            fields = ["id", "create_time", "duration", "share_url"]
+        elif "id" not in fields:
+            fields = ["id", *fields]
+        chunks = chunk_ids(video_ids, VIDEO_QUERY_MAX_IDS)
+
+        def call(chunk):
+            return self.query_videos(
+                open_id=open_id,
+                filters={"video_ids": chunk},
+                fields=fields,
+                return_json=True,
+            )
+
+        result = BulkVideosResult()
+        for r in run_batch(call, chunks, max_workers=max_workers, executor=executor):
+            merge_video_chunk(result, r.item, data=r.result, error=r.error)
+        finish_videos_result(result, chunks)
+        return result
+
     def share_video(
         self,
         open_id: str,
         video: IO,
         return_json: bool = False,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Callable[[int, int], None]] = None,
     ) -> Union[mds.KitShareVideoResponse, dict]:
         """
         Share Video API allows users to share videos from your Web or Desktop app into TikTok.
@@ -382,14 +546,28 @@ class KitApi:
         :param open_id: The TikTok user's unique identifier.
         :param video: The video file obj.
         :param return_json: Type for returned data. If you set True JSON data will be returned.
+        :param stream: Whether to upload the video chunk by chunk, so the memory not grows with the video size.
+        :param chunk_size: Max bytes read from the video at a time for the streaming upload.
+        :param progress: Function called with the bytes sent and the video size, it enables the streaming upload.
         :return: Share response.
         """
-        resp = self._request(
-            path="share/video/upload/",
-            params={"open_id": open_id},
-            files={"video": video},
-        )
-        data = self.parse_response(resp)
+        if not stream and progress is None:
+            resp = self._request(
+                path="share/video/upload/",
+                params={"open_id": open_id},
+                files={"video": video},
+            )
+        else:
+            with MultipartFileStream(
+                "video", video, chunk_size=chunk_size, progress=progress
+            ) as body:
+                resp = self._request(
+                    path="share/video/upload/",
+                    params={"open_id": open_id},
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                )
+        data = self.parse_response(resp, self.json_codec)
         return (
             data if return_json else mds.KitShareVideoResponse.new_from_json_dict(data)
         )
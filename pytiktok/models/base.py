@@ -1,3 +1,5 @@
+import warnings
+import weakref
 from dataclasses import dataclass
 from typing import (
     Dict,
@@ -10,24 +12,112 @@ from dataclasses_json import (
     DataClassJsonMixin,
 )
 
+from .decoder import get_decoder
+
 A = TypeVar("A", bound=DataClassJsonMixin)
 
+# Modes to keep the origin json data for model instance.
+RAW_JSON_OFF = "off"  # not keep, default.
+RAW_JSON_REF = "ref"  # keep a reference, the data lives as long as the instance.
+# keep a weak reference, like the JsonDict decoded from a response, the raw json is None
+# once the data has gone, or the data can not be weak referenced, like a builtin dict.
+RAW_JSON_WEAKREF = "weakref"
+RAW_JSON_MODES = (RAW_JSON_OFF, RAW_JSON_REF, RAW_JSON_WEAKREF)
+
 
 @dataclass
 class BaseModel(DataClassJsonMixin):
+    # Use the generated decoder instead of dataclasses-json from_dict.
+    use_fast_decoder = True
+    # Default mode to keep the origin json data, can be set for all models or a model class.
+    raw_json_mode = RAW_JSON_OFF
+    # Return the compact version of the model, which stores the fields in __slots__.
+    use_compact_model = False
+    # Decode the nested models at the first access.
+    use_lazy_decoding = False
+
     @classmethod
     def new_from_json_dict(
-        cls: Type[A], data: Optional[Dict], *, infer_missing=False
+        cls: Type[A],
+        data: Optional[Dict],
+        *,
+        infer_missing=False,
+        raw_json: Optional[str] = None,
+        compact: Optional[bool] = None,
+        lazy: Optional[bool] = None,
     ) -> Optional[A]:
         """
         Convert json dict to data class
         :param data: A json dict which will convert model class.
         :param infer_missing: if set True, will let missing field (not have default vale) to None
+        :param raw_json: Mode to keep the origin data for the instance, one of off, ref, weakref.
+            If not set, use the raw_json_mode of the class.
+        :param compact: If set True, return the compact version of the model.
+            If not set, use the use_compact_model of the class.
+        :param lazy: If set True, decode the nested models at the first access. Not work with compact.
+            If not set, use the use_lazy_decoding of the class.
         :return: The data class
         """
         if not data:
             return None
-        c = cls.from_dict(data, infer_missing=infer_missing)
-        # save origin data
-        cls._json = data
+        if compact if compact is not None else cls.use_compact_model:
+            from .compact import compact_model
+
+            return compact_model(cls).new_from_json_dict(
+                data,
+                infer_missing=infer_missing,
+                raw_json=raw_json or cls.raw_json_mode,
+            )
+        c = None
+        decoder = None
+        if lazy if lazy is not None else cls.use_lazy_decoding:
+            from .lazy import get_lazy_decoder
+
+            decoder = get_lazy_decoder(cls)
+        if decoder is None and cls.use_fast_decoder:
+            decoder = get_decoder(cls)
+        if decoder is not None:
+            try:
+                c = decoder(data)
+            except Exception:
+                # data not in expected shape, let dataclasses-json handle it.
+                pass
+        if c is None:
+            c = cls.from_dict(data, infer_missing=infer_missing)
+        c._keep_raw_json(data, raw_json or cls.raw_json_mode)
         return c
+
+    def _keep_raw_json(self, data: Dict, mode: str) -> None:
+        if mode == RAW_JSON_OFF:
+            return
+        if mode == RAW_JSON_REF:
+            self._raw_json = data
+        elif mode == RAW_JSON_WEAKREF:
+            try:
+                self._raw_json = weakref.ref(data)
+            except TypeError:
+                # builtin dict not support weak reference, not keep it.
+                warnings.warn(
+                    "Builtin dict can not be weak referenced, raw_json of the model is None. "
+                    "Use the ref mode, or give the data as a JsonDict.",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+        else:
+            raise ValueError(f"Unknown raw json mode: {mode}")
+
+    @property
+    def raw_json(self) -> Optional[Dict]:
+        """
+        The origin json data for the instance.
+        None if the raw json mode is off, or the weak referenced data has gone.
+        """
+        raw = getattr(self, "_raw_json", None)
+        if raw is None or isinstance(raw, dict):
+            return raw
+        return raw()
+
+    @property
+    def _json(self) -> Optional[Dict]:
+        # Keep for compatibility, use raw_json instead.
+        return self.raw_json
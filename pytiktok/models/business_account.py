@@ -158,7 +158,7 @@ class BusinessVideo(BaseModel):
     full_video_watched_rate: Optional[float] = field(default=None, repr=False)
     total_time_watched: Optional[float] = field(default=None, repr=False)
     average_time_watched: Optional[float] = field(default=None, repr=False)
-    impression_sources: Optional[BusinessVideoImpressionSource] = field(
+    impression_sources: Optional[List[BusinessVideoImpressionSource]] = field(
         default=None, repr=False
     )
     audience_countries: Optional[List[BusinessVideoAudienceCountry]] = field(
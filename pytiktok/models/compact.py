@@ -0,0 +1,135 @@
+"""
+Compact versions of the models, for keeping many records in memory.
+
+The models inherit ``DataClassJsonMixin`` which has no ``__slots__``, so every instance
+carries a ``__dict__``. A compact model has the same fields and methods, but stores the
+fields in ``__slots__``, which takes much less memory for each instance.
+
+Compact models are generated on demand, nested models are converted to their compact versions too.
+They are registered as virtual subclasses of the origin models, so ``isinstance`` checks still work.
+
+>>> Comment = compact_model(BusinessComment)
+>>> comment = BusinessComment.new_from_json_dict(data, compact=True)
+"""
+
+import dataclasses
+import typing
+from typing import ForwardRef, Type
+
+from dataclasses_json import DataClassJsonMixin
+
+from .base import BaseModel, RAW_JSON_OFF
+
+_ATTR = "_compact_model"
+
+
+class CompactModel:
+    """
+    Base class for the compact models, has the methods of ``BaseModel`` without a ``__dict__``.
+    """
+
+    __slots__ = ("_raw_json",)
+
+    dataclass_json_config = None
+    use_fast_decoder = True
+    use_compact_model = False
+    use_lazy_decoding = False
+    raw_json_mode = RAW_JSON_OFF
+
+    to_json = DataClassJsonMixin.to_json
+    from_json = DataClassJsonMixin.__dict__["from_json"]
+    from_dict = DataClassJsonMixin.__dict__["from_dict"]
+    to_dict = DataClassJsonMixin.to_dict
+    schema = DataClassJsonMixin.__dict__["schema"]
+    new_from_json_dict = BaseModel.__dict__["new_from_json_dict"]
+    _keep_raw_json = BaseModel._keep_raw_json
+    raw_json = BaseModel.raw_json
+    _json = BaseModel._json
+
+
+def _compact_type(tp):
+    """
+    Replace the models in the type by forward references to their compact versions,
+    which are resolved in this module when the type hints are needed.
+    """
+    if dataclasses.is_dataclass(tp) and isinstance(tp, type):
+        if issubclass(tp, BaseModel):
+            return ForwardRef(compact_model(tp).__name__)
+        return tp
+    args = getattr(tp, "__args__", None)
+    origin = getattr(tp, "__origin__", None)
+    if not args or origin is None:
+        return tp
+    args = tuple(_compact_type(arg) for arg in args)
+    if origin is typing.Union:
+        return typing.Union[args]
+    if origin is list:
+        return typing.List[args]
+    if origin is dict:
+        return typing.Dict[args]
+    return tp
+
+
+def _add_slots(cls: type) -> type:
+    """
+    Recreate the dataclass with slots, as ``dataclass(slots=True)`` of python 3.10 does.
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in names:
+        # the defaults are kept in the fields and __init__.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def compact_model(cls: Type[BaseModel]) -> type:
+    """
+    Get the compact version of the model class, generate it at the first time.
+    :param cls: Model class.
+    :return: Compact model class.
+    """
+    if issubclass(cls, CompactModel):
+        return cls
+    if _ATTR in cls.__dict__:
+        return cls.__dict__[_ATTR]
+
+    hints = typing.get_type_hints(cls)
+    fields = dataclasses.fields(cls)
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": cls.__name__,
+        "__doc__": cls.__doc__,
+        # the real types are set later.
+        "__annotations__": {f.name: typing.Any for f in fields},
+    }
+    for f in fields:
+        namespace[f.name] = dataclasses.field(
+            default=f.default,
+            default_factory=f.default_factory,
+            init=f.init,
+            repr=f.repr,
+            compare=f.compare,
+        )
+    compact = _add_slots(
+        dataclasses.dataclass(type(cls.__name__, (CompactModel,), namespace))
+    )
+    cls.register(compact)
+    # cache and publish before converting field types, so self referencing models end here.
+    setattr(cls, _ATTR, compact)
+    globals()[compact.__name__] = compact
+
+    for f in dataclasses.fields(compact):
+        f.type = _compact_type(hints[f.name])
+        compact.__annotations__[f.name] = f.type
+    return compact
+
+
+def is_compact(obj) -> bool:
+    """
+    Check whether the object or class is a compact model.
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    return issubclass(cls, CompactModel)
@@ -0,0 +1,146 @@
+"""
+Fast path decoders for the models.
+
+``DataClassJsonMixin.from_dict`` resolves the type hints of every field on every call.
+Here a decoder function is generated once for each model class, and cached on the class.
+The generated code has the same conversions as dataclasses-json for the field types used
+by the models: ``int``, ``float``, ``str``, ``bool``, nested dataclasses, ``List`` and ``Optional`` of them.
+
+Classes with other field types or dataclasses-json configs have no fast decoder, and
+data not in the expected shape raises from the decoder, so the caller can fall back to ``from_dict``.
+"""
+
+import dataclasses
+import typing
+from typing import Any, Callable, Optional, Set
+
+_PRIMITIVES = (int, float, str, bool)
+_NONE_TYPE = type(None)
+_ATTR = "_fast_decoder"
+# classes in compiling, to find the self referencing models.
+_compiling: Set[type] = set()
+
+
+def _keep(value):
+    """
+    Value already decoded is kept as dataclasses-json does, others are unexpected.
+    """
+    if dataclasses.is_dataclass(value):
+        return value
+    raise TypeError(f"Unexpected value {value!r}")
+
+
+def _unwrap_optional(tp):
+    if getattr(tp, "__origin__", None) is typing.Union:
+        args = [arg for arg in tp.__args__ if arg is not _NONE_TYPE]
+        if len(args) == 1 and len(tp.__args__) == 2:
+            return args[0]
+    return tp
+
+
+def _nested_decoder(tp) -> Callable[[dict], Any]:
+    if tp in _compiling:
+        # self reference, look up the decoder when called.
+        return lambda value: (get_decoder(tp) or tp.from_dict)(value)
+    decoder = get_decoder(tp)
+    if decoder is None:
+        return lambda value: tp.from_dict(value)
+    return decoder
+
+
+def _is_model(tp) -> bool:
+    return dataclasses.is_dataclass(tp) and isinstance(tp, type)
+
+
+def _value_expr(
+    tp, var: str, ns: dict, nested: Callable[[type], Callable] = _nested_decoder
+) -> Optional[str]:
+    """
+    Get the expression to convert a not None value for the type.
+    :param nested: Function to get the decoder for nested dataclasses.
+    :return: expression, None if the type is not supported.
+    """
+    tp = _unwrap_optional(tp)
+    if tp in _PRIMITIVES:
+        return f"{var} if isinstance({var}, {tp.__name__}) else {tp.__name__}({var})"
+    if _is_model(tp):
+        name = f"_decode_{len(ns)}"
+        ns[name] = nested(tp)
+        return f"{name}({var}) if {var}.__class__ is dict else _keep({var})"
+    if getattr(tp, "__origin__", None) is list:
+        (item_type,) = getattr(tp, "__args__", None) or (typing.Any,)
+        item_type = _unwrap_optional(item_type)
+        item = _value_expr(item_type, "_x", ns, nested)
+        if item is None:
+            return None
+        if item_type not in _PRIMITIVES:
+            item = f"None if _x is None else {item}"
+        return f"[{item} for _x in {var}] if {var}.__class__ is list else _keep({var})"
+    return None
+
+
+def _supported(cls) -> bool:
+    if getattr(cls, "dataclass_json_config", None):
+        return False
+    for f in dataclasses.fields(cls):
+        if f.metadata.get("dataclasses_json"):
+            return False
+    return True
+
+
+def build_decoder(cls) -> Optional[Callable[[dict], Any]]:
+    """
+    Generate the decoder for the model class.
+    :param cls: Model class.
+    :return: Decoder function, None if the class is not supported.
+    """
+    if not _supported(cls):
+        return None
+    try:
+        hints = typing.get_type_hints(cls)
+    except (NameError, TypeError):
+        return None
+
+    ns = {"cls": cls, "_keep": _keep}
+    lines, kwargs = [], []
+    for i, f in enumerate(dataclasses.fields(cls)):
+        if not f.init:
+            continue
+        var = f"_v{i}"
+        if f.default is not dataclasses.MISSING:
+            ns[f"_default{i}"] = f.default
+            lines.append(f"    {var} = data.get({f.name!r}, _default{i})")
+        elif f.default_factory is not dataclasses.MISSING:
+            return None
+        else:
+            lines.append(f"    {var} = data[{f.name!r}]")
+        expr = _value_expr(hints[f.name], var, ns)
+        if expr is None:
+            return None
+        kwargs.append(f"        {f.name}=None if {var} is None else ({expr}),")
+
+    source = "\n".join(
+        ["def decode(data):", *lines, "    return cls(", *kwargs, "    )"]
+    )
+    exec(compile(source, f"<decoder {cls.__qualname__}>", "exec"), ns)
+    decode = ns["decode"]
+    decode.__source__ = source
+    return decode
+
+
+def get_decoder(cls) -> Optional[Callable[[dict], Any]]:
+    """
+    Get the cached decoder for the model class, generate it at the first time.
+    :param cls: Model class.
+    :return: Decoder function, None if the class is not supported.
+    """
+    # only look up the class itself, subclasses have different fields.
+    if _ATTR in cls.__dict__:
+        return cls.__dict__[_ATTR]
+    _compiling.add(cls)
+    try:
+        decoder = build_decoder(cls)
+    finally:
+        _compiling.discard(cls)
+    setattr(cls, _ATTR, decoder)
+    return decoder
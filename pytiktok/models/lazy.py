@@ -0,0 +1,184 @@
+"""
+Lazy decoding for the models.
+
+A lazy model is a subclass of the model, the fields of primitive types are decoded at once,
+but the fields of nested models, or lists of them, keep the origin data, and are decoded
+at the first access. The nested models are lazy too. So for a wide page of which only some
+fields are read, the models not read are never built.
+
+Two threads reading the same field at the first time may both decode it, and the last one is kept.
+
+>>> resp = BusinessVideosResponse.new_from_json_dict(data, lazy=True)
+>>> resp.data.videos[0].video_views  # audience_countries and impression_sources are not decoded.
+"""
+
+import dataclasses
+import typing
+from typing import Any, Callable, Optional
+
+from .decoder import _is_model, _keep, _unwrap_optional, _value_expr, get_decoder
+
+_ATTR = "_lazy_decoder"
+_MODEL_ATTR = "_lazy_model"
+# key in instance __dict__ for the origin data of the nested fields.
+_RAW = "_lazy_raw"
+
+
+class LazyField:
+    """
+    Non-data descriptor which decodes the field from the origin data at the first access,
+    and saves the value into the instance ``__dict__``, so the later access not come here.
+    """
+
+    def __init__(self, model: type, name: str, default: Any, decode: Callable):
+        self.model = model
+        self.name = name
+        self.default = default
+        self.decode = decode
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self.default
+        raw = obj.__dict__.get(_RAW) or {}
+        if self.name not in raw:
+            value = self.default
+        else:
+            try:
+                value = self.decode(raw[self.name])
+            except Exception:
+                # data not in expected shape, let dataclasses-json handle it like the normal models,
+                # which raises here if it can not.
+                value = getattr(
+                    self.model.from_dict(
+                        {self.name: raw[self.name]}, infer_missing=True
+                    ),
+                    self.name,
+                )
+        obj.__dict__[self.name] = value
+        return value
+
+
+def _has_model(tp) -> bool:
+    tp = _unwrap_optional(tp)
+    if _is_model(tp):
+        return True
+    if getattr(tp, "__origin__", None) is list:
+        return any(_has_model(arg) for arg in getattr(tp, "__args__", None) or ())
+    return False
+
+
+def _decode_nested(tp) -> Callable[[dict], Any]:
+    # look up the decoder when called, so self referencing models work.
+    return lambda value: (get_lazy_decoder(tp) or get_decoder(tp) or tp.from_dict)(
+        value
+    )
+
+
+def _field_decoder(hint, ns: dict) -> Optional[Callable[[Any], Any]]:
+    expr = _value_expr(hint, "v", ns, nested=_decode_nested)
+    if expr is None:
+        return None
+    source = f"def decode(v):\n    return None if v is None else ({expr})"
+    exec(compile(source, "<lazy field decoder>", "exec"), ns)
+    return ns.pop("decode")
+
+
+def _lazy_eq(self, other):
+    model = type(self).__dict__[_MODEL_ATTR]
+    if other.__class__ is not self.__class__ and other.__class__ is not model:
+        return NotImplemented
+    names = [f.name for f in dataclasses.fields(model) if f.compare]
+    return [getattr(self, n) for n in names] == [getattr(other, n) for n in names]
+
+
+def build_lazy_decoder(cls) -> Optional[Callable[[dict], Any]]:
+    """
+    Generate the lazy decoder for the model class.
+    :param cls: Model class.
+    :return: Decoder function returns the lazy model, None if the class is not supported.
+    """
+    if get_decoder(cls) is None:
+        return None
+    hints = typing.get_type_hints(cls)
+    fields = [f for f in dataclasses.fields(cls) if f.init]
+    if not any(_has_model(hints[f.name]) for f in fields):
+        # nothing to be lazy.
+        return None
+
+    ns = {"_new": object.__new__, "_keep": _keep}
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": cls.__name__,
+        "__doc__": cls.__doc__,
+        "__eq__": _lazy_eq,
+        "__hash__": cls.__hash__,
+    }
+    lines = ["    obj = _new(lazy)", "    d = obj.__dict__", "    raw = {}"]
+    for i, f in enumerate(fields):
+        var = f"_v{i}"
+        has_default = f.default is not dataclasses.MISSING
+        if has_default:
+            ns[f"_default{i}"] = f.default
+            lines.append(f"    {var} = data.get({f.name!r}, _default{i})")
+        else:
+            lines.append(f"    {var} = data[{f.name!r}]")
+
+        hint = hints[f.name]
+        if _has_model(hint):
+            decode = _field_decoder(hint, ns)
+            if decode is None:
+                return None
+            namespace[f.name] = LazyField(
+                model=cls,
+                name=f.name,
+                default=f.default if has_default else None,
+                decode=decode,
+            )
+            keep = (
+                f"{var} is None or {var} is _default{i}"
+                if has_default
+                else f"{var} is None"
+            )
+            lines.append(f"    if {keep}:")
+            lines.append(f"        d[{f.name!r}] = {var}")
+            lines.append("    else:")
+            lines.append(f"        raw[{f.name!r}] = {var}")
+        else:
+            expr = _value_expr(hint, var, ns)
+            if expr is None:
+                return None
+            lines.append(f"    d[{f.name!r}] = None if {var} is None else ({expr})")
+    lines.append(f"    d[{_RAW!r}] = raw")
+    lines.append("    return obj")
+
+    lazy = type(cls.__name__, (cls,), namespace)
+    setattr(lazy, _MODEL_ATTR, cls)
+    ns["lazy"] = lazy
+    # published for pickle.
+    globals()[lazy.__name__] = lazy
+
+    source = "\n".join(["def decode(data):", *lines])
+    exec(compile(source, f"<lazy decoder {cls.__qualname__}>", "exec"), ns)
+    decode = ns["decode"]
+    decode.__source__ = source
+    return decode
+
+
+def get_lazy_decoder(cls) -> Optional[Callable[[dict], Any]]:
+    """
+    Get the cached lazy decoder for the model class, generate it at the first time.
+    :param cls: Model class.
+    :return: Decoder function, None if the class is not supported.
+    """
+    if _ATTR in cls.__dict__:
+        return cls.__dict__[_ATTR]
+    decoder = build_lazy_decoder(cls)
+    setattr(cls, _ATTR, decoder)
+    return decoder
+
+
+def is_lazy(obj) -> bool:
+    """
+    Check whether the object is a lazy model.
+    """
+    return _MODEL_ATTR in type(obj).__dict__
@@ -0,0 +1,109 @@
+"""
+Helpers for cursor based pagination.
+"""
+
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from pytiktok.codec import JsonDict
+from pytiktok.models.base import RAW_JSON_WEAKREF, BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _page_items(page: dict, items_key: str):
+    data = page.get("data") or {}
+    return data.get(items_key) or [], data.get("has_more"), data.get("cursor")
+
+
+def _keep_items(items: list, model: Type[M]) -> list:
+    if model.raw_json_mode == RAW_JSON_WEAKREF:
+        # the items in the page are kept as JsonDict, so the models can weak reference them
+        # while the page is alive.
+        items[:] = [JsonDict(item) if type(item) is dict else item for item in items]
+    return items
+
+
+def iter_cursor_pages(
+    fetch_page: Callable[[Optional[int]], dict],
+    items_key: str,
+    limit: Optional[int] = None,
+) -> Iterator[list]:
+    """
+    Iterate over the pages of a cursor based endpoint, yield the raw items list of each page.
+
+    :param fetch_page: Function to get the json data for a page by the cursor.
+        The first page will be requested with cursor None.
+    :param items_key: The key for items list in the page data, like videos, comments.
+    :param limit: Max number of items to yield, the last page is cut. None means all items.
+    :return: Items list iterator
+    """
+    if limit is not None and limit <= 0:
+        return
+    count, cursor = 0, None
+    while True:
+        items, has_more, next_cursor = _page_items(fetch_page(cursor), items_key)
+        if limit is not None and count + len(items) >= limit:
+            yield items[: limit - count]
+            return
+        yield items
+        count += len(items)
+        # stop if the cursor not move, to avoid requesting the same page forever.
+        if not has_more or next_cursor is None or next_cursor == cursor:
+            return
+        cursor = next_cursor
+
+
+def iter_cursor_items(
+    fetch_page: Callable[[Optional[int]], dict],
+    items_key: str,
+    model: Type[M],
+    limit: Optional[int] = None,
+) -> Iterator[M]:
+    """
+    Iterate over all items of a cursor based endpoint, page by page.
+
+    Only one page is kept in memory, and each item is converted to model when it is yielded.
+    In the weakref raw json mode of the model, the ``raw_json`` of an item is kept while its page is in memory.
+
+    :param fetch_page: Function to get the json data for a page by the cursor.
+        The first page will be requested with cursor None.
+    :param items_key: The key for items list in the page data, like videos, comments.
+    :param model: The model class for item.
+    :param limit: Max number of items to yield. None means all items.
+    :return: Item iterator
+    """
+    for items in iter_cursor_pages(fetch_page, items_key, limit=limit):
+        for item in _keep_items(items, model):
+            yield model.new_from_json_dict(item)
+
+
+async def aiter_cursor_items(
+    fetch_page: Callable[[Optional[int]], Awaitable[dict]],
+    items_key: str,
+    model: Type[M],
+    limit: Optional[int] = None,
+) -> AsyncIterator[M]:
+    """
+    Asyncio version of :func:`iter_cursor_items`.
+    """
+    if limit is not None and limit <= 0:
+        return
+    count, cursor = 0, None
+    while True:
+        items, has_more, next_cursor = _page_items(await fetch_page(cursor), items_key)
+        for item in _keep_items(items, model):
+            yield model.new_from_json_dict(item)
+            count += 1
+            if limit is not None and count >= limit:
+                return
+        if not has_more or next_cursor is None or next_cursor == cursor:
+            return
+        cursor = next_cursor
@@ -0,0 +1,255 @@
+"""
+Publish pipeline, which polls the publishing status for the posts until they are done.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+import pytiktok.models as mds
+from pytiktok.batch import run_batch
+from pytiktok.error import PyTiktokError
+
+# Final statuses for a post publishing task.
+PUBLISH_COMPLETE_STATUSES = frozenset({"PUBLISH_COMPLETE"})
+PUBLISH_FAILED_STATUSES = frozenset({"FAILED"})
+
+
+class PublishFailed(PyTiktokError):
+    """
+    The post publishing task failed.
+
+    :param publish_id: Id for the publishing task.
+    :param status: The final publish status, has the failed reason.
+    """
+
+    def __init__(self, publish_id: str, status: mds.BusinessPublishStatus) -> None:
+        super().__init__(f"Publish {publish_id} failed: {status.reason}")
+        self.publish_id = publish_id
+        self.status = status
+
+
+class PublishTimeout(PyTiktokError):
+    """
+    The post publishing task is not done in the timeout.
+
+    :param publish_id: Id for the publishing task.
+    :param status: The last publish status, None if never got.
+    """
+
+    def __init__(
+        self, publish_id: str, status: Optional[mds.BusinessPublishStatus]
+    ) -> None:
+        last = status.status if status is not None else None
+        super().__init__(f"Publish {publish_id} timed out, last status: {last}")
+        self.publish_id = publish_id
+        self.status = status
+
+
+class PublishHandle(Future):
+    """
+    Future for a post publishing task.
+
+    Resolves to the final :class:`BusinessPublishStatus` with ``post_ids``,
+    or raises :class:`PublishFailed`, :class:`PublishTimeout`, or the error for the status requests.
+
+    :param api: The api to get the publishing status.
+    :param business_id: Application specific unique identifier for the TikTok account.
+    :param publish_id: Id for the publishing task, the ``share_id`` in publish response.
+    """
+
+    def __init__(self, api: Any, business_id: str, publish_id: str) -> None:
+        super().__init__()
+        self.api = api
+        self.business_id = business_id
+        self.publish_id = publish_id
+        # the last status got, and the number of status requests.
+        self.status: Optional[mds.BusinessPublishStatus] = None
+        self.polls = 0
+        self._interval = 0.0
+        self._deadline = 0.0
+        self._errors = 0
+
+    def __repr__(self) -> str:
+        last = self.status.status if self.status is not None else None
+        return f"<PublishHandle publish_id={self.publish_id} status={last} done={self.done()}>"
+
+
+class PublishPoller:
+    """
+    Poll the publishing status for many posts in one background thread.
+
+    The interval for a post starts short and grows after each check, so a fast post is found soon,
+    and a slow one not wastes calls. The checks due at the same time are sent together on a thread pool.
+    The thread exits when no post is waiting, and starts again for the next post.
+
+    >>> poller = PublishPoller(initial_interval=2, max_interval=30)
+    >>> handle = api.publish_video(business_id, video_url, post_info={}, poller=poller)
+    >>> handle.result().post_ids
+
+    :param initial_interval: Seconds to wait before the first check.
+    :param max_interval: Max seconds between two checks.
+    :param backoff_factor: Factor for the interval after each check.
+    :param timeout: Max seconds to wait for a post.
+    :param max_workers: Max number of concurrent status requests.
+    :param max_errors: Max consecutive errors for the status requests of a post.
+    :param timer: Function to get the current seconds.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        timeout: float = 900.0,
+        max_workers: int = 4,
+        max_errors: int = 3,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError(
+                "intervals must be greater than 0, and max not less than initial"
+            )
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must not be less than 1")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_errors = max_errors
+        self.timer = timer
+        self._cond = threading.Condition()
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of posts waiting to check.
+        """
+        with self._cond:
+            return len(self._queue)
+
+    def submit(self, api: Any, business_id: str, publish_id: str) -> PublishHandle:
+        """
+        Wait for a post publishing task.
+        :param api: The api to get the publishing status.
+        :param business_id: Application specific unique identifier for the TikTok account.
+        :param publish_id: Id for the publishing task.
+        :return: Handle for the post.
+        """
+        handle = PublishHandle(api, business_id, publish_id)
+        handle._interval = self.initial_interval
+        handle._deadline = self.timer() + self.timeout
+        with self._cond:
+            self._schedule(handle)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pytiktok-publish-poller", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return handle
+
+    def _schedule(self, handle: PublishHandle) -> None:
+        due = min(self.timer() + handle._interval, handle._deadline)
+        heapq.heappush(self._queue, (due, next(self._seq), handle))
+
+    def _take_due(self) -> Optional[List[PublishHandle]]:
+        with self._cond:
+            while True:
+                if not self._queue:
+                    # no post is waiting, exit the thread.
+                    self._thread = None
+                    return None
+                wait = self._queue[0][0] - self.timer()
+                if wait <= 0:
+                    break
+                self._cond.wait(wait)
+            due = []
+            now = self.timer()
+            while self._queue and self._queue[0][0] <= now:
+                handle = heapq.heappop(self._queue)[2]
+                if not handle.cancelled():
+                    due.append(handle)
+            return due
+
+    def _run(self) -> None:
+        while True:
+            due = self._take_due()
+            if due is None:
+                return
+            for r in run_batch(self._check, due, max_workers=self.max_workers):
+                self._update(r.item, r.result, r.error)
+
+    @staticmethod
+    def _check(handle: PublishHandle) -> mds.BusinessPublishStatusResponse:
+        handle.polls += 1
+        return handle.api.get_publish_status(
+            business_id=handle.business_id, publish_id=handle.publish_id
+        )
+
+    @staticmethod
+    def _resolve(
+        handle: PublishHandle,
+        result: Optional[mds.BusinessPublishStatus] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        # the handle may be cancelled by the caller at any time.
+        if not handle.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            handle.set_exception(error)
+        else:
+            handle.set_result(result)
+
+    def _update(
+        self,
+        handle: PublishHandle,
+        resp: Optional[mds.BusinessPublishStatusResponse],
+        error: Optional[Exception],
+    ) -> None:
+        if handle.done():
+            return
+        if error is not None:
+            handle._errors += 1
+            if handle._errors >= self.max_errors:
+                return self._resolve(handle, error=error)
+        else:
+            handle._errors = 0
+            handle.status = resp.data or mds.BusinessPublishStatus()
+            if handle.status.status in PUBLISH_COMPLETE_STATUSES:
+                return self._resolve(handle, result=handle.status)
+            if handle.status.status in PUBLISH_FAILED_STATUSES:
+                return self._resolve(
+                    handle, error=PublishFailed(handle.publish_id, handle.status)
+                )
+        if self.timer() >= handle._deadline:
+            return self._resolve(
+                handle, error=PublishTimeout(handle.publish_id, handle.status)
+            )
+        handle._interval = min(
+            handle._interval * self.backoff_factor, self.max_interval
+        )
+        with self._cond:
+            self._schedule(handle)
+
+
+_default_poller: Optional[PublishPoller] = None
+_default_poller_lock = threading.Lock()
+
+
+def get_publish_poller() -> PublishPoller:
+    """
+    Get the process wide poller, which is used if no poller given for the publish methods.
+    """
+    global _default_poller
+    with _default_poller_lock:
+        if _default_poller is None:
+            _default_poller = PublishPoller()
+        return _default_poller
@@ -0,0 +1,374 @@
+"""
+Record the real requests to an archive, and replay them offline, for the load tests.
+"""
+
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from pytiktok.error import PyTiktokError
+from pytiktok.session import PoolAdapter
+
+ARCHIVE_MAGIC = b"PTRR\x01\n"
+# Params and json fields not in the request key, so the archive can be replayed with other tokens.
+DEFAULT_IGNORE_PARAMS = ("access_token",)
+
+# key digest, recorded seconds, bytes of the compressed payload.
+_RECORD = struct.Struct(">16sfI")
+
+
+class ReplayMissError(PyTiktokError):
+    """The request is not in the archive."""
+
+
+@dataclass
+class Interaction:
+    """
+    A recorded response.
+
+    :param url: Url of the request, without the ignored params.
+    :param status: HTTP status code of the response.
+    :param reason: HTTP reason of the response.
+    :param headers: Headers of the response.
+    :param body: Body of the response.
+    :param elapsed: Seconds the real request took.
+    """
+
+    url: str
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+    elapsed: float
+
+
+def _drop_ignored(body: bytes, ignore: Iterable[str]) -> bytes:
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if isinstance(data, dict):
+        for name in ignore:
+            data.pop(name, None)
+    return json.dumps(data, sort_keys=True).encode("utf-8")
+
+
+def make_interaction_key(
+    request: requests.PreparedRequest,
+    ignore_params: Iterable[str] = DEFAULT_IGNORE_PARAMS,
+) -> Tuple[bytes, str]:
+    """
+    Get the key for a request, the requests with same key get the same recorded responses.
+
+    The key uses the method, the url with sorted params, and the body. The ignored params
+    are dropped from the url params and the json body. The random multipart boundary
+    is dropped from the body, and the streaming bodies are not a part of the key.
+
+    :param request: Prepared request.
+    :param ignore_params: Params and json fields not in the key.
+    :return: Key digest, and the url without the ignored params.
+    """
+    ignore = set(ignore_params)
+    parts = urlsplit(request.url)
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in ignore
+    )
+    url = urlunsplit(parts._replace(query=urlencode(query)))
+
+    body = request.body
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        body = b""
+    content_type = request.headers.get("Content-Type") or ""
+    if content_type.startswith("multipart/") and "boundary=" in content_type:
+        boundary = content_type.split("boundary=", 1)[1].strip('"')
+        body = body.replace(boundary.encode("utf-8"), b"")
+    elif content_type.startswith("application/json") and body:
+        body = _drop_ignored(body, ignore)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (request.method.upper().encode(), url.encode("utf-8"), body):
+        digest.update(struct.pack(">I", len(part)))
+        digest.update(part)
+    return digest.digest(), url
+
+
+class InteractionArchive:
+    """
+    Append-only file of the recorded responses.
+
+    Each response is a compressed record after a small header with its key.
+    The index from key to the record offsets is built when opened, by scanning the headers,
+    so a lookup is O(1) however many responses in the archive.
+
+    :param path: File path of the archive.
+    :param mode: "r" to read the responses, "a" to add responses, the file is created if not exists.
+    :param compress_level: zlib level for the records.
+    """
+
+    def __init__(self, path: str, mode: str = "r", compress_level: int = 6) -> None:
+        if mode not in ("r", "a"):
+            raise ValueError("mode must be 'r' or 'a'")
+        self.path = path
+        self.mode = mode
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, List[int]] = {}
+        self._positions: Dict[bytes, int] = {}
+        self._mmap: Optional[mmap.mmap] = None
+
+        if mode == "a":
+            self._file = open(path, "a+b")
+            if self._file.seek(0, os.SEEK_END) == 0:
+                self._file.write(ARCHIVE_MAGIC)
+                self._file.flush()
+        else:
+            self._file = open(path, "rb")
+        end = self._build_index()
+        if mode == "a":
+            # drop the partial record of an interrupted recording.
+            self._file.truncate(end)
+            self._file.seek(end)
+
+    def _build_index(self) -> int:
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(ARCHIVE_MAGIC):
+            raise PyTiktokError(f"Not a replay archive: {self.path}")
+        data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            data.close()
+            raise PyTiktokError(f"Not a replay archive: {self.path}")
+
+        offset = len(ARCHIVE_MAGIC)
+        while offset + _RECORD.size <= size:
+            key, _, length = _RECORD.unpack_from(data, offset)
+            if offset + _RECORD.size + length > size:
+                break
+            self._index.setdefault(key, []).append(offset)
+            offset += _RECORD.size + length
+
+        if self.mode == "r":
+            self._mmap = data
+        else:
+            data.close()
+        return offset
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values())
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._index
+
+    def __enter__(self) -> "InteractionArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._file.close()
+
+    def add(self, key: bytes, interaction: Interaction) -> None:
+        """
+        Add a response for the key, after the responses recorded for it.
+        :param key: Key of the request.
+        :param interaction: The response.
+        """
+        if self.mode != "a":
+            raise PyTiktokError("Archive is opened for read")
+        meta = json.dumps(
+            [
+                interaction.url,
+                interaction.status,
+                interaction.reason,
+                interaction.headers,
+            ],
+            separators=(",", ":"),
+        ).encode("utf-8")
+        payload = zlib.compress(meta + b"\n" + interaction.body, self.compress_level)
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(_RECORD.pack(key, interaction.elapsed, len(payload)))
+            self._file.write(payload)
+            self._file.flush()
+            self._index.setdefault(key, []).append(offset)
+
+    def _read(self, offset: int) -> Interaction:
+        _, elapsed, length = _RECORD.unpack_from(self._mmap, offset)
+        start = offset + _RECORD.size
+        raw = zlib.decompress(self._mmap[start : start + length])
+        meta, body = raw.split(b"\n", 1)
+        url, status, reason, headers = json.loads(meta)
+        return Interaction(
+            url=url,
+            status=status,
+            reason=reason,
+            headers=headers,
+            body=body,
+            elapsed=elapsed,
+        )
+
+    def next(self, key: bytes) -> Optional[Interaction]:
+        """
+        Get the next response for the key.
+
+        The responses for a key are replayed in the recorded order, like the status of a publish
+        going to complete, then the last one is repeated.
+
+        :param key: Key of the request.
+        :return: The response, None if the key is not in the archive.
+        """
+        if self.mode != "r":
+            raise PyTiktokError("Archive is opened for add")
+        offsets = self._index.get(key)
+        if offsets is None:
+            return None
+        with self._lock:
+            position = self._positions.get(key, 0)
+            if position < len(offsets) - 1:
+                self._positions[key] = position + 1
+        return self._read(offsets[position])
+
+    def rewind(self) -> None:
+        """
+        Replay the responses from the first one again.
+        """
+        with self._lock:
+            self._positions.clear()
+
+
+class RecordReplayAdapter(BaseAdapter):
+    """
+    Transport adapter for the requests session, which records the real responses to an archive,
+    or replays the recorded responses without network.
+
+    Mount it to the session of the api:
+
+    >>> session = build_replay_session("tiktok.archive", mode="record")
+    >>> api = BusinessAccountApi(access_token="token", session=session)
+    >>> # later, or in the load tests
+    >>> session = build_replay_session("tiktok.archive", latency_scale=1.0)
+
+    :param path: File path of the archive.
+    :param mode: "record" to send the requests and add the responses to the archive,
+        "replay" to answer the requests from the archive.
+    :param adapter: Adapter to send the real requests for recording, default is ``PoolAdapter``.
+    :param latency_scale: Part of the recorded latency to wait before a replayed response,
+        0 for full speed, 1 for the recorded latency.
+    :param ignore_params: Params and json fields not in the request key, default the access token.
+    :param sleep: Function to wait the seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        adapter: Optional[BaseAdapter] = None,
+        latency_scale: float = 0.0,
+        ignore_params: Iterable[str] = DEFAULT_IGNORE_PARAMS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be 'record' or 'replay'")
+        if latency_scale < 0:
+            raise ValueError("latency_scale must not be negative")
+        self.mode = mode
+        self.archive = InteractionArchive(path, mode="a" if mode == "record" else "r")
+        self.adapter = adapter if adapter is not None else PoolAdapter()
+        self.latency_scale = latency_scale
+        self.ignore_params = tuple(ignore_params)
+        self.sleep = sleep
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        key, url = make_interaction_key(request, self.ignore_params)
+        if self.mode == "record":
+            resp = self.adapter.send(request, **kwargs)
+            self.archive.add(
+                key,
+                Interaction(
+                    url=url,
+                    status=resp.status_code,
+                    reason=resp.reason or "",
+                    headers=dict(resp.headers),
+                    body=resp.content,
+                    elapsed=resp.elapsed.total_seconds(),
+                ),
+            )
+            return resp
+
+        interaction = self.archive.next(key)
+        if interaction is None:
+            raise ReplayMissError(f"No recorded response for {request.method} {url}")
+        if self.latency_scale:
+            self.sleep(interaction.elapsed * self.latency_scale)
+        return self.build_response(request, interaction)
+
+    def build_response(
+        self, request: requests.PreparedRequest, interaction: Interaction
+    ) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = interaction.status
+        resp.reason = interaction.reason
+        resp.headers = CaseInsensitiveDict(interaction.headers)
+        # the body is decoded already, the encoding headers not apply to it.
+        resp.headers.pop("Content-Encoding", None)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = interaction.body
+        resp._content_consumed = True
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        resp.elapsed = datetime.timedelta(seconds=interaction.elapsed)
+        return resp
+
+    def close(self) -> None:
+        self.archive.close()
+        self.adapter.close()
+
+
+def build_replay_session(
+    path: str,
+    mode: str = "replay",
+    latency_scale: float = 0.0,
+    ignore_params: Iterable[str] = DEFAULT_IGNORE_PARAMS,
+    adapter: Optional[BaseAdapter] = None,
+) -> requests.Session:
+    """
+    Build a session which records the responses to an archive, or replays them.
+    See :class:`RecordReplayAdapter` for the params.
+
+    :return: Session
+    """
+    session = requests.Session()
+    replay_adapter = RecordReplayAdapter(
+        path,
+        mode=mode,
+        adapter=adapter,
+        latency_scale=latency_scale,
+        ignore_params=ignore_params,
+    )
+    session.mount("https://", replay_adapter)
+    session.mount("http://", replay_adapter)
+    return session
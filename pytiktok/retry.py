@@ -0,0 +1,265 @@
+"""
+Retry policy and client side rate limiter for api requests.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Collection, Optional
+
+import requests
+from requests import Response
+
+from pytiktok.codec import JsonCodec, load_response
+
+# Error codes in response body which mean the request has been rejected by rate limit without any effect,
+# so it is safe to send the request again for any method.
+BUSINESS_RATE_LIMIT_CODES = frozenset(
+    {
+        40100,  # Too many requests.
+    }
+)
+# The kit api (v1, open-api.tiktok.com) has numeric codes in ``error.code``, and tells the rate limit
+# by HTTP 429 only, which is retried for any method.
+KIT_RATE_LIMIT_CODES = frozenset()
+# Error codes to retry, the ones not for rate limit are server errors, the request may have been
+# processed, so they are retried only for the idempotent methods, like the 5xx status.
+BUSINESS_RETRY_CODES = BUSINESS_RATE_LIMIT_CODES | frozenset(
+    {
+        50000,  # System error.
+        50002,  # Service busy.
+    }
+)
+KIT_RETRY_CODES = KIT_RATE_LIMIT_CODES | frozenset(
+    {
+        2100004,  # System busy.
+    }
+)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Policy for retrying failed requests with exponential backoff and jitter.
+
+    Requests rejected by rate limit (HTTP 429 or a code in ``rate_limit_codes``) are retried for any method.
+    Server errors in ``status_forcelist`` or ``retry_codes`` and connection errors are retried only for
+    methods in ``allowed_methods``, because the request may have been processed by TikTok.
+
+    :param max_retries: Max retry times after the first attempt.
+    :param backoff_factor: Base seconds for backoff, the delay for attempt n is ``backoff_factor * 2 ** n``.
+    :param max_backoff: Max seconds for one backoff.
+    :param jitter: Use full jitter for backoff, to avoid many clients retrying at the same time.
+    :param status_forcelist: HTTP status codes to retry.
+    :param retry_codes: TikTok error codes to retry. If not set, use the default codes for the api.
+    :param rate_limit_codes: TikTok error codes in ``retry_codes`` for rate limit, which are retried for
+        any method. If not set, use the default codes for the api.
+    :param allowed_methods: Methods which are safe to retry for server and connection errors.
+    :param respect_retry_after: Wait as the Retry-After header says.
+    :param max_retry_after: If Retry-After is longer than this, give up retrying.
+    """
+
+    max_retries: int = field(default=3)
+    backoff_factor: float = field(default=0.5)
+    max_backoff: float = field(default=30.0)
+    jitter: bool = field(default=True)
+    status_forcelist: Collection[int] = field(default=(429, 500, 502, 503, 504))
+    retry_codes: Optional[Collection[Any]] = field(default=None)
+    rate_limit_codes: Optional[Collection[Any]] = field(default=None)
+    allowed_methods: Collection[str] = field(default=("GET", "HEAD", "OPTIONS"))
+    respect_retry_after: bool = field(default=True)
+    max_retry_after: float = field(default=120.0)
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get the seconds to wait before next attempt.
+        :param attempt: The number of retries already done.
+        :return: seconds
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse the Retry-After header, which may be seconds or a http date.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+    def get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[Response] = None,
+        code: Any = None,
+        default_codes: Collection[Any] = (),
+        default_rate_limit_codes: Collection[Any] = (),
+        idempotent: Optional[bool] = None,
+    ) -> Optional[float]:
+        """
+        Check whether a request should be retried.
+        :param method: HTTP method for the request.
+        :param attempt: The number of retries already done.
+        :param response: Response for the request, None means a connection error.
+        :param code: TikTok error code in the response body.
+        :param default_codes: Default retry codes for the api.
+        :param default_rate_limit_codes: Default rate limit codes for the api.
+        :param idempotent: Whether the request is safe to send again, like a POST to read data.
+            If not set, check the method by ``allowed_methods``.
+        :return: Seconds to wait before retry, None means not retry.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if idempotent is None:
+            idempotent = method.upper() in self.allowed_methods
+        if response is None:
+            return self.get_backoff(attempt) if idempotent else None
+
+        retry_codes = (
+            self.retry_codes if self.retry_codes is not None else default_codes
+        )
+        status = response.status_code
+        if status in self.status_forcelist:
+            # 429 means the request is rejected, so it is safe to retry any method.
+            if status != 429 and not idempotent:
+                return None
+        elif code is None or code not in retry_codes:
+            return None
+        elif not idempotent:
+            rate_limit_codes = (
+                self.rate_limit_codes
+                if self.rate_limit_codes is not None
+                else default_rate_limit_codes
+            )
+            # other codes are server errors, the request may have been processed.
+            if code not in rate_limit_codes:
+                return None
+
+        if self.respect_retry_after:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.get_backoff(attempt)
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket, to keep the request rate under the quota.
+
+    >>> limiter = TokenBucket(rate=10, capacity=20)  # 10 requests per second, burst 20
+    >>> limiter.acquire()
+
+    :param rate: Tokens added per second.
+    :param capacity: Max tokens in the bucket, default is same as rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens from the bucket, return seconds to wait until the tokens are available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, block until they are available.
+        :param tokens: Number of tokens to take.
+        :return: Seconds waited.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def send_with_retry(
+    send: Callable[[], Response],
+    method: str,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    get_error_code: Optional[Callable[[dict], Any]] = None,
+    default_codes: Collection[Any] = (),
+    codec: Optional[JsonCodec] = None,
+    default_rate_limit_codes: Collection[Any] = (),
+    idempotent: Optional[bool] = None,
+) -> Response:
+    """
+    Send a request, and retry it by the policy.
+    :param send: Function to send the request.
+    :param method: HTTP method for the request.
+    :param retry_policy: Retry policy, None means not retry.
+    :param rate_limiter: Rate limiter to take a token before each attempt.
+    :param get_error_code: Function to get the TikTok error code from response json.
+    :param default_codes: Default retry codes for the api.
+    :param codec: Json codec to decode the response, the result is cached on the response.
+    :param default_rate_limit_codes: Default rate limit codes for the api, retried for any method.
+    :param idempotent: Whether the request is safe to send again. If not set, check the method by the policy.
+    :return: The last response.
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            resp = send()
+        except (requests.ConnectionError, requests.Timeout):
+            if retry_policy is None:
+                raise
+            delay = retry_policy.get_retry_delay(method, attempt, idempotent=idempotent)
+            if delay is None:
+                raise
+        else:
+            if retry_policy is None:
+                return resp
+            code = None
+            if get_error_code is not None and resp.status_code == 200:
+                try:
+                    code = get_error_code(load_response(resp, codec))
+                except (ValueError, AttributeError, TypeError):
+                    code = None
+            delay = retry_policy.get_retry_delay(
+                method,
+                attempt,
+                response=resp,
+                code=code,
+                default_codes=default_codes,
+                default_rate_limit_codes=default_rate_limit_codes,
+                idempotent=idempotent,
+            )
+            if delay is None:
+                return resp
+            resp.close()
+        time.sleep(delay)
+        attempt += 1
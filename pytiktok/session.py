@@ -0,0 +1,129 @@
+"""
+Http session with tunable connection pool.
+"""
+
+import socket
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _keepalive_socket_options(idle: int, interval: int, count: int) -> list:
+    """
+    Socket options to enable TCP keep-alive probes, so idle pooled connections
+    are not dropped silently by NAT or load balancers.
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Linux use TCP_KEEPIDLE, macOS use TCP_KEEPALIVE for the idle seconds.
+    idle_option = getattr(
+        socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+    )
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    Http adapter with tunable pool and TCP keep-alive.
+
+    :param pool_connections: Number of hosts to keep connection pools for.
+    :param pool_maxsize: Max connections to keep in the pool for each host.
+        Set it not less than the number of threads sending requests, otherwise
+        the extra connections will be closed after use and opened again next time.
+    :param pool_block: Block when no free connection in the pool, instead of opening a new one.
+    :param tcp_keepalive: Seconds of idle before sending TCP keep-alive probes. None to disable.
+    :param tcp_keepalive_interval: Seconds between keep-alive probes.
+    :param tcp_keepalive_count: Number of failed probes before the connection is dropped.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        max_retries: int = 0,
+        tcp_keepalive: Optional[int] = 60,
+        tcp_keepalive_interval: int = 10,
+        tcp_keepalive_count: int = 6,
+    ) -> None:
+        # HTTPAdapter.__init__ will call init_poolmanager, so set this first.
+        self.socket_options = list(HTTPConnection.default_socket_options)
+        if tcp_keepalive is not None:
+            self.socket_options += _keepalive_socket_options(
+                tcp_keepalive, tcp_keepalive_interval, tcp_keepalive_count
+            )
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+def build_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    tcp_keepalive: Optional[int] = 60,
+) -> requests.Session:
+    """
+    Build a session with tunable connection pool.
+
+    :param pool_connections: Number of hosts to keep connection pools for.
+    :param pool_maxsize: Max connections to keep in the pool for each host.
+    :param pool_block: Block when no free connection in the pool, instead of opening a new one.
+    :param tcp_keepalive: Seconds of idle before sending TCP keep-alive probes. None to disable.
+    :return: Session
+    """
+    session = requests.Session()
+    adapter = PoolAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the session shared by the process.
+
+    The access token is sent with each request, not saved in the session,
+    so one session can serve api instances for many access tokens,
+    and reuse the keep-alive connections and TLS sessions between them.
+
+    >>> api = BusinessAccountApi(access_token="token", session=get_shared_session())
+
+    :return: Session
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = build_session(pool_maxsize=64)
+    return _shared_session
@@ -0,0 +1,337 @@
+"""
+Persistent store for the crawled pages, so a restarted crawler not request them again.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from pytiktok.codec import JsonCodec, get_codec
+
+# Page kinds, and the key for items in the page data and the id in item.
+PAGE_KINDS = {
+    "videos": ("videos", "item_id"),
+    "comments": ("comments", "comment_id"),
+    "replies": ("comments", "comment_id"),
+}
+# Seconds to use a stored first page by default, so the new items are fetched.
+DEFAULT_HEAD_MAX_AGE = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    kind TEXT NOT NULL,
+    business_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    query TEXT NOT NULL,
+    cursor TEXT NOT NULL,
+    data BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (kind, business_id, video_id, query, cursor)
+);
+CREATE TABLE IF NOT EXISTS items (
+    kind TEXT NOT NULL,
+    business_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    data BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (kind, business_id, video_id, item_id)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    business_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (business_id, video_id)
+);
+"""
+
+
+@dataclass
+class PageInfo:
+    """
+    Freshness metadata for a stored page.
+
+    :param fetched_at: Unix timestamp when the page was fetched from TikTok.
+    :param age: Seconds since the page was fetched.
+    :param fresh: Whether the page can be used instead of requesting TikTok.
+    """
+
+    fetched_at: float
+    age: float
+    fresh: bool
+
+
+class PageStore:
+    """
+    SQLite store for the pages of videos, comments and comment replies.
+
+    Pages are keyed by kind, business_id, video_id, the other request params and cursor.
+    The items in pages are also kept by their ids, so they can be read without requesting TikTok.
+
+    >>> store = PageStore("crawl.db", max_age=24 * 3600, head_max_age=600)
+    >>> api = BusinessAccountApi(access_token="token", store=store)
+    >>> videos = list(api.iter_account_videos(business_id="business_id"))
+
+    :param path: Path for the database file, ``:memory:`` for a temporary database in memory.
+    :param max_age: Seconds to use a stored page. None means the pages never expire.
+    :param head_max_age: Seconds to use a stored first page (cursor is None), which has the latest items,
+        default is 300 seconds, not longer than max_age. If set None, same as max_age.
+    :param codec: Json codec to encode the pages. If not set, use the default codec.
+    :param timer: Function to get the current unix timestamp.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_age: Optional[float] = None,
+        head_max_age: Optional[float] = DEFAULT_HEAD_MAX_AGE,
+        codec: Optional[JsonCodec] = None,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        if head_max_age is None:
+            head_max_age = max_age
+        elif max_age is not None:
+            head_max_age = min(head_max_age, max_age)
+        self.head_max_age = head_max_age
+        self.codec = get_codec(codec)
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "PageStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query_key(self, query: Optional[dict]) -> str:
+        if not query:
+            return ""
+        return json.dumps(
+            {k: v for k, v in query.items() if v is not None},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+    def _is_fresh(self, cursor: Optional[Any], age: float) -> bool:
+        max_age = self.head_max_age if cursor is None else self.max_age
+        return max_age is None or age <= max_age
+
+    def get_page_info(
+        self,
+        kind: str,
+        business_id: str,
+        video_id: Optional[str] = None,
+        query: Optional[dict] = None,
+        cursor: Optional[Any] = None,
+    ) -> Optional[PageInfo]:
+        """
+        Get the freshness metadata for a stored page.
+        :return: Page info, None if not stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM pages WHERE kind=? AND business_id=? AND video_id=? "
+                "AND query=? AND cursor=?",
+                (
+                    kind,
+                    business_id,
+                    video_id or "",
+                    self._query_key(query),
+                    str(cursor),
+                ),
+            ).fetchone()
+        if row is None:
+            return None
+        age = max(0.0, self.timer() - row[0])
+        return PageInfo(fetched_at=row[0], age=age, fresh=self._is_fresh(cursor, age))
+
+    def get_page(
+        self,
+        kind: str,
+        business_id: str,
+        video_id: Optional[str] = None,
+        query: Optional[dict] = None,
+        cursor: Optional[Any] = None,
+        allow_stale: bool = False,
+    ) -> Optional[dict]:
+        """
+        Get a stored page.
+        :param kind: Kind of the page, one of videos, comments, replies.
+        :param business_id: Business id for the page.
+        :param video_id: Video id for the comment pages.
+        :param query: The other params for the request, like fields, sort_field.
+        :param cursor: Cursor for the page, None for the first page.
+        :param allow_stale: Return the page even it is older than the max age.
+        :return: Page json data, None if not stored or stale.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, fetched_at FROM pages WHERE kind=? AND business_id=? AND video_id=? "
+                "AND query=? AND cursor=?",
+                (
+                    kind,
+                    business_id,
+                    video_id or "",
+                    self._query_key(query),
+                    str(cursor),
+                ),
+            ).fetchone()
+        if row is None:
+            return None
+        if not allow_stale and not self._is_fresh(cursor, self.timer() - row[1]):
+            return None
+        return self.codec.loads(row[0])
+
+    def put_page(
+        self,
+        kind: str,
+        business_id: str,
+        page: dict,
+        video_id: Optional[str] = None,
+        query: Optional[dict] = None,
+        cursor: Optional[Any] = None,
+    ) -> None:
+        """
+        Save a page and its items.
+        :param kind: Kind of the page, one of videos, comments, replies.
+        :param business_id: Business id for the page.
+        :param page: Page json data.
+        :param video_id: Video id for the comment pages.
+        :param query: The other params for the request, like fields, sort_field.
+        :param cursor: Cursor for the page, None for the first page.
+        """
+        items_key, id_key = PAGE_KINDS[kind]
+        video_id = video_id or ""
+        now = self.timer()
+        items = [
+            (
+                kind,
+                business_id,
+                video_id,
+                str(item[id_key]),
+                self.codec.dumps(item),
+                now,
+            )
+            for item in (page.get("data") or {}).get(items_key) or []
+            if item.get(id_key) is not None
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    business_id,
+                    video_id,
+                    self._query_key(query),
+                    str(cursor),
+                    self.codec.dumps(page),
+                    now,
+                ),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?)", items
+            )
+
+    def fetch_page(
+        self,
+        kind: str,
+        business_id: str,
+        fetch: Callable[[], dict],
+        video_id: Optional[str] = None,
+        query: Optional[dict] = None,
+        cursor: Optional[Any] = None,
+    ) -> dict:
+        """
+        Get the page from the store if it is fresh, otherwise fetch it and save it.
+        :param fetch: Function to request the page from TikTok.
+        :return: Page json data.
+        """
+        page = self.get_page(kind, business_id, video_id, query, cursor)
+        if page is not None:
+            self.hits += 1
+            return page
+        self.misses += 1
+        page = fetch()
+        self.put_page(kind, business_id, page, video_id, query, cursor)
+        return page
+
+    def iter_items(
+        self, kind: str, business_id: str, video_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate over the stored items.
+        :param kind: Kind of the page, one of videos, comments, replies.
+        :param business_id: Business id for the items.
+        :param video_id: Video id for the comments. If not set, iterate the items for all videos.
+        :return: Item json data iterator.
+        """
+        sql = "SELECT data FROM items WHERE kind=? AND business_id=?"
+        args = [kind, business_id]
+        if video_id is not None:
+            sql += " AND video_id=?"
+            args.append(video_id)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY rowid", args).fetchall()
+        for row in rows:
+            yield self.codec.loads(row[0])
+
+    def get_watermark(self, business_id: str, video_id: str) -> Optional[dict]:
+        """
+        Get the watermark of the comment sync for a video.
+        :return: Watermark json data, None if not synced.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM watermarks WHERE business_id=? AND video_id=?",
+                (business_id, video_id),
+            ).fetchone()
+        return None if row is None else self.codec.loads(row[0])
+
+    def set_watermark(self, business_id: str, video_id: str, watermark: dict) -> None:
+        """
+        Save the watermark of the comment sync for a video.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                (business_id, video_id, self.codec.dumps(watermark), self.timer()),
+            )
+
+    def clear(
+        self,
+        kind: Optional[str] = None,
+        business_id: Optional[str] = None,
+        video_id: Optional[str] = None,
+    ) -> None:
+        """
+        Remove the stored pages and items, remove all if no condition given.
+        """
+        conditions, args = [], []
+        for name, value in (
+            ("kind", kind),
+            ("business_id", business_id),
+            ("video_id", video_id),
+        ):
+            if value is not None:
+                conditions.append(f"{name}=?")
+                args.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages" + where, args)
+            self._conn.execute("DELETE FROM items" + where, args)
@@ -0,0 +1,124 @@
+"""
+Incremental sync for the comments of a video, by a watermark of the latest comment synced.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import pytiktok.models as mds
+
+
+@dataclass
+class CommentWatermark:
+    """
+    The latest comments synced for a video.
+
+    Many comments can be created in the same second, so the ids of the comments at the
+    latest create time are kept too, the others at that second are still new.
+
+    :param create_time: Create time of the latest comment synced.
+    :param comment_ids: Ids of the comments synced, which created at ``create_time``.
+    """
+
+    create_time: int
+    comment_ids: List[str] = field(default_factory=list)
+
+    def is_new(self, comment: dict) -> bool:
+        """
+        Check whether a comment is created after this watermark.
+        """
+        create_time = comment.get("create_time")
+        if create_time is None:
+            return True
+        create_time = int(create_time)
+        if create_time != self.create_time:
+            return create_time > self.create_time
+        return comment.get("comment_id") not in self.comment_ids
+
+    def to_dict(self) -> dict:
+        return {"create_time": self.create_time, "comment_ids": list(self.comment_ids)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CommentWatermark":
+        return cls(
+            create_time=int(data["create_time"]),
+            comment_ids=list(data.get("comment_ids") or []),
+        )
+
+
+@dataclass
+class CommentSyncResult:
+    """
+    Result for an incremental comment sync.
+
+    :param comments: The new comments, newest first.
+    :param watermark: The watermark to use for the next sync, None if no comment synced ever.
+    :param pages: Number of pages requested.
+    """
+
+    comments: List[mds.BusinessComment]
+    watermark: Optional[CommentWatermark]
+    pages: int
+
+
+def _next_watermark(
+    items: List[dict], watermark: Optional[CommentWatermark]
+) -> Optional[CommentWatermark]:
+    times = [int(c["create_time"]) for c in items if c.get("create_time") is not None]
+    if not times:
+        return watermark
+    latest = max(times)
+    if watermark is not None and watermark.create_time > latest:
+        return watermark
+    ids = [
+        c["comment_id"]
+        for c in items
+        if c.get("create_time") is not None and int(c["create_time"]) == latest
+    ]
+    if watermark is not None and watermark.create_time == latest:
+        ids = list(watermark.comment_ids) + ids
+    return CommentWatermark(create_time=latest, comment_ids=ids)
+
+
+def sync_comments(
+    fetch_page: Callable[[Optional[int]], dict],
+    watermark: Optional[CommentWatermark] = None,
+) -> CommentSyncResult:
+    """
+    Get the comments created after the watermark.
+
+    The pages must be sorted by create time in descending order, so the paging stops
+    at the first comment older than the watermark.
+
+    :param fetch_page: Function to get the json data for a page by the cursor.
+        The first page will be requested with cursor None.
+    :param watermark: Watermark for the last sync. If not set, get all comments.
+    :return: The new comments and the new watermark.
+    """
+    new_items, pages, cursor = [], 0, None
+    while True:
+        data = fetch_page(cursor).get("data") or {}
+        pages += 1
+        reached = False
+        for item in data.get("comments") or []:
+            if watermark is None or watermark.is_new(item):
+                new_items.append(item)
+            elif int(item["create_time"]) < watermark.create_time:
+                # older comments have been synced.
+                reached = True
+                break
+        next_cursor = data.get("cursor")
+        if (
+            reached
+            or not data.get("has_more")
+            or next_cursor is None
+            or next_cursor == cursor
+        ):
+            break
+        cursor = next_cursor
+
+    return CommentSyncResult(
+        comments=[mds.BusinessComment.new_from_json_dict(c) for c in new_items],
+        watermark=_next_watermark(new_items, watermark),
+        pages=pages,
+    )
@@ -0,0 +1,364 @@
+"""
+Transports to send the http requests for the api instances.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import requests
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from pytiktok.codec import get_codec
+from pytiktok.session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    build_session,
+)
+
+
+class Transport(ABC):
+    """
+    Interface of the transports, which send a request and return the response.
+
+    The response must have ``status_code``, ``headers``, ``content``, ``text`` and ``close()``,
+    like the response of requests or httpx.
+    The connection errors and timeouts must be raised as ``requests.ConnectionError``
+    and ``requests.Timeout``, so the retry policy works for all transports.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a request.
+        :param method: HTTP method for the request.
+        :param url: Full url for the request.
+        :param params: Url params for the request.
+        :param data: Form data, bytes or a streaming body for the request.
+        :param files: Form files for the request.
+        :param headers: Headers for the request.
+        :param timeout: Timeout in seconds for the request.
+        :return: Response
+        """
+
+    def close(self) -> None:
+        """
+        Close the connections of the transport.
+        """
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport by the requests session, the default one.
+
+    :param session: Session to send the requests, can be shared by many transports.
+        If not set, will build a session with the pool params.
+    :param proxies: Proxies for the requests, like {"https": "http://proxy:8080"}.
+    :param pool_connections: Number of hosts to keep connection pools for.
+    :param pool_maxsize: Max connections to keep in the pool for each host.
+    :param pool_block: Block when no free connection in the pool, instead of opening a new one.
+    :param tcp_keepalive: Seconds of idle before sending TCP keep-alive probes. None to disable.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        proxies: Optional[dict] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[int] = 60,
+    ) -> None:
+        if session is None:
+            session = build_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                tcp_keepalive=tcp_keepalive,
+            )
+        self.session = session
+        self.proxies = proxies
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Response:
+        return self.session.request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            files=files,
+            headers=headers,
+            timeout=timeout,
+            proxies=self.proxies,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport by the httpx client, which can send the requests over HTTP/2,
+    so the concurrent requests to a host share a few multiplexed connections.
+
+    HTTP/2 need the h2 package, install it by: pip install python-tiktok[http2]
+
+    :param client: Client to send the requests. If not set, will build a client with the params.
+    :param http2: Whether to use HTTP/2 if the server supports it.
+    :param http1: Whether to allow HTTP/1.1. Set it False to use HTTP/2 without TLS, by prior knowledge.
+    :param proxies: Proxies in requests style, like {"https": "http://proxy:8080"}.
+    :param max_connections: Max connections in the pool.
+    :param max_keepalive_connections: Max idle keep-alive connections in the pool.
+    """
+
+    def __init__(
+        self,
+        client: Optional["httpx.Client"] = None,
+        http2: bool = True,
+        http1: bool = True,
+        proxies: Optional[dict] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "Httpx transport need httpx, install it by: pip install python-tiktok[http2]"
+            )
+        if client is None:
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    raise ImportError(
+                        "HTTP/2 need h2, install it by: pip install python-tiktok[http2]"
+                    )
+            mounts = None
+            if proxies:
+                mounts = {
+                    # httpx before 0.26 only takes a Proxy instance, not the url.
+                    f"{scheme}://": httpx.HTTPTransport(
+                        proxy=httpx.Proxy(proxy), http1=http1, http2=http2
+                    )
+                    for scheme, proxy in proxies.items()
+                }
+            client = httpx.Client(
+                http1=http1,
+                http2=http2,
+                # no timeout by default, like requests.
+                timeout=None,
+                mounts=mounts,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            )
+        self.client = client
+        # the proxies are mounted in the client, can not be changed after.
+        self.proxies = proxies
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> "httpx.Response":
+        content = None
+        if data is not None and not isinstance(data, dict):
+            # httpx takes the raw body as content, not the form data.
+            content, data = data, None
+            if hasattr(content, "__len__") and not isinstance(content, (bytes, str)):
+                # a streaming body with known size is not sent chunked.
+                headers = {"Content-Length": str(len(content)), **(headers or {})}
+        try:
+            return self.client.request(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                content=content,
+                files=files,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def close(self) -> None:
+        self.client.close()
+
+
+@dataclass
+class FakeRequest:
+    """
+    A request sent to the :class:`FakeTransport`.
+
+    :param method: HTTP method for the request.
+    :param url: Full url for the request.
+    :param params: Url params for the request.
+    :param data: Form data or body for the request.
+    :param files: Form files for the request.
+    :param headers: Headers for the request.
+    """
+
+    method: str
+    url: str
+    params: Optional[dict] = None
+    data: Any = None
+    files: Optional[dict] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def path(self) -> str:
+        return self.url.split("?", 1)[0]
+
+
+FakeReply = Union[dict, tuple, Callable[[FakeRequest], Any]]
+
+
+def build_response(
+    status: int = 200,
+    body: Union[bytes, str, dict, list] = b"",
+    headers: Optional[dict] = None,
+    url: Optional[str] = None,
+) -> Response:
+    """
+    Build a response of requests, without network.
+    :param status: HTTP status code.
+    :param body: Body of the response, the dict or list is encoded as json.
+    :param headers: Headers of the response.
+    :param url: Url of the request.
+    :return: Response
+    """
+    resp = Response()
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers or {})
+    if isinstance(body, (dict, list)):
+        body = get_codec().dumps(body)
+        resp.headers.setdefault("Content-Type", "application/json")
+    elif isinstance(body, str):
+        body = body.encode("utf-8")
+    resp._content = body
+    resp._content_consumed = True
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp.url = url
+    return resp
+
+
+class FakeTransport(Transport):
+    """
+    Transport which answers the requests with the given responses, for the tests.
+
+    >>> transport = FakeTransport({"business/get/": {"code": 0, "data": {"username": "name"}}})
+    >>> api = BusinessAccountApi(access_token="token", transport=transport)
+    >>> transport.calls[0].headers["Access-Token"]
+
+    The routes match the path suffix of the url, in order. A reply can be:
+
+    - a dict, the json body with status 200.
+    - a tuple of (status, json body) or (status, json body, headers).
+    - a list of replies, used one by one for the requests, then the last one is repeated.
+    - a function called with the :class:`FakeRequest`, which returns a reply,
+      or raises an exception, like ``requests.Timeout``.
+
+    :param routes: Map of path suffix to the reply.
+    :param default: Reply for the requests not in routes.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, Union[FakeReply, List[FakeReply]]]] = None,
+        default: Optional[FakeReply] = None,
+    ) -> None:
+        self.routes = dict(routes or {})
+        self.default = (
+            default if default is not None else {"code": 0, "message": "OK", "data": {}}
+        )
+        self.calls: List[FakeRequest] = []
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, suffix: str, reply: Union[FakeReply, List[FakeReply]]) -> None:
+        """
+        Add a route for the path suffix.
+        """
+        with self._lock:
+            self.routes[suffix] = reply
+            self._positions.pop(suffix, None)
+
+    def _get_reply(self, request: FakeRequest) -> FakeReply:
+        path = request.path
+        with self._lock:
+            self.calls.append(request)
+            for suffix, reply in self.routes.items():
+                if path.endswith(suffix):
+                    if isinstance(reply, list):
+                        position = self._positions.get(suffix, 0)
+                        self._positions[suffix] = min(position + 1, len(reply) - 1)
+                        reply = reply[position]
+                    return reply
+        return self.default
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Response:
+        if hasattr(data, "read"):
+            # consume the streaming body, like it is sent.
+            data = data.read()
+        request = FakeRequest(
+            method=method.upper(),
+            url=url,
+            params=dict(params) if params is not None else None,
+            data=data,
+            files=files,
+            headers=dict(headers or {}),
+        )
+        reply = self._get_reply(request)
+        if callable(reply):
+            reply = reply(request)
+        if isinstance(reply, tuple):
+            return build_response(*reply, url=url)
+        return build_response(body=reply, url=url)
@@ -0,0 +1,176 @@
+"""
+Streaming multipart body for the file uploads, which reads the file in chunks.
+"""
+
+import asyncio
+import mmap
+import os
+import uuid
+from typing import IO, Callable, Iterator, Optional
+
+# Bytes read from the file at a time.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartFileStream:
+    """
+    File-like multipart/form-data body for one file field.
+
+    The body is read by the http client chunk by chunk, so the memory not grows with the file size.
+    For the on-disk files, the file is mapped by mmap, and the sent pages are released from the memory.
+
+    >>> with open("video.mp4", "rb") as f:
+    ...     stream = MultipartFileStream("video", f, progress=lambda sent, total: print(sent, total))
+    ...     requests.post(url, data=stream, headers={"Content-Type": stream.content_type})
+
+    :param field: Name of the form field.
+    :param file: File object opened in binary mode, read from its current position.
+    :param filename: File name in the form. If not set, use the base name of the file.
+    :param content_type: Content type for the file part, not sent if None.
+    :param chunk_size: Max bytes read from the file at a time.
+    :param use_mmap: Whether to map the on-disk files by mmap.
+    :param progress: Function called with the file bytes sent and the file size, after each chunk.
+        For the async iteration, the chunks are read in the default executor, and it is called there.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        file: IO[bytes],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        self.file = file
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        if filename is None:
+            filename = os.path.basename(getattr(file, "name", None) or field)
+
+        head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        )
+        if content_type is not None:
+            head += f"Content-Type: {content_type}\r\n"
+        self._head = (head + "\r\n").encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+        self._start = file.tell()
+        file.seek(0, os.SEEK_END)
+        self.file_size = file.tell() - self._start
+        file.seek(self._start)
+
+        self._mmap = None
+        if use_mmap and self.file_size > 0:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                # not an on-disk file, like BytesIO.
+                self._mmap = None
+        self._released = self._start
+        self._pos = 0  # position in the whole body
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self.file_size + len(self._tail)
+
+    @property
+    def sent(self) -> int:
+        """
+        File bytes read by the http client.
+        """
+        return min(max(self._pos - len(self._head), 0), self.file_size)
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        if self._mmap is not None:
+            start = self._start + offset
+            data = self._mmap[start : start + size]
+            self._release(start + len(data))
+            return data
+        return self.file.read(size)
+
+    def _release(self, end: int) -> None:
+        # drop the pages sent from the memory of this process, they are read from disk if needed again.
+        if not hasattr(self._mmap, "madvise"):
+            return
+        end -= end % mmap.PAGESIZE
+        start = self._released - self._released % mmap.PAGESIZE
+        if end - start >= self.chunk_size:
+            self._mmap.madvise(mmap.MADV_DONTNEED, start, end - start)
+            self._released = end
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next part of the body, at most one chunk of the file at a time.
+        :param size: Max bytes to read. If negative, read the rest of the body into memory.
+        :return: Bytes, empty at the end of the body.
+        """
+        if size is None or size < 0:
+            return b"".join(self)
+        head_len = len(self._head)
+        if self._pos < head_len:
+            data = self._head[self._pos : self._pos + size]
+            self._pos += len(data)
+        elif self._pos < head_len + self.file_size:
+            offset = self._pos - head_len
+            size = min(size, self.chunk_size, self.file_size - offset)
+            data = self._read_file(offset, size)
+            if len(data) < size:
+                raise IOError("The file is changed while uploading.")
+            self._pos += len(data)
+            if self.progress is not None:
+                self.progress(self.sent, self.file_size)
+        else:
+            offset = self._pos - head_len - self.file_size
+            data = self._tail[offset : offset + size]
+            self._pos += len(data)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read(self.chunk_size)
+            if not data:
+                return
+            yield data
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # read in the default executor, so the file reads and the page faults of mmap
+            # not block the event loop.
+            data = await loop.run_in_executor(None, self.read, self.chunk_size)
+            if not data:
+                return
+            yield data
+
+    def rewind(self) -> None:
+        """
+        Read the body from the start again, for sending the request again.
+        """
+        self._pos = 0
+        self._released = self._start
+        if self._mmap is None:
+            self.file.seek(self._start)
+
+    def close(self) -> None:
+        """
+        Release the mmap, the file is not closed.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "MultipartFileStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
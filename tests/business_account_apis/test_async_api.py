@@ -0,0 +1,73 @@
+"""
+Tests for the asyncio business account api
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pytiktok import AsyncBusinessAccountApi, PyTiktokError
+
+
+def build_api(handler, **kwargs):
+    return AsyncBusinessAccountApi(
+        app_id="test_app_id",
+        app_secret="test_app_secret",
+        access_token="test_access_token",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_get_account_videos(helpers):
+    data = helpers.load_json("testsdata/business/video/videos_resp.json")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=data)
+
+    async def main():
+        async with build_api(handler) as api:
+            return await asyncio.gather(
+                *[api.get_account_videos(business_id="bid") for _ in range(5)]
+            )
+
+    results = asyncio.run(main())
+    assert len(results) == 5
+    assert results[0].data.videos[0].item_id == "7109065174526479622"
+    assert requests[0].headers["Access-Token"] == "test_access_token"
+    assert requests[0].url.path == "/open_api/v1.3/business/video/list/"
+    assert requests[0].url.params["business_id"] == "bid"
+
+
+def test_create_video_and_error(helpers):
+    def handler(request):
+        if request.url.path.endswith("business/video/publish/"):
+            return httpx.Response(
+                200,
+                json={"code": 0, "message": "OK", "data": {"share_id": "v.123"}},
+            )
+        return httpx.Response(200, json={"code": 40001, "message": "error"})
+
+    async def main():
+        async with build_api(handler) as api:
+            resp = await api.create_video(
+                business_id="bid", video_url="https://example.com/a.mp4", post_info={}
+            )
+            assert resp.data.share_id == "v.123"
+            with pytest.raises(PyTiktokError):
+                await api.get_account_data(business_id="bid")
+
+    asyncio.run(main())
+
+
+def test_need_auth():
+    async def main():
+        api = AsyncBusinessAccountApi()
+        with pytest.raises(PyTiktokError):
+            await api.get_account_data(business_id="bid")
+        await api.aclose()
+
+    asyncio.run(main())
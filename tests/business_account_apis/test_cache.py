@@ -0,0 +1,118 @@
+"""
+Tests for the response cache
+"""
+
+import pytest
+import responses
+
+from pytiktok import BusinessAccountApi, PyTiktokError
+from pytiktok.cache import ResponseCache
+
+BASE_URL = "https://business-api.tiktok.com/open_api/v1.3/"
+ACCOUNT_URL = BASE_URL + "business/get/"
+PROPERTY_LIST_URL = BASE_URL + "business/property/list/"
+PROPERTY_DELETE_URL = BASE_URL + "business/property/delete/"
+TOKEN_INFO_URL = BASE_URL + "tt_user/token_info/get/"
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def timer():
+    return FakeTimer()
+
+
+@pytest.fixture
+def cache_api(timer):
+    return BusinessAccountApi(
+        app_id="test_app_id",
+        access_token="test_access_token",
+        cache=ResponseCache(maxsize=2, timer=timer),
+    )
+
+
+@responses.activate
+def test_cache_hit_and_ttl(cache_api, timer):
+    responses.add(
+        responses.GET, ACCOUNT_URL, json={"code": 0, "data": {"username": "a"}}
+    )
+
+    for _ in range(3):
+        resp = cache_api.get_account_data(business_id="bid", fields=["username"])
+        assert resp.data.username == "a"
+    assert len(responses.calls) == 1
+    info = cache_api.cache.info()
+    assert (info.hits, info.misses, info.size) == (2, 1, 1)
+
+    # other params or token
+    cache_api.get_account_data(business_id="bid", fields=["display_name"])
+    cache_api.with_access_token("other").get_account_data(
+        business_id="bid", fields=["username"]
+    )
+    assert len(responses.calls) == 3
+    assert cache_api.cache.info().evictions == 1
+
+    timer.now += 301
+    cache_api.with_access_token("other").get_account_data(
+        business_id="bid", fields=["username"]
+    )
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_cache_not_keep_errors(cache_api):
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 40002, "message": "err"})
+    responses.add(responses.GET, ACCOUNT_URL, status=500)
+
+    for _ in range(2):
+        with pytest.raises(PyTiktokError):
+            cache_api.get_account_data(business_id="bid")
+    assert cache_api.cache.info().size == 0
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_invalidate_after_write(cache_api):
+    responses.add(
+        responses.GET,
+        PROPERTY_LIST_URL,
+        json={"code": 0, "data": {"url_property_list": []}},
+    )
+    responses.add(responses.POST, PROPERTY_DELETE_URL, json={"code": 0})
+
+    data = cache_api.get_url_property_list(app_id="app", return_json=True)
+    # the json from the cache is not shared with the callers.
+    data["data"]["url_property_list"].append("changed")
+    assert cache_api.get_url_property_list(app_id="app", return_json=True) == {
+        "code": 0,
+        "data": {"url_property_list": []},
+    }
+    assert len(responses.calls) == 1
+
+    cache_api.delete_url_property(app_id="app", property_type=1, url="example.com")
+    cache_api.get_url_property_list(app_id="app")
+    assert len(responses.calls) == 3
+
+    assert cache_api.cache.invalidate() == 1
+    cache_api.cache.clear()
+    assert cache_api.cache.info().hits == 0
+
+
+@responses.activate
+def test_cache_token_info(cache_api, helpers):
+    responses.add(
+        responses.POST,
+        TOKEN_INFO_URL,
+        json=helpers.load_json("testsdata/business/access_token/token_info_resp.json"),
+    )
+
+    for token in ["token_a", "token_a", "token_b"]:
+        info = cache_api.get_token_info(access_token=token)
+        assert info.creator_id == "openid"
+    assert len(responses.calls) == 2
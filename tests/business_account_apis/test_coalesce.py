@@ -0,0 +1,126 @@
+"""
+Tests for the request coalescing
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import responses
+
+from pytiktok import AsyncBusinessAccountApi, BusinessAccountApi
+from pytiktok.coalesce import AsyncRequestCoalescer, RequestCoalescer
+from pytiktok.error import PyTiktokError
+
+ACCOUNT_URL = "https://business-api.tiktok.com/open_api/v1.3/business/get/"
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+@responses.activate
+def test_coalesce_concurrent_gets():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+
+    def callback(request):
+        # hold the response until the other callers joined.
+        release.wait(5)
+        body = {"code": 0, "data": {"username": request.headers["Access-Token"]}}
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(responses.GET, ACCOUNT_URL, callback=callback)
+    apis = [
+        BusinessAccountApi(access_token="token", coalescer=coalescer) for _ in range(8)
+    ]
+    results = []
+
+    def call(api):
+        results.append(api.get_account_data(business_id="bid", fields=["username"]))
+
+    threads = [threading.Thread(target=call, args=(api,)) for api in apis]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: coalescer.coalesced == 7)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(responses.calls) == 1
+    assert [r.data.username for r in results] == ["token"] * 8
+    assert coalescer.in_flight == 0
+
+    # not in flight, or other tokens, are new requests.
+    apis[0].get_account_data(business_id="bid", fields=["username"])
+    BusinessAccountApi(access_token="other", coalescer=coalescer).get_account_data(
+        business_id="bid", fields=["username"]
+    )
+    assert len(responses.calls) == 3
+    assert coalescer.requests == 3
+
+
+@responses.activate
+def test_coalesce_error():
+    coalescer = RequestCoalescer()
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 40001, "message": "e"})
+    api = BusinessAccountApi(access_token="token", coalescer=coalescer)
+    with pytest.raises(PyTiktokError):
+        api.get_account_data(business_id="bid")
+    assert coalescer.in_flight == 0
+
+
+def test_coalesce_async():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"code": 0, "data": {"username": "name"}})
+
+    async def main():
+        async with AsyncBusinessAccountApi(
+            access_token="token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            coalescer=AsyncRequestCoalescer(),
+        ) as api:
+            same = [api.get_account_data(business_id="bid") for _ in range(5)]
+            other = api.get_account_data(business_id="other")
+            return await asyncio.gather(*same, other), api.coalescer
+
+    results, coalescer = asyncio.run(main())
+    assert [r.data.username for r in results] == ["name"] * 6
+    assert len(calls) == 2
+    assert (coalescer.requests, coalescer.coalesced) == (2, 4)
+
+
+def test_coalesce_async_leader_cancelled():
+    coalescer = AsyncRequestCoalescer()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"call": len(calls)}
+
+    async def main():
+        leader = asyncio.ensure_future(coalescer.run("key", func))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(coalescer.run("key", func)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(main())
+    # one of the waiters sends the request again, the others wait for it.
+    assert results == [{"call": 2}] * 3
+    assert len(calls) == 2
+    assert (coalescer.requests, coalescer.coalesced, coalescer.in_flight) == (2, 2, 0)
@@ -0,0 +1,100 @@
+"""
+Tests for the columnar video metrics
+"""
+
+import json
+import math
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from pytiktok.columns import VideoColumns
+
+PAGES = {
+    "0": {
+        "code": 0,
+        "data": {
+            "videos": [
+                {"item_id": "1", "video_views": 10, "likes": 1, "reach": 8},
+                {"item_id": "2", "video_views": 20.0, "likes": None, "reach": 9},
+            ],
+            "has_more": True,
+            "cursor": 2,
+        },
+    },
+    "2": {
+        "code": 0,
+        "data": {
+            "videos": [
+                {
+                    "item_id": "3",
+                    "video_views": 30,
+                    "likes": 3,
+                    "full_video_watched_rate": 0.5,
+                }
+            ],
+            "has_more": False,
+            "cursor": 3,
+        },
+    },
+}
+
+
+def page_callback(request):
+    query = parse_qs(urlparse(request.url).query)
+    return 200, {}, json.dumps(PAGES[query.get("cursor", ["0"])[0]])
+
+
+@responses.activate
+def test_get_video_columns(bus_api):
+    responses.add_callback(
+        responses.GET,
+        "https://business-api.tiktok.com/open_api/v1.3/business/video/list/",
+        callback=page_callback,
+    )
+    columns = bus_api.get_video_columns(
+        business_id="bid",
+        columns=["item_id", "video_views", "likes", "full_video_watched_rate"],
+    )
+    assert len(columns) == 3
+    query = parse_qs(urlparse(responses.calls[0].request.url).query)
+    assert json.loads(query["fields"][0]) == columns.names
+    data = columns.to_dict()
+    assert data["item_id"] == ["1", "2", "3"]
+    assert data["video_views"] == [10, 20, 30]
+    assert data["likes"] == [1, None, 3]
+    assert data["full_video_watched_rate"][:2] == [None, None]
+    assert data["full_video_watched_rate"][2] == 0.5
+
+    columns = bus_api.get_video_columns(business_id="bid", limit=1)
+    assert columns.to_dict()["item_id"] == ["1"]
+    assert len(responses.calls) == 3
+
+
+def test_columns_export():
+    columns = VideoColumns()
+    for page in PAGES.values():
+        columns.add_page(page)
+    with pytest.raises(ValueError):
+        VideoColumns(["unknown"])
+
+    numpy = pytest.importorskip("numpy")
+    arrays = columns.to_numpy()
+    assert arrays["video_views"].dtype == numpy.int64
+    assert arrays["video_views"].sum() == 60
+    assert arrays["likes"].mask.tolist() == [False, True, False]
+    assert arrays["reach"].mask.tolist() == [False, False, True]
+    assert math.isnan(arrays["full_video_watched_rate"][0])
+    assert arrays["full_video_watched_rate"][2] == 0.5
+    assert arrays["average_time_watched"].dtype == numpy.float64
+
+    pyarrow = pytest.importorskip("pyarrow")
+    table = columns.to_arrow()
+    assert table.column_names == columns.names
+    assert table.schema.field("likes").type == pyarrow.int64()
+    assert table.column("likes").to_pylist() == [1, None, 3]
+    assert table.column("reach").to_pylist() == [8, 9, None]
+    # the columns can grow after export.
+    columns.add_videos([{"item_id": "4", "likes": 4}])
+    assert columns.to_arrow().column("likes").to_pylist() == [1, None, 3, 4]
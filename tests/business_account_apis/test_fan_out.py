@@ -0,0 +1,47 @@
+"""
+Tests for the fan-out of api calls
+"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+import responses
+
+from pytiktok import PyTiktokError
+
+
+@responses.activate
+def test_fan_out(bus_api):
+    def callback(request):
+        business_id = parse_qs(urlparse(request.url).query)["business_id"][0]
+        if business_id == "bad":
+            return 200, {}, json.dumps({"code": 40001, "message": "error"})
+        body = {
+            "code": 0,
+            "data": {"username": request.headers["Access-Token"] + business_id},
+        }
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET,
+        "https://business-api.tiktok.com/open_api/v1.3/business/get/",
+        callback=callback,
+    )
+
+    calls = [(f"token{i}", f"id{i}", {"fields": ["username"]}) for i in range(10)]
+    calls.append(("token", "bad", None))
+    results = list(bus_api.fan_out("get_account_data", calls, max_workers=3))
+
+    assert len(results) == 11
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1
+    assert failed[0].item == ("token", "bad", None)
+    assert isinstance(failed[0].error, PyTiktokError)
+    usernames = {r.result.data.username for r in results if r.ok}
+    assert usernames == {f"token{i}id{i}" for i in range(10)}
+    # the origin api not changed
+    assert bus_api.access_token == "test_access_token"
+
+    with pytest.raises(PyTiktokError):
+        bus_api.fan_out("_request", calls)
@@ -0,0 +1,85 @@
+"""
+Tests for the bulk comment moderation
+"""
+
+import json
+
+import pytest
+import responses
+
+from pytiktok.error import PyTiktokError
+from pytiktok.retry import TokenBucket
+
+BASE_URL = "https://business-api.tiktok.com/open_api/v1.3/business/comment"
+
+
+def moderation_callback(bodies):
+    def callback(request):
+        body = json.loads(request.body)
+        bodies.append(body)
+        if body["comment_id"] == "bad":
+            return 200, {}, json.dumps({"code": 40001, "message": "error"})
+        return 200, {}, json.dumps({"code": 0, "message": "OK"})
+
+    return callback
+
+
+@responses.activate
+def test_hide_comments(bus_api):
+    bodies = []
+    responses.add_callback(
+        responses.POST, f"{BASE_URL}/hide/", callback=moderation_callback(bodies)
+    )
+    comments = [(f"v{i % 3}", f"c{i}") for i in range(20)]
+    comments.insert(5, ("v0", "bad"))
+    report = bus_api.hide_comments(
+        "bid",
+        comments,
+        max_workers=4,
+        rate_limiter=TokenBucket(rate=1000, capacity=1000),
+    )
+
+    assert [r.item for r in report.results] == comments
+    assert not report.ok
+    assert len(report.succeeded) == 20
+    assert [r.item for r in report.failed] == [("v0", "bad")]
+    assert isinstance(report.failed[0].error, PyTiktokError)
+    assert {(b["video_id"], b["comment_id"]) for b in bodies} == set(comments)
+    assert {b["action"] for b in bodies} == {"HIDE"}
+
+
+@responses.activate
+def test_moderate_comments(bus_api):
+    bodies = []
+    responses.add_callback(
+        responses.POST, f"{BASE_URL}/like/", callback=moderation_callback(bodies)
+    )
+    report = bus_api.moderate_comments(
+        "bid", "like", [("v1", "c1"), ("v1", "c2")], action="UNLIKE"
+    )
+    assert report.ok
+    assert bodies[0]["action"] == "UNLIKE"
+    assert "video_id" not in bodies[0]
+
+    with pytest.raises(PyTiktokError):
+        bus_api.moderate_comments("bid", "report", [("v1", "c1")])
+
+
+@responses.activate
+def test_delete_comments(bus_api):
+    bodies = []
+    responses.add_callback(
+        responses.POST, f"{BASE_URL}/delete/", callback=moderation_callback(bodies)
+    )
+    report = bus_api.delete_comments("bid", [("v1", "c1"), ("v2", "c2")])
+    assert report.ok
+    assert [b["comment_id"] for b in sorted(bodies, key=lambda b: b["comment_id"])] == [
+        "c1",
+        "c2",
+    ]
+    assert "action" not in bodies[0]
+
+    # delete does not take an action, rejected before any call.
+    with pytest.raises(PyTiktokError):
+        bus_api.delete_comments("bid", [("v1", "c1")], action="DELETE")
+    assert len(bodies) == 2
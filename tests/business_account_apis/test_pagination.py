@@ -0,0 +1,76 @@
+"""
+Tests for the auto paginating iterators
+"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+import responses
+
+import pytiktok.models as mds
+
+
+def page_callback(pages):
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        cursor = query.get("cursor", ["0"])[0]
+        return 200, {}, json.dumps(pages[cursor])
+
+    return callback
+
+
+@responses.activate
+def test_iter_account_videos(bus_api):
+    pages = {
+        "0": {
+            "code": 0,
+            "data": {
+                "videos": [{"item_id": "1"}, {"item_id": "2"}],
+                "has_more": True,
+                "cursor": 2,
+            },
+        },
+        "2": {
+            "code": 0,
+            "data": {"videos": [{"item_id": "3"}], "has_more": False, "cursor": 3},
+        },
+    }
+    responses.add_callback(
+        responses.GET,
+        "https://business-api.tiktok.com/open_api/v1.3/business/video/list/",
+        callback=page_callback(pages),
+    )
+
+    videos = list(bus_api.iter_account_videos(business_id="bid"))
+    assert [v.item_id for v in videos] == ["1", "2", "3"]
+    assert len(responses.calls) == 2
+    assert "max_count=20" in responses.calls[0].request.url
+
+    # limit stops requesting more pages
+    videos = list(bus_api.iter_account_videos(business_id="bid", limit=2))
+    assert [v.item_id for v in videos] == ["1", "2"]
+    assert len(responses.calls) == 3
+
+    # the raw json of the items is kept while the page is alive.
+    pages["0"]["data"]["videos"][0]["unknown_key"] = "value"
+    mds.BusinessVideo.raw_json_mode = "weakref"
+    try:
+        for video in bus_api.iter_account_videos(business_id="bid", limit=1):
+            assert video.raw_json["unknown_key"] == "value"
+    finally:
+        del mds.BusinessVideo.raw_json_mode
+
+
+@responses.activate
+def test_iter_video_comments(bus_api, helpers):
+    data = helpers.load_json("testsdata/business/comment/comments_resp.json")
+    responses.add(
+        responses.GET,
+        "https://business-api.tiktok.com/open_api/v1.3/business/comment/list/",
+        json=data,
+    )
+
+    comments = list(bus_api.iter_video_comments(business_id="bid", video_id="vid"))
+    assert len(comments) == 2
+    assert comments[0].comment_id == "7115323427445417734"
+    assert "max_count=30" in responses.calls[0].request.url
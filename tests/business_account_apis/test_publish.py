@@ -0,0 +1,94 @@
+"""
+Tests for the publish pipeline
+"""
+
+import json
+from collections import Counter
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+import responses
+
+from pytiktok.publish import PublishFailed, PublishPoller, PublishTimeout
+
+BASE_URL = "https://business-api.tiktok.com/open_api/v1.3/business"
+
+
+def add_publish_responses(statuses):
+    """
+    Mock the publish apis. The status for a post is taken from its list by the number of checks.
+    """
+    polls = Counter()
+    share_ids = iter(statuses)
+
+    def publish_callback(request):
+        body = {"code": 0, "data": {"share_id": next(share_ids)}}
+        return 200, {}, json.dumps(body)
+
+    def status_callback(request):
+        publish_id = parse_qs(urlparse(request.url).query)["publish_id"][0]
+        items = statuses[publish_id]
+        status = items[min(polls[publish_id], len(items) - 1)]
+        polls[publish_id] += 1
+        return 200, {}, json.dumps({"code": 0, "data": status})
+
+    responses.add_callback(
+        responses.POST, f"{BASE_URL}/video/publish/", callback=publish_callback
+    )
+    responses.add_callback(
+        responses.POST, f"{BASE_URL}/photo/publish/", callback=publish_callback
+    )
+    responses.add_callback(
+        responses.GET, f"{BASE_URL}/publish/status/", callback=status_callback
+    )
+    return polls
+
+
+def processing():
+    return {"status": "PROCESSING_DOWNLOAD"}
+
+
+@responses.activate
+def test_publish_many(bus_api):
+    statuses = {
+        f"v_pub_{i}": [processing()] * i
+        + [{"status": "PUBLISH_COMPLETE", "post_ids": [f"post{i}"]}]
+        for i in range(5)
+    }
+    statuses["v_pub_bad"] = [
+        processing(),
+        {"status": "FAILED", "reason": "file_format_check_failed"},
+    ]
+    polls = add_publish_responses(statuses)
+    poller = PublishPoller(initial_interval=0.01, max_interval=0.05)
+
+    handles = [
+        bus_api.publish_video("bid", "https://example.com/v.mp4", {}, poller=poller)
+        for _ in range(5)
+    ]
+    handles.append(
+        bus_api.publish_photo("bid", ["https://example.com/p.jpg"], {}, poller=poller)
+    )
+
+    for i, handle in enumerate(handles[:5]):
+        assert handle.result(timeout=5).post_ids == [f"post{i}"]
+        assert handle.polls == i + 1
+    with pytest.raises(PublishFailed) as e:
+        handles[5].result(timeout=5)
+    assert e.value.status.reason == "file_format_check_failed"
+    assert polls["v_pub_bad"] == 2
+    assert poller.pending == 0
+
+
+@responses.activate
+def test_publish_timeout(bus_api):
+    add_publish_responses({"v_pub_slow": [processing()]})
+    poller = PublishPoller(initial_interval=0.01, max_interval=0.01, timeout=0.1)
+
+    handle = bus_api.publish_video(
+        "bid", "https://example.com/v.mp4", {}, poller=poller
+    )
+    with pytest.raises(PublishTimeout):
+        handle.result(timeout=5)
+    assert handle.status.status == "PROCESSING_DOWNLOAD"
+    assert handle.polls > 1
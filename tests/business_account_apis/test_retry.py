@@ -0,0 +1,105 @@
+"""
+Tests for the retry policy and rate limiter
+"""
+
+import time
+
+import pytest
+import responses
+
+from pytiktok import BusinessAccountApi, PyTiktokError
+from pytiktok.retry import RetryPolicy, TokenBucket
+
+ACCOUNT_URL = "https://business-api.tiktok.com/open_api/v1.3/business/get/"
+
+
+@pytest.fixture
+def retry_api():
+    return BusinessAccountApi(
+        access_token="test_access_token",
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+    )
+
+
+@responses.activate
+def test_retry_codes(retry_api):
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 40100, "message": "busy"})
+    responses.add(
+        responses.GET, ACCOUNT_URL, json={"code": 0, "data": {"username": "a"}}
+    )
+
+    resp = retry_api.get_account_data(business_id="bid")
+    assert resp.data.username == "a"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_retry_exhausted(retry_api):
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 40100, "message": "busy"})
+
+    with pytest.raises(PyTiktokError):
+        retry_api.get_account_data(business_id="bid")
+    assert len(responses.calls) == 3
+
+    # error codes not safe to retry
+    responses.replace(responses.GET, ACCOUNT_URL, json={"code": 40002})
+    with pytest.raises(PyTiktokError):
+        retry_api.get_account_data(business_id="bid")
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_retry_status(retry_api):
+    publish_url = (
+        "https://business-api.tiktok.com/open_api/v1.3/business/video/publish/"
+    )
+    responses.add(responses.GET, ACCOUNT_URL, status=503)
+    responses.add(responses.GET, ACCOUNT_URL, status=429, headers={"Retry-After": "0"})
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 0, "data": {}})
+    retry_api.get_account_data(business_id="bid")
+    assert len(responses.calls) == 3
+
+    # server error for not idempotent method will not retry
+    responses.add(responses.POST, publish_url, status=502)
+    with pytest.raises(PyTiktokError):
+        retry_api.create_video(business_id="bid", video_url="url", post_info={})
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_retry_system_error(retry_api):
+    publish_url = (
+        "https://business-api.tiktok.com/open_api/v1.3/business/video/publish/"
+    )
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 50000})
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 0, "data": {}})
+    retry_api.get_account_data(business_id="bid")
+    assert len(responses.calls) == 2
+
+    # system error for not idempotent method will not resend the video
+    responses.add(responses.POST, publish_url, json={"code": 50000})
+    with pytest.raises(PyTiktokError):
+        retry_api.create_video(business_id="bid", video_url="url", post_info={})
+    assert len(responses.calls) == 3
+
+    # rate limit is retried for any method
+    responses.replace(responses.POST, publish_url, json={"code": 40100})
+    with pytest.raises(PyTiktokError):
+        retry_api.create_video(business_id="bid", video_url="url", post_info={})
+    assert len(responses.calls) == 6
+
+
+def test_retry_policy():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_backoff(i) for i in range(4)] == [1, 2, 4, 5]
+    assert policy.parse_retry_after("3") == 3
+    assert policy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert policy.parse_retry_after("invalid") is None
+
+
+def test_token_bucket():
+    limiter = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.05
@@ -0,0 +1,145 @@
+"""
+Tests for the persistent page store
+"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+import responses
+
+from pytiktok import BusinessAccountApi
+from pytiktok.store import PageStore
+
+VIDEOS_URL = "https://business-api.tiktok.com/open_api/v1.3/business/video/list/"
+COMMENTS_URL = "https://business-api.tiktok.com/open_api/v1.3/business/comment/list/"
+
+VIDEO_PAGES = {
+    "0": {
+        "code": 0,
+        "data": {
+            "videos": [{"item_id": "1"}, {"item_id": "2"}],
+            "has_more": True,
+            "cursor": 2,
+        },
+    },
+    "2": {
+        "code": 0,
+        "data": {"videos": [{"item_id": "3"}], "has_more": False, "cursor": 3},
+    },
+}
+
+
+def page_callback(pages):
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        cursor = query.get("cursor", ["0"])[0]
+        return 200, {}, json.dumps(pages[cursor])
+
+    return callback
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@responses.activate
+def test_store_survives_restart(tmp_path):
+    responses.add_callback(
+        responses.GET, VIDEOS_URL, callback=page_callback(VIDEO_PAGES)
+    )
+    path = str(tmp_path / "crawl.db")
+
+    with PageStore(path) as store:
+        api = BusinessAccountApi(access_token="token", store=store)
+        videos = list(api.iter_account_videos(business_id="bid"))
+        assert [v.item_id for v in videos] == ["1", "2", "3"]
+        assert len(responses.calls) == 2
+
+    # restarted crawler
+    with PageStore(path) as store:
+        api = BusinessAccountApi(access_token="token", store=store)
+        videos = list(api.iter_account_videos(business_id="bid"))
+        assert [v.item_id for v in videos] == ["1", "2", "3"]
+        assert len(responses.calls) == 2
+        assert (store.hits, store.misses) == (2, 0)
+        assert [item["item_id"] for item in store.iter_items("videos", "bid")] == [
+            "1",
+            "2",
+            "3",
+        ]
+
+        # other params are other pages
+        list(api.iter_account_videos(business_id="bid", fields=["item_id", "likes"]))
+        assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_store_freshness():
+    responses.add_callback(
+        responses.GET, VIDEOS_URL, callback=page_callback(VIDEO_PAGES)
+    )
+    timer = FakeTimer()
+    store = PageStore(max_age=3600, head_max_age=60, timer=timer)
+    api = BusinessAccountApi(access_token="token", store=store)
+
+    list(api.iter_account_videos(business_id="bid"))
+    info = store.get_page_info("videos", "bid", query={"max_count": 20})
+    assert info.fresh and info.age == 0
+
+    # only the first page is refreshed
+    timer.now += 120
+    list(api.iter_account_videos(business_id="bid"))
+    assert len(responses.calls) == 3
+
+    timer.now += 3600
+    assert store.get_page("videos", "bid", query={"max_count": 20}, cursor=2) is None
+    assert store.get_page(
+        "videos", "bid", query={"max_count": 20}, cursor=2, allow_stale=True
+    )
+    list(api.iter_account_videos(business_id="bid"))
+    assert len(responses.calls) == 5
+    store.close()
+
+    # the first page expires by default, even the pages never expire.
+    with PageStore(timer=timer) as store:
+        assert (store.max_age, store.head_max_age) == (None, 300)
+        assert not store._is_fresh(None, 301) and store._is_fresh(2, 10**9)
+    # not longer than max_age, None for same as max_age.
+    with PageStore(max_age=60) as store:
+        assert store.head_max_age == 60
+    with PageStore(max_age=3600, head_max_age=None) as store:
+        assert store.head_max_age == 3600
+
+
+@responses.activate
+def test_store_comments():
+    responses.add(
+        responses.GET,
+        COMMENTS_URL,
+        json={
+            "code": 0,
+            "data": {
+                "comments": [{"comment_id": "c1", "video_id": "v1"}],
+                "has_more": False,
+                "cursor": 1,
+            },
+        },
+    )
+    store = PageStore()
+    api = BusinessAccountApi(access_token="token", store=store)
+
+    for _ in range(2):
+        comments = list(api.iter_video_comments(business_id="bid", video_id="v1"))
+        assert comments[0].comment_id == "c1"
+    assert len(responses.calls) == 1
+    assert len(list(store.iter_items("comments", "bid", video_id="v1"))) == 1
+    assert list(store.iter_items("comments", "bid", video_id="v2")) == []
+
+    store.clear(kind="comments", business_id="bid")
+    list(api.iter_video_comments(business_id="bid", video_id="v1"))
+    assert len(responses.calls) == 2
+    store.close()
@@ -0,0 +1,94 @@
+"""
+Tests for the incremental comment sync
+"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+import responses
+
+from pytiktok import BusinessAccountApi
+from pytiktok.store import PageStore
+from pytiktok.sync import CommentWatermark
+
+COMMENTS_URL = "https://business-api.tiktok.com/open_api/v1.3/business/comment/list/"
+
+
+def comments_callback(comments):
+    """
+    Pages of the comments by offset cursor, sorted by create time desc.
+    """
+
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        assert query["sort_field"] == ["create_time"]
+        assert query["sort_order"] == ["desc"]
+        cursor = int(query.get("cursor", ["0"])[0])
+        size = int(query["max_count"][0])
+        page = sorted(comments, key=lambda c: -c["create_time"])[cursor : cursor + size]
+        data = {
+            "comments": page,
+            "cursor": cursor + len(page),
+            "has_more": cursor + len(page) < len(comments),
+        }
+        return 200, {}, json.dumps({"code": 0, "data": data})
+
+    return callback
+
+
+def comment(comment_id, create_time):
+    return {"comment_id": comment_id, "create_time": create_time, "text": comment_id}
+
+
+@responses.activate
+def test_sync_video_comments():
+    comments = [
+        comment("c1", 20),
+        comment("c2", 30),
+        comment("c3", 40),
+        comment("c4", 40),
+        comment("c5", 50),
+    ]
+    responses.add_callback(
+        responses.GET, COMMENTS_URL, callback=comments_callback(comments)
+    )
+    store = PageStore()
+    api = BusinessAccountApi(access_token="token", store=store)
+
+    result = api.sync_video_comments(business_id="bid", video_id="vid", max_count=2)
+    assert [c.comment_id for c in result.comments] == ["c5", "c3", "c4", "c2", "c1"]
+    assert result.pages == 3
+    assert result.watermark == CommentWatermark(create_time=50, comment_ids=["c5"])
+    assert store.get_watermark("bid", "vid") == result.watermark.to_dict()
+
+    # new comments, one in the same second with the watermark.
+    comments += [comment("c6", 60), comment("c7", 50)]
+    result = api.sync_video_comments(business_id="bid", video_id="vid", max_count=2)
+    assert {c.comment_id for c in result.comments} == {"c6", "c7"}
+    assert result.pages == 2
+    assert result.watermark.create_time == 60
+
+    # nothing new, only the first page requested.
+    calls = len(responses.calls)
+    result = api.sync_video_comments(business_id="bid", video_id="vid", max_count=2)
+    assert result.comments == []
+    assert result.pages == 1
+    assert result.watermark.create_time == 60
+    assert len(responses.calls) == calls + 1
+    store.close()
+
+
+@responses.activate
+def test_sync_with_given_watermark():
+    comments = [comment("c1", 10), comment("c2", 20), comment("c3", 20)]
+    responses.add_callback(
+        responses.GET, COMMENTS_URL, callback=comments_callback(comments)
+    )
+    api = BusinessAccountApi(access_token="token")
+
+    watermark = CommentWatermark.from_dict({"create_time": 20, "comment_ids": ["c2"]})
+    result = api.sync_video_comments(
+        business_id="bid", video_id="vid", watermark=watermark
+    )
+    assert [c.comment_id for c in result.comments] == ["c3"]
+    assert result.watermark.comment_ids == ["c2", "c3"]
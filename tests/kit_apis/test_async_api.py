@@ -0,0 +1,57 @@
+"""
+Tests for the asyncio kit api
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from pytiktok import AsyncKitApi
+
+
+def test_get_user_videos(helpers):
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=data)
+
+    async def main():
+        async with AsyncKitApi(
+            access_token="test_access_token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as api:
+            return await api.get_user_videos(open_id="open_id", max_count=20)
+
+    resp = asyncio.run(main())
+    assert resp.data.videos[0].id == "6963640889373723909"
+    assert bodies[0]["access_token"] == "test_access_token"
+    assert bodies[0]["max_count"] == 20
+
+
+def test_request_not_change_json():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"data": {}})
+
+    payload = {"open_id": "open_id"}
+
+    async def main():
+        async with AsyncKitApi(
+            access_token="test_access_token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as api:
+            await api._request(path="user/info/", json=payload)
+            api.access_token = "new_access_token"
+            await api._request(path="user/info/", json=payload)
+
+    asyncio.run(main())
+    assert payload == {"open_id": "open_id"}
+    assert [b["access_token"] for b in bodies] == [
+        "test_access_token",
+        "new_access_token",
+    ]
@@ -0,0 +1,74 @@
+"""
+Tests for the bulk video query
+"""
+
+import asyncio
+import json
+
+import httpx
+import responses
+
+from pytiktok import AsyncKitApi, KitApi
+from pytiktok.error import PyTiktokError
+
+QUERY_URL = "https://open-api.tiktok.com/video/query/"
+
+
+def query_response(body):
+    """
+    Return the videos with the even ids, and fail the chunk with id "bad".
+    """
+    ids = body["filters"]["video_ids"]
+    assert len(ids) <= 20
+    assert "id" in body["fields"]
+    if "bad" in ids:
+        return {"data": {}, "error": {"code": 2100005, "message": "Invalid parameter"}}
+    videos = [{"id": i, "view_count": 1} for i in ids if int(i) % 2 == 0]
+    return {"data": {"videos": videos}, "error": {"code": 0}}
+
+
+def video_ids():
+    return [str(i) for i in range(45)] + ["0", "1", "bad"]
+
+
+def check_result(result):
+    # chunks: 0-19, 20-39, and 40-44 with "bad" which failed.
+    assert len(result.videos) == 20
+    assert result.videos["38"].view_count == 1
+    assert result.missing == [str(i) for i in range(1, 40, 2)]
+    assert set(result.errors) == {"40", "41", "42", "43", "44", "bad"}
+
+
+@responses.activate
+def test_query_videos_bulk():
+    bodies = []
+
+    def callback(request):
+        body = json.loads(request.body)
+        bodies.append(body)
+        return 200, {}, json.dumps(query_response(body))
+
+    responses.add_callback(responses.POST, QUERY_URL, callback=callback)
+    api = KitApi(access_token="test_access_token")
+    result = api.query_videos_bulk(
+        open_id="open_id", video_ids=video_ids(), fields=["view_count"]
+    )
+    assert len(bodies) == 3
+    assert isinstance(result.errors["bad"], PyTiktokError)
+    check_result(result)
+
+
+def test_query_videos_bulk_async():
+    def handler(request):
+        return httpx.Response(200, json=query_response(json.loads(request.content)))
+
+    async def main():
+        async with AsyncKitApi(
+            access_token="test_access_token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as api:
+            return await api.query_videos_bulk(
+                open_id="open_id", video_ids=video_ids(), max_concurrency=2
+            )
+
+    check_result(asyncio.run(main()))
@@ -0,0 +1,20 @@
+"""
+Tests for the auto paginating iterators
+"""
+
+import json
+
+import responses
+
+from pytiktok import KitApi
+
+
+@responses.activate
+def test_iter_user_videos(helpers):
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    responses.add(responses.POST, "https://open-api.tiktok.com/video/list/", json=data)
+
+    api = KitApi(access_token="test_access_token")
+    videos = list(api.iter_user_videos(open_id="open_id"))
+    assert [v.id for v in videos] == ["6963640889373723909", "6963640889373723908"]
+    assert json.loads(responses.calls[0].request.body)["max_count"] == 20
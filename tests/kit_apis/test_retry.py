@@ -0,0 +1,62 @@
+"""
+Tests for the retry policy
+"""
+
+import io
+
+import pytest
+import requests
+import responses
+
+from pytiktok import KitApi, PyTiktokError
+from pytiktok.retry import RetryPolicy
+from pytiktok.transport import FakeTransport
+
+
+@responses.activate
+def test_retry_codes(helpers):
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    url = "https://open-api.tiktok.com/video/list/"
+    busy = {
+        "data": {},
+        "error": {"code": 2100004, "message": "System busy", "log_id": "log"},
+    }
+    responses.add(responses.POST, url, json=busy)
+    responses.add(responses.POST, url, status=429)
+    responses.add(responses.POST, url, json=data)
+
+    api = KitApi(
+        access_token="test_access_token",
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    resp = api.get_user_videos(open_id="open_id")
+    assert len(resp.data.videos) == 2
+    assert len(responses.calls) == 3
+
+
+def test_retry_read_posts(helpers):
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+
+    def timeout(request):
+        raise requests.Timeout("timeout")
+
+    transport = FakeTransport(
+        {
+            "video/list/": [(500, {}), timeout, data],
+            "share/video/upload/": (500, {"error": {"code": 1, "message": "error"}}),
+        }
+    )
+    api = KitApi(
+        access_token="test_access_token",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    # the kit api reads data by POST, which is safe to retry.
+    resp = api.get_user_videos(open_id="open_id")
+    assert len(resp.data.videos) == 2
+    assert len(transport.calls) == 3
+
+    # the upload is not idempotent, not retried.
+    with pytest.raises(PyTiktokError):
+        api.share_video(open_id="open_id", video=io.BytesIO(b"video"))
+    assert len(transport.calls) == 4
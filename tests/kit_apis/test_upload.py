@@ -0,0 +1,117 @@
+"""
+Tests for the streaming upload
+"""
+
+import asyncio
+import io
+import json
+import threading
+
+import httpx
+import pytest
+import responses
+
+from pytiktok import AsyncKitApi, KitApi
+from pytiktok.upload import MultipartFileStream
+
+SHARE_URL = "https://open-api.tiktok.com/share/video/upload/"
+SHARE_RESP = {"data": {"err_code": 0, "share_id": "v_inbox.1"}, "extra": {}}
+
+
+def parse_multipart(body, content_type):
+    boundary = content_type.split("boundary=")[1].encode()
+    parts = body.split(b"--" + boundary)
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    headers, content = parts[1].split(b"\r\n\r\n", 1)
+    return headers.decode(), content[:-2]
+
+
+@pytest.mark.parametrize("on_disk", [True, False])
+def test_multipart_stream(tmp_path, on_disk):
+    content = bytes(range(256)) * 1000
+    if on_disk:
+        path = tmp_path / "video.mp4"
+        path.write_bytes(content)
+        file = open(path, "rb")
+    else:
+        file = io.BytesIO(content)
+        file.name = "video.mp4"
+
+    progress = []
+    with file, MultipartFileStream(
+        "video",
+        file,
+        chunk_size=4096,
+        progress=lambda sent, total: progress.append((sent, total)),
+    ) as stream:
+        assert (stream._mmap is not None) == on_disk
+        body = b"".join(iter(lambda: stream.read(1000), b""))
+        assert len(body) == len(stream)
+        headers, data = parse_multipart(body, stream.content_type)
+        assert 'name="video"; filename="video.mp4"' in headers
+        assert data == content
+        assert len(progress) == len(content) // 1000
+        assert progress[-1] == (len(content), len(content))
+
+        # can be read again
+        stream.rewind()
+        assert b"".join(stream) == body
+
+
+@responses.activate
+def test_share_video_stream(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"video" * 100000)
+    bodies = []
+
+    def callback(request):
+        # responses has read the stream
+        body = request.body
+        assert int(request.headers["Content-Length"]) == len(body)
+        bodies.append(parse_multipart(body, request.headers["Content-Type"]))
+        return 200, {}, json.dumps(SHARE_RESP)
+
+    responses.add_callback(responses.POST, SHARE_URL, callback=callback)
+    api = KitApi(access_token="test_access_token")
+    progress = []
+    with open(path, "rb") as f:
+        resp = api.share_video(
+            open_id="open_id",
+            video=f,
+            progress=lambda sent, total: progress.append(sent),
+        )
+    assert resp.data.share_id == "v_inbox.1"
+    assert bodies[0][1] == b"video" * 100000
+    assert progress[-1] == 500000
+
+
+def test_share_video_stream_async():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=SHARE_RESP)
+
+    async def main():
+        async with AsyncKitApi(
+            access_token="test_access_token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as api:
+            return await api.share_video(
+                open_id="open_id",
+                video=io.BytesIO(b"video" * 1000),
+                stream=True,
+                chunk_size=1000,
+                progress=lambda sent, total: threads.append(threading.get_ident()),
+            )
+
+    threads = []
+    resp = asyncio.run(main())
+    assert resp.data.share_id == "v_inbox.1"
+    request = requests[0]
+    assert int(request.headers["Content-Length"]) == len(request.content)
+    _, data = parse_multipart(request.content, request.headers["Content-Type"])
+    assert data == b"video" * 1000
+    # the chunks are read out of the event loop thread.
+    assert len(threads) == 5
+    assert threading.get_ident() not in threads
@@ -0,0 +1,166 @@
+"""
+Tests for the access token provider
+"""
+
+import threading
+import time
+
+import pytest
+import responses
+
+from pytiktok import BusinessAccountApi, KitApi
+from pytiktok.auth import TokenProvider
+from pytiktok.error import PyTiktokError
+
+BUSINESS_URL = "https://business-api.tiktok.com/open_api/v1.3/business/get/"
+REFRESH_URL = (
+    "https://business-api.tiktok.com/open_api/v1.3/tt_user/oauth2/refresh_token/"
+)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def token_data(index):
+    return {
+        "access_token": f"token{index}",
+        "refresh_token": f"refresh{index}",
+        "expires_in": 3600,
+    }
+
+
+def test_refresh_ahead_of_expiry():
+    timer = FakeTimer()
+    calls = []
+
+    def refresh(refresh_token):
+        calls.append(refresh_token)
+        return token_data(len(calls))
+
+    saved = []
+    provider = TokenProvider(
+        access_token="token0",
+        refresh_token="refresh0",
+        expires_in=3600,
+        refresh=refresh,
+        refresh_ahead=300,
+        jitter=60,
+        on_refresh=saved.append,
+        timer=timer,
+    )
+    timer.now += 3600 - 360 - 1
+    assert provider.get_token() == "token0"
+    assert calls == []
+
+    timer.now += 61
+    assert provider.get_token() == "token1"
+    assert calls == ["refresh0"]
+    assert saved == [token_data(1)]
+    assert provider.refresh_token == "refresh1"
+
+    # rejected token is refreshed again, but the old one is ignored.
+    assert provider.invalidate("token1") == "token2"
+    assert provider.invalidate("token1") == "token2"
+    assert provider.refresh_count == 2
+
+
+def test_refresh_failed():
+    timer = FakeTimer()
+
+    def refresh(refresh_token):
+        raise PyTiktokError("server error")
+
+    provider = TokenProvider(
+        access_token="token0",
+        refresh_token="refresh0",
+        expires_in=3600,
+        refresh=refresh,
+        jitter=0,
+        timer=timer,
+    )
+    # still valid, use the current token
+    timer.now += 3400
+    assert provider.get_token() == "token0"
+
+    timer.now += 300
+    with pytest.raises(PyTiktokError):
+        provider.get_token()
+
+
+def test_single_flight_refresh():
+    calls = []
+
+    def refresh(refresh_token):
+        calls.append(refresh_token)
+        time.sleep(0.05)
+        return token_data(1)
+
+    provider = TokenProvider(
+        access_token="token0", refresh_token="refresh0", refresh=refresh
+    )
+    tokens = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(provider.invalidate("token0")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ["refresh0"]
+    assert tokens == ["token1"] * 8
+
+
+@responses.activate
+def test_business_retry_with_new_token(helpers):
+    data = helpers.load_json("testsdata/business/access_token/refresh_resp.json")
+    responses.add(responses.POST, REFRESH_URL, json=data)
+    responses.add(
+        responses.GET,
+        BUSINESS_URL,
+        json={"code": 40105, "message": "Access token is invalid or revoked."},
+    )
+    responses.add(
+        responses.GET, BUSINESS_URL, json={"code": 0, "data": {"username": "name"}}
+    )
+
+    provider = TokenProvider(access_token="token0", refresh_token="refresh0")
+    api = BusinessAccountApi(app_id="id", app_secret="secret", token_provider=provider)
+    account = api.get_account_data(business_id="bid")
+    assert account.data.username == "name"
+    assert len(responses.calls) == 3
+    assert responses.calls[0].request.headers["Access-Token"] == "token0"
+    new_token = data["data"]["access_token"]
+    assert responses.calls[2].request.headers["Access-Token"] == new_token
+    assert api.access_token == new_token
+
+
+@responses.activate
+def test_kit_retry_with_new_token(helpers):
+    videos = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    url = "https://open-api.tiktok.com/video/list/"
+    expired = {
+        "data": {},
+        "error": {
+            "code": 2190008,
+            "message": "Access token expired",
+            "log_id": "20220701071524010004003007735002053068B3FD9",
+        },
+    }
+    responses.add(responses.POST, url, json=expired)
+    responses.add(responses.POST, url, json=videos)
+
+    provider = TokenProvider(
+        access_token="token0",
+        refresh_token="refresh0",
+        refresh=lambda refresh_token: token_data(1),
+    )
+    api = KitApi(token_provider=provider)
+    resp = api.get_user_videos(open_id="open_id")
+    assert len(resp.data.videos) == 2
+    assert b'"access_token":"token1"' in responses.calls[1].request.body
@@ -0,0 +1,131 @@
+"""
+Tests for the json codec
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import responses
+
+from pytiktok import AsyncKitApi, BusinessAccountApi, KitApi, PyTiktokError
+from pytiktok.codec import (
+    CODECS,
+    JsonCodec,
+    JsonDict,
+    detect_codec,
+    get_codec,
+    load_response,
+    set_default_codec,
+)
+from pytiktok.retry import RetryPolicy
+
+ACCOUNT_URL = "https://business-api.tiktok.com/open_api/v1.3/business/get/"
+KIT_VIDEO_URL = "https://open-api.tiktok.com/video/list/"
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.loads_count = 0
+        self.dumps_count = 0
+
+        def loads(data):
+            self.loads_count += 1
+            return json.loads(data)
+
+        def dumps(obj):
+            self.dumps_count += 1
+            return json.dumps(obj).encode("utf-8")
+
+        super().__init__("counting", loads, dumps)
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_codecs(name):
+    codec = get_codec(name)
+    data = {"fields": ["item_id", "caption"], "text": "中文", "num": 1.5}
+    assert json.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps_str(data)) == data
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>")
+
+
+def test_get_codec():
+    assert get_codec().name == "json"
+    assert get_codec("auto") is detect_codec()
+    codec = CountingCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(PyTiktokError):
+        get_codec("unknown")
+
+    try:
+        assert set_default_codec(codec) is codec
+        assert get_codec() is codec
+    finally:
+        set_default_codec("json")
+
+
+@responses.activate
+def test_api_use_codec():
+    responses.add(responses.GET, ACCOUNT_URL, json={"code": 0, "data": {}})
+    codec = CountingCodec()
+    api = BusinessAccountApi(
+        access_token="token",
+        json_codec=codec,
+        retry_policy=RetryPolicy(max_retries=1),
+    )
+
+    api.get_account_data(business_id="bid", fields=["username"])
+    # decoded once by retry check and parse_response
+    assert codec.loads_count == 1
+    assert codec.dumps_count == 1
+    assert responses.calls[0].request.params["fields"] == '["username"]'
+
+    responses.add(responses.POST, KIT_VIDEO_URL, json={"data": {"videos": []}})
+    kit = KitApi(access_token="token", json_codec=codec)
+    kit.get_user_videos(open_id="open_id", max_count=10)
+    request = responses.calls[1].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.body)["access_token"] == "token"
+
+
+def test_async_api_use_codec():
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content)["cursor"] == 1
+        return httpx.Response(200, json={"data": {"videos": []}})
+
+    codec = CountingCodec()
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncKitApi(
+            access_token="token", client=client, json_codec=codec
+        ) as api:
+            return await api.get_user_videos(open_id="open_id", cursor=1)
+
+    resp = asyncio.run(run())
+    assert resp.data.videos == []
+    assert codec.loads_count == 1
+
+
+def test_load_response_cached():
+    response = httpx.Response(200, content=b'{"code": 0}')
+    codec = CountingCodec()
+    assert load_response(response, codec) == {"code": 0}
+    assert load_response(response, codec) is load_response(response)
+    assert codec.loads_count == 1
+    # the top dict can be kept by the models in weakref raw json mode.
+    assert isinstance(load_response(response), JsonDict)
+
+
+def test_parse_response_static():
+    response = httpx.Response(200, content=b'{"code": 0, "data": {}}')
+    assert BusinessAccountApi.parse_response(response) == {"code": 0, "data": {}}
+    codec = CountingCodec()
+    response = httpx.Response(200, content=b'{"error": {"code": 1}}')
+    with pytest.raises(PyTiktokError):
+        KitApi.parse_response(response, codec)
+    assert codec.loads_count == 1
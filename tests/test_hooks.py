@@ -0,0 +1,119 @@
+"""
+Tests for the request lifecycle hooks
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+
+from pytiktok import AsyncBusinessAccountApi, BusinessAccountApi, KitApi
+from pytiktok.error import PyTiktokError
+from pytiktok.hooks import RequestHooks
+from pytiktok.retry import RetryPolicy
+
+ACCOUNT_URL = "https://business-api.tiktok.com/open_api/v1.3/business/get/"
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def hooks(self):
+        return RequestHooks(
+            before_request=lambda e: self.events.append(("before", e.path)),
+            after_response=lambda e: self.events.append(("after", e)),
+            on_error=lambda e: self.events.append(("error", e)),
+        )
+
+
+@responses.activate
+def test_business_hooks():
+    body = {"code": 0, "request_id": "req1", "data": {"username": "name"}}
+    responses.add(responses.GET, ACCOUNT_URL, json=body)
+    responses.add(
+        responses.GET,
+        ACCOUNT_URL,
+        json={"code": 40001, "request_id": "req2", "message": "error"},
+    )
+    responses.add(responses.GET, ACCOUNT_URL, body=requests.ConnectionError("down"))
+    recorder = Recorder()
+    api = BusinessAccountApi(access_token="token", hooks=recorder.hooks())
+
+    api.get_account_data(business_id="bid")
+    assert recorder.events[0] == ("before", "business/get/")
+    kind, event = recorder.events[1]
+    assert kind == "after"
+    assert (event.method, event.path, event.url) == (
+        "GET",
+        "business/get/",
+        ACCOUNT_URL,
+    )
+    assert (event.status, event.code, event.request_id) == (200, 0, "req1")
+    assert event.bytes_in == len(responses.calls[0].response.content)
+    assert event.bytes_out == 0
+    assert event.network_time > 0 and event.decode_time > 0
+
+    # the error in body is an event after response
+    with pytest.raises(PyTiktokError):
+        api.get_account_data(business_id="bid")
+    assert recorder.events[3][1].code == 40001
+
+    with pytest.raises(requests.ConnectionError):
+        api.get_account_data(business_id="bid")
+    kind, event = recorder.events[5]
+    assert kind == "error"
+    assert isinstance(event.error, requests.ConnectionError)
+    assert event.status is None
+
+
+@responses.activate
+def test_kit_hooks_with_retry(helpers):
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    url = "https://open-api.tiktok.com/video/list/"
+    responses.add(
+        responses.POST,
+        url,
+        json={"data": {}, "error": {"code": 2100004, "message": "System busy"}},
+    )
+    responses.add(responses.POST, url, json=data)
+    recorder = Recorder()
+    api = KitApi(
+        access_token="token",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        hooks=recorder.hooks(),
+    )
+
+    api.get_user_videos(open_id="open_id")
+    # one event for the retried request
+    assert len(recorder.events) == 2
+    event = recorder.events[1][1]
+    assert event.code == 0
+    assert event.request_id == data["error"]["log_id"]
+    assert event.bytes_out == len(responses.calls[1].request.body)
+    assert event.decode_time > 0
+
+
+def test_async_hooks():
+    def handler(request):
+        return httpx.Response(200, json={"code": 0, "request_id": "req1", "data": {}})
+
+    recorder = Recorder()
+
+    async def main():
+        async with AsyncBusinessAccountApi(
+            access_token="token",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hooks=recorder.hooks(),
+        ) as api:
+            await api.get_account_data(business_id="bid")
+
+    asyncio.run(main())
+    event = recorder.events[1][1]
+    assert (event.path, event.status, event.request_id) == (
+        "business/get/",
+        200,
+        "req1",
+    )
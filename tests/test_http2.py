@@ -0,0 +1,204 @@
+"""
+Tests for the HTTP/2 transport, against a local h2 server
+"""
+
+import json
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from pytiktok import BusinessAccountApi
+from pytiktok.retry import RetryPolicy
+from pytiktok.transport import HttpxTransport, RequestsTransport
+
+h2 = pytest.importorskip("h2")
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+
+BODY = json.dumps(
+    {"code": 0, "message": "OK", "data": {"status": "PUBLISH_COMPLETE"}}
+).encode()
+# server side latency for each request.
+DELAY = 0.05
+CALLS = 64
+THREADS = 16
+
+
+class H2Server:
+    """
+    HTTP/2 server without TLS, which answers each stream after the delay,
+    and counts the accepted connections.
+    """
+
+    def __init__(self):
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.connections = 0
+        self.requests = 0
+        self._closed = False
+
+    @property
+    def url(self):
+        host, port = self.sock.getsockname()
+        return f"http://{host}:{port}/open_api"
+
+    def __enter__(self):
+        threading.Thread(target=self._serve, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._closed = True
+        self.sock.close()
+
+    def _serve(self):
+        while not self._closed:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client):
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        lock = threading.Lock()
+
+        def respond(stream_id):
+            with lock:
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(BODY))),
+                    ],
+                )
+                conn.send_data(stream_id, BODY, end_stream=True)
+                self.requests += 1
+                client.sendall(conn.data_to_send())
+
+        with lock:
+            conn.initiate_connection()
+            client.sendall(conn.data_to_send())
+        with client:
+            while True:
+                try:
+                    data = client.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with lock:
+                    events = conn.receive_data(data)
+                    client.sendall(conn.data_to_send())
+                for event in events:
+                    if isinstance(event, h2.events.StreamEnded):
+                        threading.Timer(DELAY, respond, (event.stream_id,)).start()
+
+
+class H1Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                time.sleep(DELAY)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(BODY)))
+                self.end_headers()
+                self.wfile.write(BODY)
+
+            def log_message(self, format, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/open_api"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def run_load(api):
+    def call(_):
+        start = time.perf_counter()
+        resp = api.get_publish_status(business_id="bid", publish_id="pid")
+        assert resp.data.status == "PUBLISH_COMPLETE"
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as executor:
+        latencies = sorted(executor.map(call, range(CALLS)))
+    return time.perf_counter() - start, latencies
+
+
+def test_http2_multiplexing():
+    with H2Server() as server:
+        # no TLS in the local server, so use HTTP/2 by prior knowledge.
+        transport = HttpxTransport(http1=False, http2=True)
+        api = BusinessAccountApi(
+            access_token="token",
+            base_url=server.url,
+            transport=transport,
+            # the sync HTTP/2 connection of httpcore may fail a stream under
+            # concurrent threads, retry it like a connection error.
+            retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+        )
+        elapsed, latencies = run_load(api)
+        transport.close()
+
+    assert server.requests >= CALLS
+    # all the concurrent requests share one connection, or one more after a retry.
+    assert server.connections <= 2
+    # the requests are not queued behind each other on the connection.
+    serial = CALLS * DELAY
+    assert elapsed < serial / 2
+    assert statistics.median(latencies) < DELAY * 4
+
+
+def test_http1_connections():
+    with H1Server() as server:
+        transport = RequestsTransport(pool_maxsize=THREADS)
+        api = BusinessAccountApi(
+            access_token="token", base_url=server.url, transport=transport
+        )
+        run_load(api)
+        transport.close()
+    # a connection for each concurrent request.
+    assert server.connections == THREADS
+
+
+def test_http2_option():
+    api = BusinessAccountApi(access_token="token", http2=True)
+    assert isinstance(api.transport, HttpxTransport)
+    assert isinstance(api.transport.client, httpx.Client)
+    assert api.session is None
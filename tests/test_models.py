@@ -0,0 +1,217 @@
+"""
+Tests for the model decoders
+"""
+
+import pytest
+
+import pytiktok.models as mds
+from pytiktok.codec import JsonDict
+from pytiktok.models.base import BaseModel
+from pytiktok.models.compact import compact_model, is_compact
+from pytiktok.models.decoder import get_decoder
+from pytiktok.models.lazy import is_lazy
+
+
+@pytest.mark.parametrize(
+    "model, file_path",
+    [
+        (mds.BusinessVideosResponse, "testsdata/business/video/videos_resp.json"),
+        (mds.BusinessCommentsResponse, "testsdata/business/comment/comments_resp.json"),
+        (mds.BusinessAccessToken, "testsdata/business/access_token/token_resp.json"),
+        (mds.KitVideosResponse, "testsdata/kit/video/videos_resp.json"),
+    ],
+)
+def test_fast_decoder_same_as_from_dict(model, file_path, helpers):
+    data = helpers.load_json(file_path)
+    decoder = get_decoder(model)
+    assert decoder is not None
+    assert decoder(data) == model.from_dict(data)
+    assert model.new_from_json_dict(data) == model.from_dict(data)
+
+
+def test_fast_decoder_conversions():
+    data = {
+        "item_id": 123,
+        "video_views": "12",
+        "video_duration": 1,
+        "audience_countries": [{"country": "US", "percentage": 1}, None],
+        "unknown": "ignored",
+    }
+    video = get_decoder(mds.BusinessVideo)(data)
+    assert video == mds.BusinessVideo.from_dict(data)
+    assert video.item_id == "123"
+    assert video.video_views == 12
+    assert isinstance(video.video_duration, float)
+    assert video.audience_countries[0].percentage == 1.0
+
+    # self referencing model
+    comment = mds.BusinessComment.new_from_json_dict(
+        {"comment_id": "1", "reply_list": [{"comment_id": "2", "reply_list": []}]}
+    )
+    assert comment.reply_list[0].comment_id == "2"
+    # subclass without dataclass decorator
+    resp = mds.BusinessAccessTokenRevokeResponse.new_from_json_dict({"code": 0})
+    assert isinstance(resp, mds.BusinessAccessTokenRevokeResponse)
+
+
+def test_fallback_to_from_dict():
+    # unexpected shape raises in the decoder, new_from_json_dict falls back to from_dict.
+    data = {"data": {"videos": {"item_id": "1"}}}
+    with pytest.raises(TypeError):
+        get_decoder(mds.BusinessVideosResponse)(data)
+    with pytest.raises(AttributeError):
+        mds.BusinessVideosResponse.new_from_json_dict(data)
+
+    BaseModel.use_fast_decoder = False
+    try:
+        resp = mds.KitUserResponse.new_from_json_dict({"data": {"user": {}}})
+        assert resp.data.user == mds.KitUser()
+    finally:
+        BaseModel.use_fast_decoder = True
+
+
+def test_raw_json_modes(helpers):
+    data = helpers.load_json("testsdata/business/video/videos_resp.json")
+
+    # not keep by default
+    resp = mds.BusinessVideosResponse.new_from_json_dict(data)
+    assert resp.raw_json is None
+    assert "_raw_json" not in resp.__dict__
+
+    resp = mds.BusinessVideosResponse.new_from_json_dict(data, raw_json="ref")
+    assert resp.raw_json is data
+    assert resp._json is data
+    # kept per instance, not on the class
+    other = mds.BusinessVideosResponse.new_from_json_dict({"code": 1})
+    assert other.raw_json is None
+
+    # builtin dict can not be weak referenced, not kept.
+    with pytest.warns(RuntimeWarning):
+        resp = mds.BusinessVideosResponse.new_from_json_dict(data, raw_json="weakref")
+    assert resp.raw_json is None
+
+    payload = JsonDict(data, unknown_key="value")
+    resp = mds.BusinessVideosResponse.new_from_json_dict(payload, raw_json="weakref")
+    assert resp.raw_json is payload
+    assert resp.raw_json["unknown_key"] == "value"
+    del payload
+    assert resp.raw_json is None
+
+    mds.BusinessVideosResponse.raw_json_mode = "ref"
+    try:
+        assert mds.BusinessVideosResponse.new_from_json_dict(data).raw_json is data
+        assert mds.BusinessCommentsResponse.new_from_json_dict(data).raw_json is None
+    finally:
+        del mds.BusinessVideosResponse.raw_json_mode
+
+    with pytest.raises(ValueError):
+        mds.BusinessVideosResponse.new_from_json_dict(data, raw_json="unknown")
+
+
+@pytest.mark.parametrize(
+    "model, file_path",
+    [
+        (mds.BusinessVideosResponse, "testsdata/business/video/videos_resp.json"),
+        (mds.BusinessCommentsResponse, "testsdata/business/comment/comments_resp.json"),
+        (mds.KitVideosResponse, "testsdata/kit/video/videos_resp.json"),
+    ],
+)
+def test_compact_model(model, file_path, helpers):
+    data = helpers.load_json(file_path)
+    resp = model.new_from_json_dict(data, compact=True)
+    assert is_compact(resp)
+    assert not hasattr(resp, "__dict__")
+    assert isinstance(resp, model)
+    assert type(resp) is compact_model(model)
+    assert resp == compact_model(model).from_dict(data)
+    assert resp.to_dict() == model.from_dict(data).to_dict()
+    assert not hasattr(resp.data, "__dict__")
+
+
+def test_compact_model_options():
+    data = {"comment_id": "1", "reply_list": [{"comment_id": "2"}]}
+    mds.BusinessComment.use_compact_model = True
+    try:
+        comment = mds.BusinessComment.new_from_json_dict(data, raw_json="ref")
+    finally:
+        del mds.BusinessComment.use_compact_model
+    # self referencing model
+    assert is_compact(comment.reply_list[0])
+    assert comment.raw_json is data
+    assert comment.reply_list[0].raw_json is None
+    assert not is_compact(mds.BusinessComment.new_from_json_dict(data))
+    assert compact_model(compact_model(mds.BusinessComment)) is compact_model(
+        mds.BusinessComment
+    )
+
+
+@pytest.mark.parametrize(
+    "model, file_path",
+    [
+        (mds.BusinessVideosResponse, "testsdata/business/video/videos_resp.json"),
+        (mds.BusinessCommentsResponse, "testsdata/business/comment/comments_resp.json"),
+        (mds.KitVideosResponse, "testsdata/kit/video/videos_resp.json"),
+    ],
+)
+def test_lazy_decoding(model, file_path, helpers):
+    data = helpers.load_json(file_path)
+    resp = model.new_from_json_dict(data, lazy=True)
+    assert is_lazy(resp)
+    assert isinstance(resp, model)
+    assert "data" not in resp.__dict__
+    assert resp == model.from_dict(data)
+    assert model.from_dict(data) == resp
+    assert resp.to_dict() == model.from_dict(data).to_dict()
+
+
+def test_lazy_decoding_on_access(helpers):
+    data = helpers.load_json("testsdata/business/video/videos_resp.json")
+    mds.BusinessVideosResponse.use_lazy_decoding = True
+    try:
+        resp = mds.BusinessVideosResponse.new_from_json_dict(data)
+    finally:
+        del mds.BusinessVideosResponse.use_lazy_decoding
+
+    video = resp.data.videos[0]
+    assert is_lazy(video)
+    assert video.item_id == data["data"]["videos"][0]["item_id"]
+    assert "audience_countries" not in video.__dict__
+    assert "impression_sources" not in video.__dict__
+    countries = video.audience_countries
+    assert isinstance(countries[0], mds.BusinessVideoAudienceCountry)
+    assert video.audience_countries is countries
+    # set value as normal
+    video.impression_sources = None
+    assert video.impression_sources is None
+
+    # self referencing model, and models without nested fields.
+    comment = mds.BusinessComment.new_from_json_dict(
+        {"comment_id": "1", "reply_list": [{"comment_id": "2", "reply_list": None}]},
+        lazy=True,
+    )
+    assert is_lazy(comment.reply_list[0])
+    assert comment.reply_list[0].reply_list is None
+    assert mds.BusinessComment.new_from_json_dict({}, lazy=True) is None
+    assert not is_lazy(mds.KitUser.new_from_json_dict({"open_id": "1"}, lazy=True))
+
+
+def test_lazy_decoding_fallback(monkeypatch):
+    data = {"item_id": "1", "audience_countries": [{"country": "US", "percentage": 1}]}
+    video = mds.BusinessVideo.new_from_json_dict(data, lazy=True)
+
+    def decode(value):
+        raise ValueError("not in expected shape")
+
+    # the generated decoder fails, decode by dataclasses-json at the access.
+    monkeypatch.setattr(type(video).__dict__["audience_countries"], "decode", decode)
+    assert (
+        video.audience_countries == mds.BusinessVideo.from_dict(data).audience_countries
+    )
+
+    # dataclasses-json can not decode it either, raises at the access.
+    video = mds.BusinessVideo.new_from_json_dict(
+        {"item_id": "1", "audience_countries": ["US"]}, lazy=True
+    )
+    assert video.item_id == "1"
+    with pytest.raises(AttributeError):
+        video.audience_countries
@@ -0,0 +1,98 @@
+"""
+Tests for the record and replay of the requests
+"""
+
+import pytest
+import responses
+
+from pytiktok import BusinessAccountApi, KitApi
+from pytiktok.replay import (
+    Interaction,
+    InteractionArchive,
+    ReplayMissError,
+    build_replay_session,
+    make_interaction_key,
+)
+
+STATUS_URL = "https://business-api.tiktok.com/open_api/v1.3/business/publish/status/"
+
+
+def status_body(status):
+    return {"code": 0, "message": "OK", "data": {"status": status, "post_ids": []}}
+
+
+@responses.activate
+def test_record_and_replay(tmp_path):
+    path = str(tmp_path / "tiktok.archive")
+    responses.add(responses.GET, STATUS_URL, json=status_body("PROCESSING_UPLOAD"))
+    responses.add(responses.GET, STATUS_URL, json=status_body("PUBLISH_COMPLETE"))
+
+    session = build_replay_session(path, mode="record")
+    api = BusinessAccountApi(access_token="token", session=session)
+    for _ in range(2):
+        api.get_publish_status(business_id="bid", publish_id="pid")
+    session.close()
+    assert len(responses.calls) == 2
+
+    session = build_replay_session(path)
+    # the access token is not a part of the key.
+    api = BusinessAccountApi(access_token="other", session=session)
+    statuses = [
+        api.get_publish_status(business_id="bid", publish_id="pid").data.status
+        for _ in range(3)
+    ]
+    # replayed in the recorded order, then the last one repeated.
+    assert statuses == ["PROCESSING_UPLOAD", "PUBLISH_COMPLETE", "PUBLISH_COMPLETE"]
+    assert len(responses.calls) == 2
+
+    with pytest.raises(ReplayMissError):
+        api.get_publish_status(business_id="bid", publish_id="other")
+    session.close()
+
+
+@responses.activate
+def test_replay_kit_and_latency(tmp_path, helpers):
+    path = str(tmp_path / "kit.archive")
+    data = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    responses.add(responses.POST, "https://open-api.tiktok.com/video/list/", json=data)
+
+    with build_replay_session(path, mode="record") as session:
+        KitApi(access_token="token", session=session).get_user_videos(open_id="oid")
+
+    waits = []
+    with build_replay_session(path, latency_scale=0.5) as session:
+        adapter = session.get_adapter("https://")
+        adapter.sleep = waits.append
+        api = KitApi(access_token="other", session=session)
+        resp = api.get_user_videos(open_id="oid", return_json=True)
+        assert resp == data
+        with pytest.raises(ReplayMissError):
+            api.get_user_videos(open_id="other")
+    key, _ = make_interaction_key(responses.calls[0].request)
+    with InteractionArchive(path) as archive:
+        assert waits == [pytest.approx(archive.next(key).elapsed * 0.5)]
+
+
+def test_archive_interrupted(tmp_path):
+    path = str(tmp_path / "a.archive")
+    with InteractionArchive(path, mode="a") as archive:
+        for i in range(3):
+            archive.add(
+                bytes([i]) * 16,
+                Interaction("https://x/", 200, "OK", {}, b'{"i": %d}' % i, 0.01),
+            )
+    # a partial record at the end, like the recording was killed.
+    with open(path, "ab") as f:
+        f.write(b"\x07" * 30)
+
+    with InteractionArchive(path) as archive:
+        assert len(archive) == 3
+        assert archive.next(bytes([2]) * 16).body == b'{"i": 2}'
+        assert archive.next(b"\x07" * 16) is None
+
+    # recording again drops the partial record.
+    with InteractionArchive(path, mode="a") as archive:
+        archive.add(b"\x09" * 16, Interaction("https://x/", 200, "OK", {}, b"{}", 0))
+    with InteractionArchive(path) as archive:
+        assert len(archive) == 4
+        assert archive.next(b"\x09" * 16).body == b"{}"
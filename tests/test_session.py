@@ -0,0 +1,32 @@
+"""
+Tests for the tunable http session
+"""
+
+import socket
+
+from pytiktok import BusinessAccountApi, KitApi
+from pytiktok.session import PoolAdapter, build_session, get_shared_session
+
+
+def test_build_session():
+    session = build_session(pool_maxsize=32, pool_block=True, tcp_keepalive=30)
+    adapter = session.get_adapter("https://business-api.tiktok.com")
+    assert isinstance(adapter, PoolAdapter)
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.socket_options
+
+    adapter = build_session(tcp_keepalive=None).get_adapter("https://")
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in adapter.socket_options
+
+
+def test_shared_session():
+    session = get_shared_session()
+    assert session is get_shared_session()
+
+    bus_api = BusinessAccountApi(access_token="token1", session=session)
+    kit_api = KitApi(access_token="token2", session=session)
+    assert bus_api.session is kit_api.session is session
+
+    api = BusinessAccountApi(pool_maxsize=20)
+    assert api.session.get_adapter("https://")._pool_maxsize == 20
@@ -0,0 +1,140 @@
+"""
+Tests for the transports of the api instances
+"""
+
+import httpx
+import pytest
+import requests
+
+from pytiktok import BusinessAccountApi, KitApi, PyTiktokError
+from pytiktok.async_business_account_api import _build_async_client
+from pytiktok.hooks import RequestHooks
+from pytiktok.retry import RetryPolicy
+from pytiktok.base_api import BaseApi
+from pytiktok.transport import (
+    FakeTransport,
+    HttpxTransport,
+    RequestsTransport,
+    Transport,
+)
+
+
+def test_default_transport():
+    session = requests.Session()
+    api = BusinessAccountApi(access_token="token", session=session)
+    assert isinstance(api.transport, RequestsTransport)
+    assert api.session is session
+
+
+def test_fake_transport(helpers):
+    videos = helpers.load_json("testsdata/kit/video/videos_resp.json")
+    transport = FakeTransport(
+        {
+            "business/get/": [
+                (500, {"code": 50002, "message": "busy"}),
+                {"code": 0, "data": {"username": "name"}},
+            ],
+            "video/list/": videos,
+        }
+    )
+    events = []
+    business = BusinessAccountApi(
+        access_token="token",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+        hooks=RequestHooks(after_response=events.append),
+    )
+    kit = KitApi(access_token="kit_token", transport=transport)
+
+    assert business.get_account_data(business_id="bid").data.username == "name"
+    assert [c.headers["Access-Token"] for c in transport.calls] == ["token"] * 2
+    assert transport.calls[0].params == {"business_id": "bid"}
+    assert events[0].status == 200
+
+    resp = kit.get_user_videos(open_id="open_id")
+    assert len(resp.data.videos) == len(videos["data"]["videos"])
+    call = transport.calls[-1]
+    assert call.method == "POST"
+    assert b'"access_token"' in call.data and b'"kit_token"' in call.data
+    assert "Access-Token" not in call.headers
+
+
+def test_kit_params_not_changed():
+    transport = FakeTransport(default={"data": {}, "error": {"code": 0}})
+    kit = KitApi(access_token="token", transport=transport)
+    params = {"open_id": "open_id"}
+    kit._request(path="share/video/upload/", params=params, data=b"body")
+    assert params == {"open_id": "open_id"}
+    assert transport.calls[0].params == {"open_id": "open_id", "access_token": "token"}
+
+
+def test_httpx_transport():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("down", request=request)
+        return httpx.Response(200, json={"code": 0, "data": {"username": "name"}})
+
+    transport = HttpxTransport(
+        client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    api = BusinessAccountApi(
+        access_token="token",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    # the httpx errors are retried like the errors of requests.
+    assert api.get_account_data(business_id="bid").data.username == "name"
+    assert len(calls) == 2
+    assert calls[1].headers["Access-Token"] == "token"
+    assert calls[1].url.params["business_id"] == "bid"
+
+    api = BusinessAccountApi(access_token="token", transport=transport)
+    calls.clear()
+    with pytest.raises(requests.ConnectionError):
+        api.get_account_data(business_id="bid")
+    transport.close()
+
+
+def test_httpx_proxies():
+    proxies = {"https": "http://proxy:8080"}
+    transport = HttpxTransport(proxies=proxies)
+    assert len(transport.client._mounts) == 1
+    transport.close()
+    client = _build_async_client(proxies=proxies)
+    assert len(client._mounts) == 1
+
+
+def test_session_and_proxies():
+    api = BusinessAccountApi(access_token="token", proxies={"https": "http://a:1"})
+    assert api.proxies == api.transport.proxies == {"https": "http://a:1"}
+    # changed after init, used by the next requests like before.
+    api.proxies = {"https": "http://b:2"}
+    assert api.transport.proxies == {"https": "http://b:2"}
+    session = requests.Session()
+    api.session = session
+    assert api.transport.session is session
+
+    api = BusinessAccountApi(access_token="token", transport=FakeTransport())
+    assert api.session is None and api.proxies is None
+    with pytest.raises(PyTiktokError):
+        api.session = session
+    with pytest.raises(PyTiktokError):
+        api.proxies = {"https": "http://b:2"}
+
+
+def test_abstract_methods():
+    class NoRequest(Transport):
+        pass
+
+    class NoAuthorize(BaseApi):
+        _get_error_code = staticmethod(lambda data: None)
+        _get_response_info = staticmethod(lambda data: (None, None))
+
+    # missing overrides fail when building the instance, not at the first request.
+    with pytest.raises(TypeError):
+        NoRequest()
+    with pytest.raises(TypeError):
+        NoAuthorize()